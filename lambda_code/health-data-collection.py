@@ -2,21 +2,60 @@
 
 import base64
 import csv
+import hmac
 import io
 import json
 import logging
 import os
 from datetime import UTC, datetime
+from itertools import islice
 
 import boto3
-
-# Initialize S3 client
-s3_client = boto3.client("s3")
+from botocore.config import Config
+
+try:
+    import orjson
+except ImportError:  # orjson is bundled by the deploy workflow; stdlib keeps local runs working
+    orjson = None
+
+
+def _dumps(obj: any, indent: bool = False) -> bytes:
+    """Serialize ``obj`` to JSON bytes, with orjson when available and ``str`` for unsupported types."""
+    if orjson is not None:
+        return orjson.dumps(obj, default=str, option=orjson.OPT_INDENT_2 if indent else None)
+    return json.dumps(obj, default=str, indent=2 if indent else None).encode()
+
+
+# Initialize S3 client once per container so warm invocations reuse its connection pool
+s3_client = boto3.client(
+    "s3",
+    config=Config(
+        region_name=os.environ.get("AWS_REGION"),
+        retries={"max_attempts": 2, "mode": "standard"},
+        tcp_keepalive=True,
+        max_pool_connections=10,
+    ),
+)
 bucket_name = os.environ.get("S3_BUCKET")
+storage_location = os.environ.get("STORAGE_LOCATION", "bronze")
+expected_token = os.environ.get("HEALTH_TOKEN", "").encode()
 
 # Set up logging
 logger = logging.getLogger()
-logger.setLevel(logging.INFO)
+logger.setLevel(os.environ.get("LOG_LEVEL", "INFO"))
+
+# Open the TLS connection during the cold start rather than on the first request
+if bucket_name:
+    try:
+        s3_client.head_bucket(Bucket=bucket_name)
+    except Exception:  # noqa: BLE001
+        logger.warning(f"Could not pre-warm S3 connection to {bucket_name}")
+
+
+def _log_debug_json(message: str, obj: any) -> None:
+    """Log a pretty-printed JSON dump of ``obj``, serialized only when DEBUG logging is enabled."""
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug(f"{message}\n{_dumps(obj, indent=True).decode()}")
 
 
 def _authenticate_request(headers: dict[str, str]) -> dict[str, any] | None:
@@ -51,42 +90,40 @@ def _authenticate_request(headers: dict[str, str]) -> dict[str, any] | None:
             "headers": {
                 "Content-Type": "application/json",
             },
-            "body": json.dumps({
+            "body": _dumps({
                 "error": "Missing Authorization header",
                 "expected": "Authorization: Bearer <token>",
-            }),
+            }).decode(),
         }
 
-    # Extract the token
-    token = auth_header.split(" ")[1] if len(auth_header.split(" ")) > 1 else ""
-
-    # Validate token
-    expected_token = os.getenv("HEALTH_TOKEN")
+    # Extract the token (the "Bearer " prefix was checked above)
+    token = auth_header[7:].encode()
 
-    if token != expected_token:
+    # Validate token in constant time; an unset token rejects every request
+    if not expected_token or not hmac.compare_digest(token, expected_token):
         logger.warning("Invalid token received")
         return {
             "statusCode": 403,
             "headers": {
                 "Content-Type": "application/json",
             },
-            "body": json.dumps({
+            "body": _dumps({
                 "error": "Invalid token",
-            }),
+            }).decode(),
         }
 
     logger.info("✅ Authentication successful")
     return None
 
 
-def _log_csv_data(csv_content: str, data_type: str) -> tuple[list[str], int]:
+def _log_csv_data(csv_content: bytes, data_type: str) -> tuple[list[str], int]:
     """
     Log CSV data summary.
 
     Parameters
     ----------
-    csv_content : str
-        CSV content as string.
+    csv_content : bytes
+        UTF-8 encoded CSV content.
     data_type : str
         Type of data (health, workout, etc.).
 
@@ -94,29 +131,38 @@ def _log_csv_data(csv_content: str, data_type: str) -> tuple[list[str], int]:
     -------
     tuple[list[str], int]
         Tuple of (column_names, row_count).
+
+    Raises
+    ------
+    UnicodeDecodeError
+        If the content is not valid UTF-8. Every row is streamed through the decoder,
+        so this validates the whole payload without a decoded copy.
     """
     try:
-        csv_reader = csv.reader(io.StringIO(csv_content))
-        rows = list(csv_reader)
+        csv_reader = csv.reader(io.TextIOWrapper(io.BytesIO(csv_content), encoding="utf-8", newline=""))
+        # Only the preamble and header rows are kept; data rows are counted while streaming
+        leading_rows = list(islice(csv_reader, 5))
 
-        if not rows:
+        if not leading_rows:
             logger.warning("📊 Empty CSV data received")
             return [], 0
 
         # Headers start from the 4th row (index 3)
-        if len(rows) < 5:
+        if len(leading_rows) < 5:
             logger.warning("📊 CSV has fewer than 4 rows - no headers found")
             return [], 0
 
-        headers = rows[4]  # 4th row contains headers
-        data_rows = rows[5:]  # Data starts from 5th row
+        headers = leading_rows[4]  # 4th row contains headers
+        row_count = sum(1 for _ in csv_reader)  # Data starts from 5th row
 
         logger.info(f"📊 {data_type.title()} CSV Data received:")
         logger.info(f"  📋 Columns ({len(headers)}): {', '.join(headers)}")
-        logger.info(f"  📈 Data rows: {len(data_rows)}")
+        logger.info(f"  📈 Data rows: {row_count}")
 
-        return headers, len(data_rows)
+        return headers, row_count
 
+    except UnicodeDecodeError:
+        raise
     except Exception:
         logger.exception("❌ Failed to parse CSV")
         return [], 0
@@ -157,9 +203,9 @@ def lambda_handler(event: dict[str, any], context: any) -> dict[str, any]:
         When S3 operations fail due to permissions or connectivity issues.
     """
     try:
-        # Log the entire incoming event for debugging
-        logger.info("Received data collection event:")
-        logger.info(json.dumps(event, indent=2, default=str))
+        # Log a summary of the incoming event; the full dump is only produced at DEBUG level
+        logger.info(f"Received data collection event ({len(event.get('body') or '')} body bytes)")
+        _log_debug_json("Received data collection event:", event)
 
         # Extract headers and authenticate
         headers = event.get("headers", {})
@@ -179,37 +225,48 @@ def lambda_handler(event: dict[str, any], context: any) -> dict[str, any]:
         # Decode base64 encoded body (always expected for CSV)
         logger.info("📦 Decoding base64 encoded CSV body")
         try:
-            csv_content = base64.b64decode(body).decode("utf-8")
+            # Kept as bytes: S3 stores them as-is and only _log_csv_data needs text
+            csv_content = base64.b64decode(body)
         except Exception:
             logger.exception("❌ Failed to decode base64 body")
             return {
                 "statusCode": 400,
                 "headers": {"Content-Type": "application/json"},
-                "body": json.dumps({"error": "Failed to decode base64 body"}),
+                "body": _dumps({"error": "Failed to decode base64 body"}).decode(),
             }
 
-        # Log CSV data summary
-        columns, row_count = _log_csv_data(csv_content, data_type)
+        # Log CSV data summary; this also rejects payloads that are not UTF-8 before they reach S3
+        try:
+            columns, row_count = _log_csv_data(csv_content, data_type)
+        except UnicodeDecodeError:
+            logger.exception("❌ CSV body is not valid UTF-8")
+            return {
+                "statusCode": 400,
+                "headers": {"Content-Type": "application/json"},
+                "body": _dumps({"error": "Body is not valid UTF-8 CSV"}).decode(),
+            }
 
         # Store to S3
+        # One clock read per request; the key parts are built from its fields rather than strftime
         timestamp = datetime.now(UTC)
-        file_name = f"{timestamp.strftime('%H%M%S')}-{context.aws_request_id}.csv"
-        base_storage_location = os.getenv("STORAGE_LOCATION", "bronze")
-        date_directory = f"{timestamp.strftime('%Y_%m_%d')}"
+        timestamp_iso = timestamp.isoformat()
+        file_name = f"{timestamp.hour:02d}{timestamp.minute:02d}{timestamp.second:02d}-{context.aws_request_id}.csv"
+        date_directory = f"{timestamp.year:04d}_{timestamp.month:02d}_{timestamp.day:02d}"
 
-        file_key = f"{base_storage_location}/{data_type}/{date_directory}/{file_name}"
+        file_key = f"{storage_location}/{data_type}/{date_directory}/{file_name}"
 
         s3_client.put_object(
             Bucket=bucket_name,
             Key=file_key,
             Body=csv_content,
             ContentType="text/csv",
+            ChecksumAlgorithm="CRC32",
             Metadata={
                 "source": f"{data_type}-app",
                 "data_type": data_type,
                 "columns": str(len(columns)),
                 "rows": str(row_count),
-                "timestamp": timestamp.isoformat(),
+                "timestamp": timestamp_iso,
             },
         )
 
@@ -221,13 +278,13 @@ def lambda_handler(event: dict[str, any], context: any) -> dict[str, any]:
             "headers": {
                 "Content-Type": "application/json",
             },
-            "body": json.dumps({
+            "body": _dumps({
                 "result": "ok",
                 "data_type": data_type,
                 "columns_processed": len(columns),
                 "rows_processed": row_count,
-                "timestamp": datetime.now(UTC).isoformat(),
-            }),
+                "timestamp": timestamp_iso,
+            }).decode(),
         }
 
     except Exception:
@@ -237,5 +294,5 @@ def lambda_handler(event: dict[str, any], context: any) -> dict[str, any]:
             "headers": {
                 "Content-Type": "application/json",
             },
-            "body": json.dumps({"error": "Internal server error"}),
+            "body": _dumps({"error": "Internal server error"}).decode(),
         }
@@ -1,19 +1,60 @@
 """Lambda code for collecting and saving location data to S3."""
 
+import hmac
 import json
 import logging
 import os
 from datetime import UTC, datetime
 
 import boto3
+from botocore.config import Config
 
-# Initialize S3 client
-s3_client = boto3.client("s3")
+try:
+    import orjson
+except ImportError:  # orjson is bundled by the deploy workflow; stdlib keeps local runs working
+    orjson = None
+
+
+def _dumps(obj: any, indent: bool = False) -> bytes:
+    """Serialize ``obj`` to JSON bytes, with orjson when available and ``str`` for unsupported types."""
+    if orjson is not None:
+        return orjson.dumps(obj, default=str, option=orjson.OPT_INDENT_2 if indent else None)
+    return json.dumps(obj, default=str, indent=2 if indent else None).encode()
+
+
+_loads = orjson.loads if orjson is not None else json.loads
+
+
+# Initialize S3 client once per container so warm invocations reuse its connection pool
+s3_client = boto3.client(
+    "s3",
+    config=Config(
+        region_name=os.environ.get("AWS_REGION"),
+        retries={"max_attempts": 2, "mode": "standard"},
+        tcp_keepalive=True,
+        max_pool_connections=10,
+    ),
+)
 bucket_name = os.environ.get("S3_BUCKET")
+storage_location = os.environ.get("STORAGE_LOCATION")
+expected_token = os.environ.get("OVERLAND_TOKEN", "").encode()
 
 # Set up logging
 logger = logging.getLogger()
-logger.setLevel(logging.INFO)
+logger.setLevel(os.environ.get("LOG_LEVEL", "INFO"))
+
+# Open the TLS connection during the cold start rather than on the first request
+if bucket_name:
+    try:
+        s3_client.head_bucket(Bucket=bucket_name)
+    except Exception:  # noqa: BLE001
+        logger.warning(f"Could not pre-warm S3 connection to {bucket_name}")
+
+
+def _log_debug_json(message: str, obj: any) -> None:
+    """Log a pretty-printed JSON dump of ``obj``, serialized only when DEBUG logging is enabled."""
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug(f"{message}\n{_dumps(obj, indent=True).decode()}")
 
 
 def _authenticate_request(headers: dict[str, str]) -> dict[str, any] | None:
@@ -48,28 +89,26 @@ def _authenticate_request(headers: dict[str, str]) -> dict[str, any] | None:
             "headers": {
                 "Content-Type": "application/json",
             },
-            "body": json.dumps({
+            "body": _dumps({
                 "error": "Missing Authorization header",
                 "expected": "Authorization: Bearer <token>",
-            }),
+            }).decode(),
         }
 
-    # Extract the token
-    token = auth_header.split(" ")[1] if len(auth_header.split(" ")) > 1 else ""
+    # Extract the token (the "Bearer " prefix was checked above)
+    token = auth_header[7:].encode()
 
-    # Validate token
-    expected_token = os.getenv("OVERLAND_TOKEN")
-
-    if token != expected_token:
+    # Validate token in constant time; an unset token rejects every request
+    if not expected_token or not hmac.compare_digest(token, expected_token):
         logger.warning("Invalid token received")
         return {
             "statusCode": 401,
             "headers": {
                 "Content-Type": "application/json",
             },
-            "body": json.dumps({
+            "body": _dumps({
                 "error": "Invalid token",
-            }),
+            }).decode(),
         }
 
     logger.info("✅ Authentication successful")
@@ -111,9 +150,9 @@ def lambda_handler(event: dict[str, any], context: any) -> dict[str, any]:
         When S3 operations fail due to permissions or connectivity issues.
     """
     try:
-        # Log the entire incoming event for debugging
-        logger.info("Received event:")
-        logger.info(json.dumps(event, indent=2, default=str))
+        # Log a summary of the incoming event; the full dump is only produced at DEBUG level
+        logger.info(f"Received event ({len(event.get('body') or '')} body bytes)")
+        _log_debug_json("Received event:", event)
 
         # Extract headers and authenticate
         headers = event.get("headers", {})
@@ -121,25 +160,22 @@ def lambda_handler(event: dict[str, any], context: any) -> dict[str, any]:
         if auth_error:
             return auth_error
 
-        # Parse the GPS data
+        # Parse the GPS data. The raw body is kept so it can be stored without re-serializing it.
         body = event.get("body", "{}")
-        gps_data: dict[str, any] = json.loads(body) if isinstance(body, str) else body
+        if isinstance(body, str):
+            raw_body = body.encode()
+            gps_data: dict[str, any] = _loads(raw_body)
+        else:
+            gps_data = body
+            raw_body = _dumps(gps_data)
 
-        logger.info("📍 GPS Data received:")
-        logger.info(json.dumps(gps_data, indent=2, default=str))
+        _log_debug_json("📍 GPS Data received:", gps_data)
 
         # Extract and log location details
         locations: list[dict[str, any]] = gps_data.get("locations", [])
-        logger.info(f"Number of locations in batch: {len(locations)}")
-
-        for location in locations:
-            if location.get("geometry") and location.get("properties"):
-                coords: list[float] = location["geometry"].get("coordinates", [])
-
-                logger.info("Location information found.")
-                logger.info(
-                    f"  📍 Lat/Lng: {coords[1] if len(coords) > 1 else 'N/A'}, {coords[0] if len(coords) > 0 else 'N/A'}"
-                )
+        # Count points instead of logging each one; batches can hold thousands of points
+        valid_locations = sum("geometry" in location and "properties" in location for location in locations)
+        logger.info(f"Number of locations in batch: {len(locations)} ({valid_locations} with geometry and properties)")
 
         # Log trip info if present
         if "trip" in gps_data:
@@ -151,39 +187,38 @@ def lambda_handler(event: dict[str, any], context: any) -> dict[str, any]:
 
         # Store to S3
         # Build target location
+        # One clock read per request; the key parts are built from its fields rather than strftime
         timestamp = datetime.now(UTC)
+        timestamp_iso = timestamp.isoformat()
 
-        file_name = f"{timestamp.strftime('%H%M%S')}-{context.aws_request_id}.json"
-        storage_location = os.getenv("STORAGE_LOCATION")
-        date_directory = f"{timestamp.strftime('%Y_%m_%d')}"
+        file_name = f"{timestamp.hour:02d}{timestamp.minute:02d}{timestamp.second:02d}-{context.aws_request_id}.json"
+        date_directory = f"{timestamp.year:04d}_{timestamp.month:02d}_{timestamp.day:02d}"
 
         file_key = f"{storage_location}/{date_directory}/{file_name}"
 
         s3_client.put_object(
             Bucket=bucket_name,
             Key=file_key,
-            Body=json.dumps(gps_data, indent=2),
+            Body=raw_body,
             ContentType="application/json",
+            ChecksumAlgorithm="CRC32",
             Metadata={
                 "source": "overland-app",
                 "locations_count": str(len(locations)),
-                "timestamp": timestamp.isoformat(),
+                "timestamp": timestamp_iso,
             },
         )
 
         logger.info(f"✅ Stored {len(locations)} locations to s3://{bucket_name}/{file_key}")
 
-        # Return the response Overland expects
+        # Return the response Overland expects. Its shape is fixed and holds no user input, so it is
+        # formatted directly instead of going through the JSON encoder.
         return {
             "statusCode": 200,
             "headers": {
                 "Content-Type": "application/json",
             },
-            "body": json.dumps({
-                "result": "ok",
-                "locations_processed": len(locations),
-                "timestamp": datetime.now(UTC).isoformat(),
-            }),
+            "body": f'{{"result":"ok","locations_processed":{len(locations)},"timestamp":"{timestamp_iso}"}}',
         }
 
     except json.JSONDecodeError as e:
@@ -193,7 +228,7 @@ def lambda_handler(event: dict[str, any], context: any) -> dict[str, any]:
             "headers": {
                 "Content-Type": "application/json",
             },
-            "body": json.dumps({"error": "Invalid JSON in request body", "details": str(e)}),
+            "body": _dumps({"error": "Invalid JSON in request body", "details": str(e)}).decode(),
         }
 
     except Exception as e:
@@ -203,5 +238,5 @@ def lambda_handler(event: dict[str, any], context: any) -> dict[str, any]:
             "headers": {
                 "Content-Type": "application/json",
             },
-            "body": json.dumps({"error": "Internal server error", "details": str(e)}),
+            "body": _dumps({"error": "Internal server error", "details": str(e)}).decode(),
         }
@@ -1,17 +1,43 @@
 """Script for sending macbook screentime data to Amazon S3."""
 
+import gzip
 import json
 import logging
 import os
-import shutil
 import sqlite3
-import tempfile
 import uuid
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from contextlib import closing
 from datetime import UTC, datetime, timedelta
 from pathlib import Path
 from typing import Any
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+try:
+    import orjson
+
+    _dumps = orjson.dumps
+except ImportError:
+
+    def _dumps(obj: Any) -> bytes:
+        """
+        Serialize an object to JSON bytes with the stdlib encoder.
+
+        Parameters
+        ----------
+        obj : Any
+            Object to serialize.
+
+        Returns
+        -------
+        bytes
+            UTF-8 encoded JSON document.
+        """
+        return json.dumps(obj).encode()
+
 
 # --- Configuration ---
 LAMBDA_URL = os.getenv("SCREENTIME_LAMBDA_ENDPOINT")
@@ -19,6 +45,7 @@ AUTH_TOKEN = os.getenv("AUTH_TOKEN")
 STATE_FILE = Path("~/screen_time_job/.screen_time_state.json").expanduser()
 DB_PATH = Path("~/Library/Application Support/Knowledge/knowledgeC.db").expanduser()
 DEVICE_NAME = "Doug's MacBook Pro"
+MAX_UPLOAD_WORKERS = 8
 
 # --- Partitioned Logging Setup ---
 SCRIPT_DIR = Path(__file__).parent
@@ -34,6 +61,26 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# --- HTTP Session ---
+# One keep-alive session for the whole backfill so every date reuses the same TLS connection
+SESSION = requests.Session()
+SESSION.headers.update({
+    "Authorization": f"Bearer {AUTH_TOKEN}",
+    # A binary content type makes the endpoint forward the compressed body base64 encoded instead of as text
+    "Content-Type": "application/gzip",
+    "Content-Encoding": "gzip",
+})
+SESSION.mount(
+    "https://",
+    HTTPAdapter(
+        pool_connections=4,
+        pool_maxsize=10,
+        # The upload POST is not idempotent, so only connection failures (the request never reached the Lambda)
+        # are retried here. Dates whose upload fails stay out of the state manifest and are resent next run.
+        max_retries=Retry(total=3, connect=3, read=0, status=0, backoff_factor=0.5),
+    ),
+)
+
 
 def get_hardware_uuid() -> str:
     """
@@ -44,8 +91,11 @@ def get_hardware_uuid() -> str:
     str
         The hardware UUID formatted as a colon-separated string.
     """
-    node = uuid.getnode()
-    return "-".join(f"{(node >> i) & 0xFF:02X}" for i in range(0, 48, 8)[::-1])
+    return uuid.getnode().to_bytes(6, "big").hex("-").upper()
+
+
+# The hardware ID cannot change during a run, so resolve it once instead of per upload
+HARDWARE_UUID = get_hardware_uuid()
 
 
 def get_processed_dates() -> set[str]:
@@ -66,44 +116,50 @@ def get_processed_dates() -> set[str]:
     return set()
 
 
-def save_processed_date(date_str: str) -> None:
+def save_processed_dates(processed: set[str]) -> None:
     """
-    Log a successful transmission to the local state file.
+    Persist the set of successfully transmitted dates to the local state file.
+
+    The manifest is written to a sibling temp file and swapped in with
+    ``Path.replace`` so an interrupted run never leaves a truncated state file.
 
     Parameters
     ----------
-    date_str : str
-        The ISO format date string to mark as processed.
+    processed : set[str]
+        All ISO format date strings processed so far.
     """
-    processed = list(get_processed_dates())
-    if date_str not in processed:
-        processed.append(date_str)
-        with STATE_FILE.open("w", encoding="utf-8") as f:
-            json.dump({"processed_dates": sorted(processed)}, f)
+    tmp_path = STATE_FILE.with_suffix(".tmp")
+    with tmp_path.open("w", encoding="utf-8") as f:
+        json.dump({"processed_dates": sorted(processed)}, f)
+    tmp_path.replace(STATE_FILE)
 
 
-def query_database_for_date(target_date_str: str) -> list[dict[str, Any]] | None:
+def query_database_for_dates(target_dates: list[str]) -> dict[str, list[dict[str, Any]]] | None:
     """
-    Query the forensics database for a specific local calendar day.
+    Query the forensics database for several local calendar days in a single scan.
 
     Parameters
     ----------
-    target_date_str : str
-        The target date in 'YYYY-MM-DD' format.
+    target_dates : list[str]
+        The target dates in 'YYYY-MM-DD' format.
 
     Returns
     -------
-    list[dict[str, Any]] | None
-        A list of dictionaries containing usage data, or None if an error occurs.
+    dict[str, list[dict[str, Any]]] | None
+        Usage records keyed by date. Dates without usage map to an empty list.
+        None if an error occurs.
     """
-    temp_dir = tempfile.gettempdir()
-    temp_db_path = Path(temp_dir) / "knowledgeC_temp.db"
+    placeholders = ", ".join("?" * len(target_dates))
+    # Read-only + immutable lets SQLite skip locking, so the live database is read without copying it first
+    db_uri = f"{DB_PATH.as_uri()}?mode=ro&immutable=1"
 
     try:
-        shutil.copy2(DB_PATH, temp_db_path)
-        with sqlite3.connect(temp_db_path) as con:
+        with closing(sqlite3.connect(db_uri, uri=True)) as con:
             cur = con.cursor()
-            query = """
+            # Memory-map the database and give SQLite a 64 MiB page cache for the single large scan
+            cur.execute("PRAGMA mmap_size = 268435456")
+            cur.execute("PRAGMA cache_size = -65536")
+            query = f"""
             SELECT
                 ZVALUESTRING AS "bundle_id",
                 COALESCE(ZSYNCPEER.ZMODEL, 'Mac') AS "device_model",
@@ -116,19 +172,21 @@ def query_database_for_date(target_date_str: str) -> list[dict[str, Any]] | None
             LEFT JOIN ZSYNCPEER ON ZSOURCE.ZDEVICEID = ZSYNCPEER.ZDEVICEID
             WHERE
                 ZSTREAMNAME = "/app/usage"
-                AND usage_date_local = ?
+                AND usage_date_local IN ({placeholders})
             GROUP BY 1, 2, 3
             HAVING total_usage_seconds > 0;
-            """
-            cur.execute(query, (target_date_str,))
+            """  # noqa: S608
+            cur.execute(query, target_dates)
             columns = [column[0] for column in cur.description]
-            return [dict(zip(columns, row, strict=False)) for row in cur.fetchall()]
+
+            usage_by_date: dict[str, list[dict[str, Any]]] = {target_date: [] for target_date in target_dates}
+            for row in cur.fetchall():
+                record = dict(zip(columns, row, strict=False))
+                usage_by_date[record["usage_date_local"]].append(record)
+            return usage_by_date
     except (sqlite3.Error, OSError):
-        logger.exception("❌ SQL Error for %s", target_date_str)
+        logger.exception("❌ SQL Error for %s - %s", min(target_dates), max(target_dates))
         return None
-    finally:
-        if temp_db_path.exists():
-            temp_db_path.unlink()
 
 
 def send_to_lambda(usage_data: list[dict[str, Any]], target_date_str: str) -> bool:
@@ -150,16 +208,17 @@ def send_to_lambda(usage_data: list[dict[str, Any]], target_date_str: str) -> bo
     payload = {
         "device_type": "mac",
         "device_name": DEVICE_NAME,
-        "device_id": get_hardware_uuid(),
+        "device_id": HARDWARE_UUID,
         "updated_at": datetime.now(UTC).isoformat(),
         "usage_date": target_date_str,
         "data": usage_data,
     }
 
-    headers = {"Authorization": f"Bearer {AUTH_TOKEN}", "Content-Type": "application/json"}
+    # Day-level usage records are highly repetitive, so a fast gzip level shrinks the upload considerably
+    body = gzip.compress(_dumps(payload), compresslevel=3)
 
     try:
-        response = requests.post(LAMBDA_URL, json=payload, headers=headers, timeout=30)
+        response = SESSION.post(LAMBDA_URL, data=body, timeout=30)
         logger.info("📡 Lambda Response (%s) [%s]: %s", target_date_str, response.status_code, response.text)
         response.raise_for_status()
         return True
@@ -182,18 +241,29 @@ def main() -> None:
         logger.info("✅ All dates within the 30-day window are already processed.")
         return
 
-    for target_date in sorted(missing_dates):
-        logger.info("🔄 Processing: %s", target_date)
-        data = query_database_for_date(target_date)
-
-        if data is not None:
-            if data:
-                if send_to_lambda(data, target_date):
-                    save_processed_date(target_date)
-                    logger.info("   Successfully pushed %s records for %s.", len(data), target_date)
-            else:
-                logger.info("   No usage found for %s. Marking as processed.", target_date)
-                save_processed_date(target_date)
+    usage_by_date = query_database_for_dates(missing_dates)
+    if usage_by_date is None:
+        return
+
+    empty_dates = sorted(d for d, data in usage_by_date.items() if not data)
+    if empty_dates:
+        logger.info("   No usage found for %s. Marking as processed.", ", ".join(empty_dates))
+        processed.update(empty_dates)
+        save_processed_dates(processed)
+
+    # Uploads are network-bound, so overlap them; state is only touched from this thread
+    with ThreadPoolExecutor(max_workers=MAX_UPLOAD_WORKERS) as executor:
+        futures = {
+            executor.submit(send_to_lambda, data, target_date): target_date
+            for target_date, data in sorted(usage_by_date.items())
+            if data
+        }
+        for future in as_completed(futures):
+            target_date = futures[future]
+            if future.result():
+                processed.add(target_date)
+                save_processed_dates(processed)
+                logger.info("   Successfully pushed %s records for %s.", len(usage_by_date[target_date]), target_date)
 
 
 if __name__ == "__main__":
@@ -1,50 +1,114 @@
 """Lambda code for collecting and saving screen time data to S3."""
 
+import base64
+import gzip
+import hmac
 import json
 import logging
 import os
-from datetime import UTC, datetime
-
-import boto3
-
-# Initialize S3 client
-s3_client = boto3.client("s3")
+from datetime import UTC, date, datetime
+
+import botocore.session
+from botocore.config import Config
+
+try:
+    import orjson
+except ImportError:  # orjson is bundled by the deploy workflow; stdlib keeps local runs working
+    orjson = None
+
+
+def _dumps(obj: any, indent: bool = False) -> bytes:
+    """Serialize ``obj`` to JSON bytes, with orjson when available and ``str`` for unsupported types."""
+    if orjson is not None:
+        return orjson.dumps(obj, default=str, option=orjson.OPT_INDENT_2 if indent else None)
+    return json.dumps(obj, default=str, indent=2 if indent else None).encode()
+
+
+_loads = orjson.loads if orjson is not None else json.loads
+
+# Initialize S3 client once per container so warm invocations reuse its connection pool.
+# Each request issues a single small PUT, so short timeouts let a stuck connection retry quickly.
+# Only put_object is needed, so the client comes straight from botocore and boto3 is never imported.
+s3_client = botocore.session.get_session().create_client(
+    "s3",
+    config=Config(
+        region_name=os.environ.get("AWS_REGION"),
+        retries={"max_attempts": 2, "mode": "standard"},
+        tcp_keepalive=True,
+        max_pool_connections=50,
+        connect_timeout=1.0,
+        read_timeout=3.0,
+    ),
+)
 bucket_name = os.environ.get("S3_BUCKET")
+storage_location = os.environ.get("STORAGE_LOCATION", "screen_time")
+expected_token = os.environ.get("AUTH_TOKEN", "").encode()  # Matches AUTH_TOKEN in your Mac script
 
 # Set up logging
 logger = logging.getLogger()
 logger.setLevel(logging.INFO)
 
+# Response headers and the authentication failures never change, so build them once
+JSON_HEADERS = {"Content-Type": "application/json"}
+MISSING_AUTH_RESPONSE = {
+    "statusCode": 401,
+    "headers": JSON_HEADERS,
+    "body": _dumps({"error": "Missing Authorization header"}).decode(),
+}
+INVALID_TOKEN_RESPONSE = {
+    "statusCode": 401,
+    "headers": JSON_HEADERS,
+    "body": _dumps({"error": "Invalid token"}).decode(),
+}
+WARMER_RESPONSE = {"statusCode": 204}
+
+
+def _is_warmer_event(event: dict[str, any], headers: dict[str, str]) -> bool:
+    """
+    Check whether the invocation only exists to keep the container warm.
+
+    Warmers are either an EventBridge schedule invoking the function directly, or a
+    scheduled HTTP call through API Gateway carrying an ``X-Warmer`` header.
+
+    Parameters
+    ----------
+    event : dict[str, any]
+        Lambda event.
+    headers : dict[str, str]
+        HTTP headers from the incoming request, with lowercase names.
+
+    Returns
+    -------
+    bool
+        True if the invocation should return without doing any work.
+    """
+    return event.get("source") == "aws.events" or "x-warmer" in headers
+
 
 def _authenticate_request(headers: dict[str, str]) -> dict[str, any] | None:
     """
     Authenticate the incoming request using Bearer token.
 
+    Parameters
+    ----------
+    headers : dict[str, str]
+        HTTP headers from the incoming request, with lowercase names.
+
     Returns
     -------
     dict[str, any] | None
         Error response if authentication fails, None otherwise.
     """
-    auth_header = headers.get("authorization") or headers.get("Authorization", "")
+    auth_header = headers.get("authorization", "")
+    scheme, _, token = auth_header.partition(" ")
 
-    if not auth_header.startswith("Bearer "):
+    if scheme != "Bearer":
         logger.warning("Missing or invalid Authorization header")
-        return {
-            "statusCode": 401,
-            "headers": {"Content-Type": "application/json"},
-            "body": json.dumps({"error": "Missing Authorization header"}),
-        }
-
-    token = auth_header.split(" ")[1] if len(auth_header.split(" ")) > 1 else ""
-    expected_token = os.getenv("AUTH_TOKEN")  # Matches AUTH_TOKEN in your Mac script
+        return MISSING_AUTH_RESPONSE
 
-    if token != expected_token:
+    if not expected_token or not hmac.compare_digest(token.encode(), expected_token):
         logger.warning("Invalid token received")
-        return {
-            "statusCode": 401,
-            "headers": {"Content-Type": "application/json"},
-            "body": json.dumps({"error": "Invalid token"}),
-        }
+        return INVALID_TOKEN_RESPONSE
 
     logger.info("✅ Authentication successful")
     return None
@@ -87,6 +151,53 @@ def _handle_iphone_data(raw_data: dict[str, any]) -> dict[str, any]:
     }
 
 
+def _decode_body(event: dict[str, any], headers: dict[str, str]) -> str | bytes | dict[str, any]:
+    """
+    Return the request body, undoing base64 and gzip transfer encodings.
+
+    The Mac scraper gzips its payload and sends it as ``application/gzip``, which the endpoint
+    forwards base64 encoded (see ``docs/data/collection-screen-time-data.md``). A gzip body that
+    still arrives as text is either plain JSON that was already decompressed upstream, or base64
+    without the ``isBase64Encoded`` flag.
+
+    Parameters
+    ----------
+    event : dict[str, any]
+        API Gateway event.
+    headers : dict[str, str]
+        HTTP headers from the incoming request, with lowercase names.
+
+    Returns
+    -------
+    str | bytes | dict[str, any]
+        The decoded JSON document, or the already-parsed body.
+
+    Raises
+    ------
+    ValueError
+        If a gzip body arrived as text that is neither JSON nor base64, i.e. the endpoint
+        decoded the compressed bytes as text because the binary media type is not configured.
+    """
+    body = event.get("body", "{}")
+    if event.get("isBase64Encoded") and isinstance(body, str):
+        body = base64.b64decode(body)
+
+    if headers.get("content-encoding", "").lower() != "gzip":
+        return body
+
+    if isinstance(body, str):
+        if body.lstrip().startswith("{"):
+            return body
+        try:
+            body = base64.b64decode(body, validate=True)
+        except ValueError as e:
+            raise ValueError(
+                "gzip body was forwarded as text; add application/gzip to the API's binary media types"
+            ) from e
+
+    return gzip.decompress(body)
+
+
 def lambda_handler(event: dict[str, any], context: any) -> dict[str, any]:
     """
     Handle screen time ingestion.
@@ -97,37 +208,56 @@ def lambda_handler(event: dict[str, any], context: any) -> dict[str, any]:
         API Gateway response.
     """
     try:
+        # REST API Gateway keeps the client's header casing (HTTP APIs lowercase it) and sends None
+        # when there are no headers, so normalize once instead of trying both spellings per lookup
+        headers = {name.lower(): value for name, value in (event.get("headers") or {}).items()}
+
+        # 0. Warmer pings return before any auth, parsing or S3 work
+        if _is_warmer_event(event, headers):
+            return WARMER_RESPONSE
+
         # 1. Authenticate
-        headers = event.get("headers", {})
         auth_error = _authenticate_request(headers)
         if auth_error:
             return auth_error
 
         # 2. Parse Body
-        body = event.get("body", "{}")
-        raw_data = json.loads(body) if isinstance(body, str) else body
+        body = _decode_body(event, headers)
+        raw_data = _loads(body) if isinstance(body, str | bytes) else body
+        # Drop the decoded request body now that it is parsed, so a large Mac payload is not held in
+        # memory twice while the stored copy is serialized below
+        del body
 
         device_type = raw_data.get("device_type", "iphone").lower()
-        # Use the usage_date from the scraper if provided, otherwise today
-        usage_date_str = raw_data.get("usage_date", datetime.now(UTC).strftime("%Y-%m-%d"))
-        usage_date = datetime.strptime(usage_date_str, "%Y-%m-%d").replace(tzinfo=UTC)
+        # Use the usage_date from the scraper if provided, otherwise today.
+        # date.fromisoformat validates it without the cost of strptime.
+        now = datetime.now(UTC)
+        usage_date_str = raw_data.get("usage_date", now.date().isoformat())
+        usage_date = date.fromisoformat(usage_date_str)
 
         # 3. Route to Helpers
         meta = _handle_mac_data(raw_data) if device_type == "mac" else _handle_iphone_data(raw_data)
 
         # 4. Partitioned S3 Storage
         # S3 Key Structure: screen_time/YYYY/MM/DD/device_type-request_id.json
-        storage_location = os.getenv("STORAGE_LOCATION", "screen_time")
-        date_partition = usage_date.strftime("%Y_%m_%d")
+        date_partition = f"{usage_date.year:04d}_{usage_date.month:02d}_{usage_date.day:02d}"
         file_name = f"{device_type}-{context.aws_request_id}.json"
 
         file_key = f"{storage_location}/{device_type}/{date_partition}/{file_name}"
 
+        # raw_data is local to this request, so stamp it in place rather than copying the whole payload
+        raw_data["processed_at"] = now.isoformat()
+
+        # The PUT stays on the request path on purpose: Lambda freezes the container as soon as the
+        # handler returns, so an upload left running in a background thread could be lost while the
+        # scraper has already been told the date was stored and will never resend it.
         s3_client.put_object(
             Bucket=bucket_name,
             Key=file_key,
-            Body=json.dumps({**raw_data, "processed_at": datetime.now(UTC).isoformat()}, indent=2),
+            # Stored compact; the bronze readers parse it, nobody reads it by eye
+            Body=_dumps(raw_data),
             ContentType="application/json",
+            ChecksumAlgorithm="CRC32",
             Metadata={
                 "device_id": str(raw_data.get("device_id")),
                 "total_seconds": str(meta["total_seconds"]),
@@ -139,19 +269,19 @@ def lambda_handler(event: dict[str, any], context: any) -> dict[str, any]:
 
         return {
             "statusCode": 200,
-            "headers": {"Content-Type": "application/json"},
-            "body": json.dumps({
+            "headers": JSON_HEADERS,
+            "body": _dumps({
                 "result": "ok",
                 "device": device_type,
                 "date": usage_date_str,
                 "total_seconds": meta["total_seconds"],
-            }),
+            }).decode(),
         }
 
     except Exception as e:
         logger.exception("❌ Processing Error")
         return {
             "statusCode": 500,
-            "headers": {"Content-Type": "application/json"},
-            "body": json.dumps({"error": str(e)}),
+            "headers": JSON_HEADERS,
+            "body": _dumps({"error": str(e)}).decode(),
         }
@@ -1,66 +1,55 @@
 import argparse
-import subprocess
 import sys
+from pathlib import Path
 
+import dagster as dg
 
-def run_dagster_materialize(asset_name: str, partition_date: str):
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+
+
+def run_dagster_materialize(asset_names: list[str], partition_date: str) -> bool:
     """
-    Runs `dagster asset materialize` for a given asset and partition date.
+    Materializes the given assets for a partition date inside the current process.
+
+    The definitions are imported once and every asset runs through the same global asset job,
+    instead of starting a `dagster asset materialize` subprocess (and a fresh import of the
+    whole project) per asset.
 
     Args:
-        asset_name: The name of the asset to materialize.
+        asset_names: The asset keys to materialize, e.g. `bronze/entertainment/PSN/psn_profile_bronze`.
         partition_date: The partition date to use.
-    """
-    command = [
-        "dagster",
-        "asset",
-        "materialize",
-        "-f",
-        "src/main.py",
-        "-a",
-        "defs",
-        "--select",
-        asset_name,
-        "--partition",
-        partition_date,
-    ]
 
-    print(f"Running command: {' '.join(command)}")
-
-    try:
-        # Using capture_output=True to get stdout and stderr
-        # Using text=True to get stdout and stderr as strings
-        result = subprocess.run(
-            command,
-            check=True,
-            capture_output=True,
-            text=True,
-            # Assumes dagster commands are run from the root of the project
-            # and the `src` module is in the python path.
-            # The `-m src` is a common pattern for dagster projects.
-            # We are assuming it's not needed if we are in the project root
-            # and the virtual environment is activated.
+    Returns:
+        True if every materialization succeeded, False otherwise.
+    """
+    # Make `src` importable regardless of the directory the script is run from
+    sys.path.insert(0, str(PROJECT_ROOT))
+    from src.main import defs  # noqa: PLC0415
+
+    job = defs.get_implicit_global_asset_job_def()
+
+    all_succeeded = True
+    for asset_name in asset_names:
+        print(f"Materializing {asset_name} for partition {partition_date}")
+        result = job.execute_in_process(
+            asset_selection=[dg.AssetKey.from_user_string(asset_name)],
+            partition_key=partition_date,
+            raise_on_error=False,
         )
-        print("Dagster materialization successful:")
-        print("--- stdout ---")
-        print(result.stdout)
-        print("--- stderr ---")
-        print(result.stderr)
-    except subprocess.CalledProcessError as e:
-        print(f"Error during Dagster materialization for asset {asset_name}:", file=sys.stderr)
-        print(e.stdout, file=sys.stdout)
-        print(e.stderr, file=sys.stderr)
-        sys.exit(1)
-    except FileNotFoundError:
-        print("Error: 'dagster' command not found. Make sure you are in the correct environment.", file=sys.stderr)
-        sys.exit(1)
+        if result.success:
+            print(f"Dagster materialization successful: {asset_name}")
+        else:
+            print(f"Error during Dagster materialization for asset {asset_name}", file=sys.stderr)
+            all_succeeded = False
+
+    return all_succeeded
 
 
 if __name__ == "__main__":
     parser = argparse.ArgumentParser(description="Run a Dagster asset materialization test.")
-    parser.add_argument("asset_name", type=str, help="The name of the asset to materialize.")
+    parser.add_argument("asset_name", type=str, nargs="+", help="The name(s) of the asset(s) to materialize.")
     parser.add_argument("partition_date", type=str, help="The partition date in YYYY-MM-DD format.")
 
     args = parser.parse_args()
 
-    run_dagster_materialize(args.asset_name, args.partition_date)
+    sys.exit(0 if run_dagster_materialize(args.asset_name, args.partition_date) else 1)
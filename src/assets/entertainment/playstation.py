@@ -1,12 +1,16 @@
 """Assets loading and processing Playstation usage data."""
 
-import hashlib
+from concurrent.futures import ThreadPoolExecutor
 from datetime import UTC, datetime
 
 import dagster as dg
 import polars as pl
 
 from src.resources.psn_resource import PSNResource
+from src.utils.global_helpers import md5_hex_series
+
+# Upper bound on concurrent PSN Title Search API calls
+PSN_DETAILS_MAX_WORKERS = 8
 
 
 @dg.asset(
@@ -97,17 +101,22 @@ def psn_game_details_bronze(psn_title_stats_bronze: list[dict], psn_resource: PS
         List of dictionaries containing detailed information for each game.
         Includes comprehensive metadata about each title beyond just play statistics.
     """
-    title_ids = set()
-    for title in psn_title_stats_bronze:
-        title_id = title["title_id"]
-        title_ids.add(title_id)
+    # Unique title ids in the order they were first played
+    title_ids = list(dict.fromkeys(title["title_id"] for title in psn_title_stats_bronze))
+
+    # Initialize the shared client before fanning out, so the workers only read it
+    psn_resource.get_client()
+    # Each lookup is a separate network round trip, so fetch the titles concurrently
+    with ThreadPoolExecutor(max_workers=PSN_DETAILS_MAX_WORKERS) as executor:
+        results = list(executor.map(psn_resource.get_game_details, title_ids))
+    # Titles fetched in this run are kept for the next partitions
+    psn_resource.save_game_details_cache()
 
     game_details = []
-    for title_id in title_ids:
-        game_detail = psn_resource.get_game_details(title_id=title_id)
+    for title_id, details in zip(title_ids, results, strict=True):
         # for some reason detail is returned as a list
         # I guess there are cases where there are multiple entries per id?
-        game_detail = game_detail[-1]
+        game_detail = details[-1]
         # adding title_id for ease of joining later
         # each game has a list of game ids,so wanted to keep a separate string column
         game_detail["title_id"] = title_id
@@ -213,7 +222,6 @@ def psn_game_play_history_silver(
     """
     processed_date = context.partition_key
     processed_date_dt = datetime.strptime(processed_date, "%Y-%m-%d").replace(tzinfo=UTC).date()
-    processed_game_play_history = []
 
     schema = {
         "play_history_id": pl.Utf8,
@@ -228,70 +236,85 @@ def psn_game_play_history_silver(
         "publisher": pl.Utf8,
         "psn_store_score": pl.Float64,
         "play_count": pl.Int64,
-        "first_played_date_time": pl.Datetime,
-        "last_played_date_time": pl.Datetime,
+        "first_played_date_time": pl.Datetime(time_unit="us", time_zone="UTC"),
+        "last_played_date_time": pl.Datetime(time_unit="us", time_zone="UTC"),
         "play_duration_in_seconds": pl.Float64,
         "processed_date": pl.Date,
     }
 
-    searchable_game_details = {}
-
-    # for joining with stat histor, we created a dictionary indexed with title_id
-    for item in psn_game_details_bronze:
-        searchable_game_details[item["title_id"]] = item
-
-    for stat_dict in psn_title_stats_bronze:
-        title_id = stat_dict["title_id"]
-        hash_input = f"{processed_date}_{title_id}"
-        play_history_id = hashlib.md5(hash_input.encode()).hexdigest()  # noqa: S324
-
-        # Extract just the date part from the ISO timestamp
-        release_date_str = searchable_game_details[title_id]["defaultProduct"]["releaseDate"]
-        release_date_dt = datetime.fromisoformat(release_date_str).date()
-
-        first_played_date_dt = datetime.fromisoformat(stat_dict["first_played_date_time"])
-        last_played_date_dt = datetime.fromisoformat(stat_dict["last_played_date_time"])
-
-        processed_item = {
-            "play_history_id": play_history_id,
-            "title_id": stat_dict["title_id"],
-            "title_name": stat_dict["name"],
-            "country": searchable_game_details[title_id]["country"],
-            "minimum_playable_age": searchable_game_details[title_id]["defaultProduct"]["minimumAge"],
-            "content_rating": searchable_game_details[title_id]["defaultProduct"]["contentRating"]["name"],
-            "is_best_selling": searchable_game_details[title_id]["defaultProduct"]["isBestSelling"],
-            "genres": searchable_game_details[title_id]["defaultProduct"]["genres"],
-            "game_release_date": release_date_dt,
-            "publisher": searchable_game_details[title_id]["defaultProduct"]["leadPublisherName"],
-            "psn_store_score": searchable_game_details[title_id]["starRating"]["score"],
-            "play_count": stat_dict["play_count"],
-            "first_played_date_time": first_played_date_dt,
-            "last_played_date_time": last_played_date_dt,
-            "play_duration_in_seconds": stat_dict["play_duration"],
-            "processed_date": processed_date_dt,
-        }
-
-        processed_game_play_history.append(processed_item)
-
-    if not processed_game_play_history:
+    if not psn_title_stats_bronze:
         context.log.warning("No additional play history found. Will be returning an empty dataframe")
         return pl.DataFrame(schema=schema)
 
-    play_history_df = pl.from_dicts(
-        processed_game_play_history,
-        schema=schema,
+    stats_df = pl.from_dicts(
+        psn_title_stats_bronze,
+        schema={
+            "title_id": pl.Utf8,
+            "name": pl.Utf8,
+            "play_count": pl.Int64,
+            "first_played_date_time": pl.Utf8,
+            "last_played_date_time": pl.Utf8,
+            "play_duration": pl.Float64,
+        },
     )
+    # The ids are merge keys against earlier runs, so they stay md5 digests, hashed for the whole column
+    stats_df = stats_df.with_columns(md5_hex_series(f"{processed_date}_" + stats_df["title_id"], "play_history_id"))
 
-    # Add deduplication logic - keep only the first occurrence of each play_history_id
-    deduplicated_df = play_history_df.unique(subset=["play_history_id"])
+    details_schema = {
+        "title_id": pl.Utf8,
+        "country": pl.Utf8,
+        "minimum_playable_age": pl.Int64,
+        "content_rating": pl.Utf8,
+        "is_best_selling": pl.Boolean,
+        "genres": pl.List(pl.Utf8),
+        "game_release_date": pl.Utf8,
+        "publisher": pl.Utf8,
+        "psn_store_score": pl.Float64,
+    }
 
-    if len(deduplicated_df) < len(play_history_df):
-        context.log.info(f"Removed {len(play_history_df) - len(deduplicated_df)} duplicate records")
+    # The nested game details are flattened in a single pass straight into columns,
+    # so Polars does not need to transpose a list of row dicts
+    details_columns = {col_name: [] for col_name in details_schema}
+    for item in psn_game_details_bronze:
+        default_product = item["defaultProduct"]
+        details_columns["title_id"].append(item["title_id"])
+        details_columns["country"].append(item["country"])
+        details_columns["minimum_playable_age"].append(default_product["minimumAge"])
+        details_columns["content_rating"].append(default_product["contentRating"]["name"])
+        details_columns["is_best_selling"].append(default_product["isBestSelling"])
+        details_columns["genres"].append(default_product["genres"])
+        details_columns["game_release_date"].append(default_product["releaseDate"])
+        details_columns["publisher"].append(default_product["leadPublisherName"])
+        details_columns["psn_store_score"].append(item["starRating"]["score"])
+
+    details_df = pl.DataFrame(details_columns, schema=details_schema)
+
+    # Built lazily so the join, the column expressions and the deduplication run as one query
+    # instead of materializing the joined frame first
+    deduplicated_df = (
+        stats_df
+        .lazy()
+        .join(details_df.lazy(), on="title_id", how="left")
+        .with_columns(
+            title_name=pl.col("name"),
+            # Extract just the date part from the ISO timestamp
+            game_release_date=pl.col("game_release_date").str.slice(0, 10).str.to_date("%Y-%m-%d"),
+            # All datetime fields are standardized to UTC
+            first_played_date_time=pl.col("first_played_date_time").str.to_datetime(time_unit="us", time_zone="UTC"),
+            last_played_date_time=pl.col("last_played_date_time").str.to_datetime(time_unit="us", time_zone="UTC"),
+            play_duration_in_seconds=pl.col("play_duration"),
+            processed_date=pl.lit(processed_date_dt, dtype=pl.Date),
+        )
+        .select(schema.keys())
+        # Add deduplication logic - keep only the first occurrence of each play_history_id
+        .unique(subset=["play_history_id"])
+        # The streaming engine executes the plan in batches, which keeps long play histories cheap
+        .collect(engine="streaming")
+    )
 
-    # convert datetime columns to UTC
-    for col_name in deduplicated_df.columns:
-        if "date_time" in col_name.lower() and deduplicated_df[col_name].dtype == pl.Datetime:
-            deduplicated_df = deduplicated_df.with_columns(**{col_name: pl.col(col_name).dt.convert_time_zone("UTC")})
+    # The left join keeps one row per title stat, so the stats count is the pre-deduplication size
+    if len(deduplicated_df) < len(stats_df):
+        context.log.info(f"Removed {len(stats_df) - len(deduplicated_df)} duplicate records")
 
     return deduplicated_df
 
@@ -361,14 +384,10 @@ def psn_profile_silver(context: dg.AssetExecutionContext, psn_profile_bronze: li
     }
 
     for profile_info in psn_profile_bronze:
-        account_id = profile_info["profile"]["accountId"]
-        hash_input = f"{processed_date_str}_{account_id}"
-        profile_id = hashlib.md5(hash_input.encode()).hexdigest()  # noqa: S324
-
+        # profile_id is derived from account_id once the DataFrame is built
         processed_item = {
-            "profile_id": profile_id,
             "online_id": profile_info["profile"]["onlineId"],
-            "account_id": account_id,
+            "account_id": profile_info["profile"]["accountId"],
             "trophy_level": profile_info["profile"]["trophySummary"]["level"],
             "trophy_progress": profile_info["profile"]["trophySummary"]["progress"],
             "platinum_trophies": profile_info["profile"]["trophySummary"]["earnedTrophies"]["platinum"],
@@ -383,15 +402,17 @@ def psn_profile_silver(context: dg.AssetExecutionContext, psn_profile_bronze: li
         context.log.warning("No profile data found. Will be returning an empty dataframe")
         return pl.DataFrame(schema=schema)
 
-    profile_df = pl.from_dicts(
-        processed_profiles,
-        schema=schema,
+    profile_df = pl.from_dicts(processed_profiles, schema=schema)
+    deduplicated_df = (
+        profile_df
+        .lazy()
+        .with_columns(md5_hex_series(f"{processed_date_str}_" + profile_df["account_id"], "profile_id"))
+        # Add deduplication logic - keep only the first occurrence of each profile_id
+        .unique(subset=["profile_id"])
+        .collect()
     )
 
-    # Add deduplication logic - keep only the first occurrence of each profile_id
-    deduplicated_df = profile_df.unique(subset=["profile_id"])
-
-    if len(deduplicated_df) < len(profile_df):
-        context.log.info(f"Removed {len(profile_df) - len(deduplicated_df)} duplicate profiles")
+    if len(deduplicated_df) < len(processed_profiles):
+        context.log.info(f"Removed {len(processed_profiles) - len(deduplicated_df)} duplicate profiles")
 
     return deduplicated_df
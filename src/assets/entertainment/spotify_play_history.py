@@ -1,7 +1,7 @@
 """Assets loading and processing Spotify play history."""
 
 import datetime
-import hashlib
+from operator import itemgetter
 
 import dagster as dg
 import polars as pl
@@ -10,8 +10,11 @@ from furl import furl
 from src.resources.spotify_resource import SpotifyResource
 from src.utils.data_loaders import get_storage_path
 from src.utils.date import datetime_to_epoch_ms
+from src.utils.global_helpers import md5_hex_series
 from src.validation.schemas.spotify_schema import spotify_silver_dagster_type
 
+_get_name = itemgetter("name")
+
 
 @dg.asset(
     name="spotify_play_history_bronze",
@@ -64,67 +67,58 @@ def spotify_play_history_bronze(context: dg.AssetExecutionContext, spotify_resou
     )
 
 
-def _extract_and_hash_play_history_id(played_at: str, song_id: str) -> str:
+def _parse_raw_spotify_items(items: list[dict]) -> dict[str, list]:
     """
-    Generate a unique play history ID by hashing played_at and song_id.
+    Parse raw Spotify play history items into one list per play history field.
+
+    The fields are collected column by column so the DataFrame can be built
+    straight from the lists, instead of Polars inferring every row dictionary.
 
     Parameters
     ----------
-    played_at : str
-        Timestamp when the song was played.
-    song_id : str
-        Spotify ID of the song.
+    items : list[dict]
+        Items from the Spotify API responses.
 
     Returns
     -------
-    str
-        MD5 hash representing the play history ID.
+    dict[str, list]
+        Mapping from play history field to its values, one entry per item.
     """
-    hash_input = f"{played_at}_{song_id}"
-    return hashlib.md5(hash_input.encode()).hexdigest()  # noqa: S324
+    columns = {
+        "played_at": [],
+        "duration_seconds": [],
+        "duration_ms": [],
+        "artist_names": [],
+        "song_id": [],
+        "song_name": [],
+        "album_name": [],
+        "popularity_points_by_spotify": [],
+        "is_explicit": [],
+        "song_release_date": [],
+        "no_of_available_markets": [],
+        "album_type": [],
+        "total_tracks": [],
+    }
 
+    for item in items:
+        track = item["track"]
+        album = track["album"]
 
-def _parse_raw_spotify_item(item: dict) -> dict:
-    """
-    Parse a single raw Spotify play history item into a processed dictionary.
+        columns["played_at"].append(item["played_at"])
+        columns["duration_seconds"].append(track["duration_ms"] / 1000)
+        columns["duration_ms"].append(track["duration_ms"])
+        columns["artist_names"].append(list(map(_get_name, track["artists"])))
+        columns["song_id"].append(track["id"])
+        columns["song_name"].append(track["name"])
+        columns["album_name"].append(album["name"])
+        columns["popularity_points_by_spotify"].append(track["popularity"])
+        columns["is_explicit"].append(track["explicit"])
+        columns["song_release_date"].append(album["release_date"])
+        columns["no_of_available_markets"].append(len(album["available_markets"]))
+        columns["album_type"].append(album["album_type"])
+        columns["total_tracks"].append(album["total_tracks"])
 
-    Parameters
-    ----------
-    item : dict
-        A dictionary representing a single item from the Spotify API response.
-
-    Returns
-    -------
-    dict
-        A processed dictionary containing relevant play history fields.
-    """
-    track = item["track"]
-    album = track["album"]
-    played_at = item["played_at"]
-    song_id = track["id"]
-
-    play_history_id = _extract_and_hash_play_history_id(played_at, song_id)
-    duration_seconds = track["duration_ms"] / 1000
-    played_at_dt = datetime.datetime.fromisoformat(played_at)
-    played_date = played_at_dt.date()
-
-    return {
-        "play_history_id": play_history_id,
-        "played_at": played_at,
-        "played_date": played_date,
-        "duration_seconds": duration_seconds,
-        "duration_ms": track["duration_ms"],
-        "artist_names": [artist["name"] for artist in track["artists"]],
-        "song_id": song_id,
-        "song_name": track["name"],
-        "album_name": album["name"],
-        "popularity_points_by_spotify": track["popularity"],
-        "is_explicit": track["explicit"],
-        "song_release_date": album["release_date"],
-        "no_of_available_markets": len(album["available_markets"]),
-        "album_type": album["album_type"],
-        "total_tracks": album["total_tracks"],
-    }
+    return columns
 
 
 @dg.asset(
@@ -184,29 +178,40 @@ def spotify_play_history_silver(
         "total_tracks": pl.Int64,
     }
 
-    processed_history_data = [
-        _parse_raw_spotify_item(item)
-        for json_dict in spotify_play_history_bronze
-        for item in json_dict.get("items", [])
-    ]
+    processed_history_data = _parse_raw_spotify_items([
+        item for json_dict in spotify_play_history_bronze for item in json_dict.get("items", [])
+    ])
 
-    if not processed_history_data:
+    if not processed_history_data["played_at"]:
         context.log.warning("No additional play history found. Will be returning an empty dataframe")
         return pl.DataFrame(schema=schema).with_columns(
             played_at=pl.col("played_at").str.to_datetime(format="%Y-%m-%dT%H:%M:%S%.fZ", time_unit="us")
         )
 
-    play_history_df = pl.from_dicts(
+    raw_df = pl.DataFrame(
         processed_history_data,
-        schema=schema,
+        schema={name: dtype for name, dtype in schema.items() if name not in {"play_history_id", "played_date"}},
+    )
+    play_history_df = (
+        raw_df
+        .with_columns(
+            # The ids are merge keys against earlier runs, so they stay md5 digests, hashed for the whole column
+            md5_hex_series(raw_df["played_at"] + "_" + raw_df["song_id"], "play_history_id"),
+            played_at=pl.col("played_at").str.to_datetime(format="%Y-%m-%dT%H:%M:%S%.fZ", time_unit="us"),
+        )
+        # played_date is derived from the timestamp parsed once for the whole column
+        .with_columns(played_date=pl.col("played_at").dt.date())
+        .select(schema.keys())
     )
 
-    # Add deduplication logic - keep only the first occurrence of each play_history_id
-    deduplicated_df = play_history_df.unique(subset=["play_history_id"])
+    # Add deduplication logic - keep only the first occurrence of each play_history_id.
+    # Checking the id column alone is cheaper than a full-frame unique when nothing repeats
+    if play_history_df["play_history_id"].n_unique() < play_history_df.height:
+        deduplicated_df = play_history_df.unique(subset=["play_history_id"])
+    else:
+        deduplicated_df = play_history_df
 
     if len(deduplicated_df) < len(play_history_df):
         context.log.info(f"Removed {len(play_history_df) - len(deduplicated_df)} duplicate records")
 
-    return deduplicated_df.with_columns(
-        played_at=pl.col("played_at").str.to_datetime(format="%Y-%m-%dT%H:%M:%S%.fZ", time_unit="us")
-    )
+    return deduplicated_df
@@ -1,20 +1,22 @@
 """Dagster assets for Health data processing."""
 
-import hashlib
-import io
 import re
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime as dt
 from datetime import timedelta
 from urllib.parse import urlparse
 
 import dagster as dg
-import fsspec
 import polars as pl
 
-from src.utils.aws import AWSCredentialFormat, get_aws_storage_options
-from src.utils.data_loaders import get_storage_path
+from src.utils.data_loaders import BRONZE_READ_MAX_WORKERS, extract_csv_from_multipart, get_filesystem, get_storage_path
+from src.utils.global_helpers import md5_hex_series
 from src.validation.schemas.health_schema import HealthSilverDagsterType
 
+# Column name clean-up patterns, compiled once rather than on every rename_columns call
+_PUNCTUATION_RE = re.compile(r"[ ()/\-\[\]]")
+_REPEATED_UNDERSCORE_RE = re.compile(r"_+")
+
 HEALTH_CSV_SCHEMA = {
     # It changed from "Date" to "Date/Time", so we map the new string.
     "Date/Time": pl.Utf8,
@@ -125,13 +127,14 @@ def health_silver(context: dg.AssetExecutionContext) -> pl.DataFrame:
         return pl.DataFrame(schema=empty_schema)
 
     dfs = []
-    for csv_str in raw_data:
-        clean_csv = extract_csv_from_multipart(csv_str)
+    for csv_bytes in raw_data:
+        clean_csv = extract_csv_from_multipart(csv_bytes)
         if not clean_csv:
             continue
         try:
+            # Raw bytes go straight to Polars' parser; no Python-side decode or StringIO copy
             chunk_df = pl.read_csv(
-                io.StringIO(clean_csv),
+                clean_csv,
                 null_values=[""],
                 schema_overrides=HEALTH_CSV_SCHEMA,
                 truncate_ragged_lines=True,
@@ -147,31 +150,18 @@ def health_silver(context: dg.AssetExecutionContext) -> pl.DataFrame:
         context.add_output_metadata({"row_count": 0})
         return pl.DataFrame(schema=empty_schema)
 
-    combined_df = pl.concat(dfs, how="diagonal_relaxed")
-    mapping = rename_columns(combined_df.columns)
-    combined_df = combined_df.rename(mapping)
-
-    # Cast datetimes
-    combined_df = combined_df.with_columns([
-        pl.col("date_time_pst").str.strptime(pl.Datetime, "%Y-%m-%d %H:%M:%S", strict=False)
-    ])
-
-    # Add activity_date partition col
-    combined_df = combined_df.with_columns([pl.col("date_time_pst").dt.strftime("%Y-%m-%d").alias("activity_date")])
-
-    # Deduplicate / Hash PK
-    def hash_id(s: str) -> str:
-        return hashlib.md5(s.encode()).hexdigest()  # noqa: S324
-
-    combined_df = combined_df.with_columns(
-        pl.col("date_time_pst")
-        .dt.to_string("%Y-%m-%d %H:%M:%S")
-        .map_elements(hash_id, return_dtype=pl.Utf8)
-        .alias("health_activity_id")
+    # Exports usually share one header, so they can be stacked directly; only reconcile
+    # columns when an export adds or drops metrics
+    combined_lf = pl.concat(
+        [df.lazy() for df in dfs],
+        how="vertical" if all(df.schema == dfs[0].schema for df in dfs[1:]) else "diagonal_relaxed",
     )
-
-    combined_df = combined_df.drop_nulls("date_time_pst")
-    health_df = combined_df.unique(subset=["health_activity_id"], maintain_order=True)
+    combined_lf = combined_lf.rename(_health_rename_mapping(combined_lf.collect_schema().names()))
+    try:
+        health_df = _clean_health_records(combined_lf, strict=True)
+    except pl.exceptions.InvalidOperationError:
+        context.log.warning("Some Date/Time values do not match the export format; dropping them instead.")
+        health_df = _clean_health_records(combined_lf, strict=False)
 
     min_dt = health_df["date_time_pst"].min()
     max_dt = health_df["date_time_pst"].max()
@@ -186,82 +176,119 @@ def health_silver(context: dg.AssetExecutionContext) -> pl.DataFrame:
     return health_df
 
 
-def load_bronze_csv_files(context: dg.AssetExecutionContext, path: str) -> list[str]:
+def _health_rename_mapping(cols: list[str]) -> dict[str, str]:
     """
-    Load all CSV files from the specified bronze path.
+    Map raw health export columns to their clean names.
+
+    Known export columns come from the precomputed mapping; only unexpected ones are cleaned up here.
 
     Parameters
     ----------
-    context : dg.AssetExecutionContext
-        The execution context.
-    path : str
-        The path to the bronze data directory.
+    cols : list[str]
+        List of raw column names.
 
     Returns
     -------
-    list[str]
-        A list of loaded CSV file contents as strings.
+    dict[str, str]
+        A mapping from raw column to cleaned column name.
     """
-    parsed = urlparse(path)
-    storage_options = get_aws_storage_options(return_credential_type=AWSCredentialFormat.UTILIZE_ENV_VARS)
-    fs = (
-        fsspec.filesystem("file")
-        if parsed.scheme in {"", "file"}
-        else fsspec.filesystem(parsed.scheme, **storage_options)
-    )
+    mapping = {col: HEALTH_RENAME_MAPPING[col] for col in cols if col in HEALTH_RENAME_MAPPING}
+    mapping |= rename_columns([col for col in cols if col not in mapping])
+    return mapping
 
-    if not fs.exists(path):
-        context.log.warning(f"Path does not exist: {path}")
-        return []
 
-    try:
-        csv_files = fs.glob(f"{path}/**/*.csv")
-    except Exception:
-        context.log.exception(f"Failed to glob files in {path}")
-        return []
+def _clean_health_records(lf: pl.LazyFrame, strict: bool) -> pl.DataFrame:
+    """
+    Parse the health timestamps, deduplicate on them and add the activity_date and health_activity_id columns.
 
-    data_list = []
-    context.log.info(f"Found {len(csv_files)} files in {path}")
+    Every step runs in one lazy query that is collected once, instead of materializing a new
+    DataFrame after each step.
 
-    for file_path in csv_files:
-        try:
-            with fs.open(file_path, "r") as f:
-                content = f.read()
-                data_list.append(content)
-        except Exception:  # noqa: BLE001
-            context.log.warning(f"Failed to read file: {file_path}")
+    Parameters
+    ----------
+    lf : pl.LazyFrame
+        Health records with renamed columns and a string ``date_time_pst`` column.
+    strict : bool
+        Raise on timestamps that do not match the export format instead of nulling them.
+        The strict, exact parse skips the lenient parser's per-value fallbacks.
 
-    return data_list
+    Returns
+    -------
+    pl.DataFrame
+        One record per parsed ``date_time_pst``, with ``activity_date`` and ``health_activity_id``;
+        rows without a timestamp are dropped.
 
+    Raises
+    ------
+    pl.exceptions.InvalidOperationError
+        If ``strict`` is set and a timestamp does not match the export format.
+    """
+    return (
+        lf.with_columns(
+            pl.col("date_time_pst").str.strptime(pl.Datetime, "%Y-%m-%d %H:%M:%S", strict=strict, exact=strict)
+        )
+        # Add activity_date partition col
+        .with_columns(pl.col("date_time_pst").dt.strftime("%Y-%m-%d").alias("activity_date"))
+        .drop_nulls("date_time_pst")
+        # health_activity_id is derived from the timestamp alone, so deduplicating on the timestamp
+        # compares fixed-width values and leaves only the surviving rows to hash
+        .unique(subset=["date_time_pst"], maintain_order=True)
+        # The md5 id is the merge key across uploads, so it has to stay stable between runs
+        .with_columns(
+            pl.col("date_time_pst")
+            .dt.to_string("%Y-%m-%d %H:%M:%S")
+            .map_batches(lambda values: md5_hex_series(values, "health_activity_id"), return_dtype=pl.Utf8)
+            .alias("health_activity_id")
+        )
+        # The streaming engine works through the concatenated exports in batches, so the
+        # renamed and parsed copy of every file is never held in memory at once
+        .collect(engine="streaming")
+    )
 
-def extract_csv_from_multipart(raw_string: str) -> str:
+
+def load_bronze_csv_files(context: dg.AssetExecutionContext, path: str) -> list[bytes]:
     """
-    Extract the clean CSV payload from iOS multipart form-data structure.
+    Load all CSV files from the specified bronze path as raw bytes.
 
     Parameters
     ----------
-    raw_string : str
-        The raw string payload containing multipart boundary headers and footers.
+    context : dg.AssetExecutionContext
+        The execution context.
+    path : str
+        The path to the bronze data directory.
 
     Returns
     -------
-    str
-        The cleaned CSV content.
+    list[bytes]
+        A list of loaded CSV file contents, undecoded.
     """
-    lines = raw_string.splitlines()
-    start_idx = 0
-    for i, line in enumerate(lines):
-        if line.startswith(("Date,", "Date/Time,", "Type,")):
-            start_idx = i
-            break
+    fs = get_filesystem(urlparse(path).scheme)
+
+    # One recursive listing covers both the existence check and the file lookup; a missing path lists nothing
+    try:
+        csv_files = [file_path for file_path in fs.find(path) if file_path.endswith(".csv")]
+    except Exception:
+        context.log.exception(f"Failed to list files in {path}")
+        return []
 
-    end_idx = len(lines)
-    for i in range(len(lines) - 1, -1, -1):
-        if lines[i].startswith("--Boundary"):
-            end_idx = i
-            break
+    if not csv_files:
+        context.log.warning(f"No CSV files found in {path}")
+        return []
 
-    return "\n".join(lines[start_idx:end_idx]).strip()
+    context.log.info(f"Found {len(csv_files)} files in {path}")
+
+    def _read_file(file_path: str) -> bytes | None:
+        try:
+            with fs.open(file_path, "rb") as f:
+                return f.read()
+        except Exception:  # noqa: BLE001
+            context.log.warning(f"Failed to read file: {file_path}")
+            return None
+
+    with ThreadPoolExecutor(max_workers=BRONZE_READ_MAX_WORKERS) as executor:
+        contents = list(executor.map(_read_file, csv_files))
+
+    return [content for content in contents if content is not None]
 
 
 def rename_columns(cols: list[str]) -> dict[str, str]:
@@ -282,8 +309,8 @@ def rename_columns(cols: list[str]) -> dict[str, str]:
     for col in cols:
         name = col.lower().strip()
         name = name.replace("º", "")
-        name = re.sub(r"[ ()/\-\[\]]", "_", name)
-        name = re.sub(r"_+", "_", name)
+        name = _PUNCTUATION_RE.sub("_", name)
+        name = _REPEATED_UNDERSCORE_RE.sub("_", name)
         name = name.strip("_")
 
         if name in {"date", "date_time"}:
@@ -295,3 +322,7 @@ def rename_columns(cols: list[str]) -> dict[str, str]:
 
         mapping[col] = name
     return mapping
+
+
+# The export's column set is fixed, so its clean names are worked out once at import
+HEALTH_RENAME_MAPPING = rename_columns(list(HEALTH_CSV_SCHEMA))
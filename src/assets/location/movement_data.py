@@ -1,6 +1,7 @@
 """Assets for processing GPS location and movement tracking data."""
 
 import json
+from concurrent.futures import ThreadPoolExecutor
 from urllib.parse import urlparse
 
 import dagster as dg
@@ -8,10 +9,22 @@ import fsspec
 import polars as pl
 
 from src.resources.geo_encoder import GeoEncoderResource
-from src.utils.aws import AWSCredentialFormat, get_aws_storage_options
-from src.utils.data_loaders import get_storage_path
+from src.utils.data_loaders import BRONZE_READ_MAX_WORKERS, get_filesystem, get_storage_path
 from src.validation.schemas.location_schema import LocationSilverDagsterType
 
+# Schema of an empty partition, so the validation sees the usual columns
+LOCATION_SILVER_SCHEMA = {
+    "timestamp": pl.Datetime(time_zone="UTC"),
+    "timestamp_utc": pl.Datetime(time_zone="UTC"),
+    "latitude": pl.Float64,
+    "longitude": pl.Float64,
+    "speed": pl.Float64,
+    "battery_level": pl.Float64,
+    "device_id": pl.String,
+    "date": pl.Date,
+    "formatted_address": pl.String,
+}
+
 
 @dg.asset(
     name="location_data_silver",
@@ -63,35 +76,21 @@ def location_data_silver(
     base_path = get_storage_path(dataset_name="location", table_name="bronze")
     partition_path = f"{base_path}/{partition_date}"
 
-    # Define empty DataFrame with correct schema to satisfy validation
-    empty_schema = {
-        "timestamp": pl.Datetime(time_zone="UTC"),
-        "timestamp_utc": pl.Datetime(time_zone="UTC"),
-        "latitude": pl.Float64,
-        "longitude": pl.Float64,
-        "speed": pl.Float64,
-        "battery_level": pl.Float64,
-        "device_id": pl.String,
-        "date": pl.Date,
-        "formatted_address": pl.String,
-    }
-    empty_df = pl.DataFrame(schema=empty_schema)
-
     # Fetch raw data from bronze storage
     all_locations = fetch_bronze_location_data(context, partition_path)
 
     if not all_locations:
         context.log.warning("No location data found")
-        return empty_df
+        return pl.DataFrame(schema=LOCATION_SILVER_SCHEMA)
 
     context.log.info(f"Loaded {len(all_locations)} location records for partition {context.partition_key}")
 
     # Extract coordinates and properties from GeoJSON format
     records = transform_geojson_to_records(all_locations, context.log)
 
-    if not records:
+    if records.is_empty():
         context.log.warning("No valid location records after processing")
-        return empty_df
+        return pl.DataFrame(schema=LOCATION_SILVER_SCHEMA)
 
     # Create and clean DataFrame
     location_df = clean_location_dataframe(records)
@@ -148,29 +147,24 @@ def fetch_bronze_location_data(context: dg.AssetExecutionContext, partition_path
     list[dict]
         A list of raw location records.
     """
-    # Get filesystem following existing pattern
+    # The filesystem is cached per scheme, so later partitions skip the client setup
     parsed = urlparse(partition_path)
-    storage_options = get_aws_storage_options(return_credential_type=AWSCredentialFormat.UTILIZE_ENV_VARS)
-    fs = (
-        fsspec.filesystem("file")
-        if parsed.scheme in {"", "file"}
-        else fsspec.filesystem(parsed.scheme, **storage_options)
-    )
+    fs = get_filesystem(parsed.scheme)
 
     context.log.info(f"Reading location bronze data from {parsed.geturl()}")
 
-    # Check if partition directory exists
-    if not fs.exists(partition_path):
+    # List the partition directory once; a missing directory raises instead of needing its own exists call
+    try:
+        entries = fs.ls(partition_path, detail=False)
+    except FileNotFoundError:
         context.log.warning(f"No location data directory found for partition {partition_path}")
         return []
-
-    # List all JSON files in the partition directory
-    try:
-        json_files = fs.glob(f"{partition_path}/*.json")
     except Exception:
         context.log.exception(f"Failed to list files in {partition_path}")
         return []
 
+    json_files = [file_path for file_path in entries if file_path.endswith(".json")]
+
     if not json_files:
         context.log.warning(f"No JSON files found in {partition_path}")
         return []
@@ -199,27 +193,41 @@ def load_raw_location_data(
     list[dict]
         A list of raw location data records.
     """
-    all_locations = []
-    for json_file_path in json_files:
+
+    def _read_file(json_file_path: str) -> str | None:
         try:
             with fs.open(json_file_path, "r") as f:
-                data = json.load(f)
-                if "locations" in data:
-                    all_locations.extend(data["locations"])
-                else:
-                    log.warning(f"No 'locations' key found in {json_file_path}")
-        except json.JSONDecodeError:
-            log.exception(f"Failed to parse JSON file {json_file_path}")
-            continue
+                return f.read()
         except Exception:
             log.exception(f"Failed to read file {json_file_path}")
+            return None
+
+    # Fetching is bound by per-object S3 latency, so the files are read concurrently and parsed afterwards
+    with ThreadPoolExecutor(max_workers=BRONZE_READ_MAX_WORKERS) as executor:
+        contents = list(executor.map(_read_file, json_files))
+
+    all_locations = []
+    for json_file_path, content in zip(json_files, contents, strict=True):
+        if content is None:
             continue
+        try:
+            data = json.loads(content)
+        except json.JSONDecodeError:
+            log.exception(f"Failed to parse JSON file {json_file_path}")
+            continue
+        if "locations" in data:
+            all_locations.extend(data["locations"])
+        else:
+            log.warning(f"No 'locations' key found in {json_file_path}")
     return all_locations
 
 
-def transform_geojson_to_records(all_locations: list[dict], log: dg.DagsterLogManager) -> list[dict]:
+def transform_geojson_to_records(all_locations: list[dict], log: dg.DagsterLogManager) -> pl.DataFrame:
     """
-    Transform raw GeoJSON location data into flattened records.
+    Transform raw GeoJSON location data into a flat DataFrame of location records.
+
+    The features are loaded into one struct column and flattened with Polars expressions,
+    instead of building a Python dict per feature.
 
     Parameters
     ----------
@@ -230,103 +238,117 @@ def transform_geojson_to_records(all_locations: list[dict], log: dg.DagsterLogMa
 
     Returns
     -------
-    list[dict]
-        A list of flattened location records.
+    pl.DataFrame
+        One row per location with a valid coordinates pair, with its properties flattened into columns.
     """
-    records = []
-    for location in all_locations:
-        try:
-            geometry = location.get("geometry", {})
-            properties = location.get("properties", {})
-
-            # Extract coordinates (GeoJSON format is [lng, lat])
-            coordinates = geometry.get("coordinates", [None, None])
-            if len(coordinates) >= 2:
-                longitude, latitude = coordinates[0], coordinates[1]
-            else:
-                log.warning(f"Invalid coordinates format: {coordinates}")
-                continue
-
-            # Build record with flattened properties
-            record = {
-                "timestamp": properties.get("timestamp"),
-                "latitude": latitude,
-                "longitude": longitude,
-                "speed": properties.get("speed", -1),
-                "motion": ",".join(properties.get("motion", []))
-                if isinstance(properties.get("motion"), list)
-                else properties.get("motion"),
-                "battery_state": properties.get("battery_state"),
-                "battery_level": properties.get("battery_level"),
-                "altitude": properties.get("altitude"),
-                "horizontal_accuracy": properties.get("horizontal_accuracy"),
-                "vertical_accuracy": properties.get("vertical_accuracy"),
-                "speed_accuracy": properties.get("speed_accuracy", -1),
-                "course": properties.get("course", -1),
-                "course_accuracy": properties.get("course_accuracy", -1),
-                "device_id": properties.get("device_id"),
-                "wifi": properties.get("wifi", ""),
-            }
-            records.append(record)
-        except Exception:
-            log.exception("Failed to process location record")
-            continue
-    return records
+    features = pl.Series("feature", all_locations, strict=False)
+    if not isinstance(features.dtype, pl.Struct):
+        log.warning("Location records are not GeoJSON features")
+        return pl.DataFrame()
+
+    if features.null_count():
+        log.warning(f"Skipped {features.null_count()} empty location records")
+        features = features.drop_nulls()
+
+    features_df = features.struct.unnest()
+    columns = features_df.schema
+    # Properties are read as struct fields rather than unnested, so keys such as "type" or
+    # "geometry" inside them cannot collide with the feature's own top-level keys
+    properties_dtype = columns.get("properties")
+    property_fields = (
+        {field.name: field.dtype for field in properties_dtype.fields}
+        if isinstance(properties_dtype, pl.Struct)
+        else {}
+    )
+
+    def _property(name: str, default: float | str | None = None) -> pl.Expr:
+        # A property no record carries is missing from the inferred struct entirely
+        value = pl.col("properties").struct.field(name) if name in property_fields else pl.lit(None)
+        return value.fill_null(default) if default is not None else value
+
+    # Extract coordinates (GeoJSON format is [lng, lat])
+    geometry = columns.get("geometry")
+    if isinstance(geometry, pl.Struct) and "coordinates" in {field.name for field in geometry.fields}:
+        coordinates = pl.col("geometry").struct.field("coordinates").cast(pl.List(pl.Float64))
+    else:
+        coordinates = pl.lit(None, dtype=pl.List(pl.Float64))
+    features_df = features_df.with_columns(coordinates=coordinates)
+
+    valid_coordinates = pl.col("coordinates").list.len().fill_null(0) >= 2
+    invalid_count = features_df.select((~valid_coordinates).sum()).item()
+    if invalid_count:
+        log.warning(f"Skipped {invalid_count} location records with an invalid coordinates format")
+
+    # Overland sends motion as a list of activities, but plain strings are accepted too. A mix of
+    # both is inferred as strings, with the lists rendered as JSON arrays
+    motion_dtype = property_fields.get("motion")
+    if isinstance(motion_dtype, pl.List):
+        motion = _property("motion").list.join(",")
+    elif motion_dtype == pl.String:
+        motion = _property("motion").str.replace_all(r'[\[\]"]', "").str.replace_all(", ", ",")
+    else:
+        motion = pl.lit(None, dtype=pl.String)
+
+    return features_df.filter(valid_coordinates).select(
+        timestamp=_property("timestamp").cast(pl.String),
+        latitude=pl.col("coordinates").list.get(1),
+        longitude=pl.col("coordinates").list.get(0),
+        speed=_property("speed", -1),
+        motion=motion,
+        battery_state=_property("battery_state").cast(pl.String),
+        battery_level=_property("battery_level"),
+        altitude=_property("altitude"),
+        horizontal_accuracy=_property("horizontal_accuracy"),
+        vertical_accuracy=_property("vertical_accuracy"),
+        speed_accuracy=_property("speed_accuracy", -1),
+        course=_property("course", -1),
+        course_accuracy=_property("course_accuracy", -1),
+        device_id=_property("device_id").cast(pl.String),
+        wifi=_property("wifi", ""),
+    )
 
 
-def clean_location_dataframe(records: list[dict]) -> pl.DataFrame:
+def clean_location_dataframe(records: pl.DataFrame) -> pl.DataFrame:
     """
-    Create and clean a Polars DataFrame from flattened records.
+    Clean and validate a DataFrame of flattened location records.
 
     Parameters
     ----------
-    records : list[dict]
-        A list of flattened location records.
+    records : pl.DataFrame
+        Flattened location records, as returned by ``transform_geojson_to_records``.
 
     Returns
     -------
     pl.DataFrame
         A cleaned and validated Polars DataFrame.
     """
-    if not records:
-        empty_schema = {
-            "timestamp": pl.Datetime(time_zone="UTC"),
-            "timestamp_utc": pl.Datetime(time_zone="UTC"),
-            "latitude": pl.Float64,
-            "longitude": pl.Float64,
-            "speed": pl.Float64,
-            "battery_level": pl.Float64,
-            "device_id": pl.String,
-            "date": pl.Date,
-            "formatted_address": pl.String,
-        }
-        return pl.DataFrame(schema=empty_schema)
-
-    location_df = pl.DataFrame(records, schema_overrides={"timestamp": pl.String})
-
-    # Data type conversions and validation
-    location_df = location_df.with_columns(
-        timestamp=pl.col("timestamp").str.to_datetime().dt.replace_time_zone("UTC"),
-        timestamp_utc=pl.col("timestamp").str.to_datetime().dt.replace_time_zone("UTC"),
-        latitude=pl.col("latitude").cast(pl.Float64),
-        longitude=pl.col("longitude").cast(pl.Float64),
-        speed=pl.col("speed").cast(pl.Float64),
-        battery_level=pl.col("battery_level").cast(pl.Float64),
-        altitude=pl.col("altitude").cast(pl.Float64),
-        horizontal_accuracy=pl.col("horizontal_accuracy").cast(pl.Float64),
-        vertical_accuracy=pl.col("vertical_accuracy").cast(pl.Float64),
-        speed_accuracy=pl.col("speed_accuracy").cast(pl.Float64),
-        course=pl.col("course").cast(pl.Float64),
-        course_accuracy=pl.col("course_accuracy").cast(pl.Float64),
-    )
-
-    # Add partition date column
-    location_df = location_df.with_columns(date=pl.col("timestamp_utc").dt.date())
-
-    # Filter out invalid coordinates
-    return location_df.filter(
-        pl.col("latitude").is_not_null()
-        & pl.col("longitude").is_not_null()
-        & pl.col("latitude").is_between(-90, 90)
-        & pl.col("longitude").is_between(-180, 180)
+    if records.is_empty():
+        return pl.DataFrame(schema=LOCATION_SILVER_SCHEMA)
+
+    # One lazy query: the coordinate filter runs first so the remaining casts only touch valid rows,
+    # and the timestamp string is parsed once and reused for the UTC copy and the partition date
+    latitude = pl.col("latitude").cast(pl.Float64)
+    longitude = pl.col("longitude").cast(pl.Float64)
+    timestamp = pl.col("timestamp").str.to_datetime().dt.replace_time_zone("UTC")
+    return (
+        records
+        .lazy()
+        .filter(latitude.is_between(-90, 90) & longitude.is_between(-180, 180))
+        .with_columns(
+            timestamp=timestamp,
+            timestamp_utc=timestamp,
+            latitude=latitude,
+            longitude=longitude,
+            speed=pl.col("speed").cast(pl.Float64),
+            battery_level=pl.col("battery_level").cast(pl.Float64),
+            altitude=pl.col("altitude").cast(pl.Float64),
+            horizontal_accuracy=pl.col("horizontal_accuracy").cast(pl.Float64),
+            vertical_accuracy=pl.col("vertical_accuracy").cast(pl.Float64),
+            speed_accuracy=pl.col("speed_accuracy").cast(pl.Float64),
+            course=pl.col("course").cast(pl.Float64),
+            course_accuracy=pl.col("course_accuracy").cast(pl.Float64),
+        )
+        # Add partition date column
+        .with_columns(date=pl.col("timestamp_utc").dt.date())
+        .collect(engine="streaming")
     )
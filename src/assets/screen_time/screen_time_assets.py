@@ -1,22 +1,58 @@
 """Assets for processing Screen Time data."""
 
-import hashlib
 import json
+import re
+from concurrent.futures import ThreadPoolExecutor
 from datetime import UTC
 from datetime import datetime as dt
 from urllib.parse import urlparse
 
 import dagster as dg
-import fsspec
 import polars as pl
 
-from src.utils.aws import AWSCredentialFormat, get_aws_storage_options
-from src.utils.data_loaders import get_storage_path
+from src.utils.data_loaders import BRONZE_READ_MAX_WORKERS, get_filesystem, get_storage_path
+from src.utils.global_helpers import md5_hex_series
 from src.validation.schemas.screen_time_schema import (
     ScreenTimeIphoneSilverDagsterType,
     ScreenTimeMacSilverDagsterType,
 )
 
+# Shortcut timestamps look like "Feb 16, 2026 at 6:57 PM"; matched once instead of going through strptime
+_UPDATED_AT_RE = re.compile(
+    r"(?P<month>[A-Z][a-z]{2}) (?P<day>\d{1,2}), (?P<year>\d{4}) "
+    r"(?:at )?(?P<hour>\d{1,2}):(?P<minute>\d{2}) (?P<meridiem>[AP]M)"
+)
+_MONTHS = {
+    month: number
+    for number, month in enumerate(
+        ("Jan", "Feb", "Mar", "Apr", "May", "Jun", "Jul", "Aug", "Sep", "Oct", "Nov", "Dec"), start=1
+    )
+}
+
+# Silver schema of the iPhone asset, also used for empty partitions
+SCREEN_TIME_IPHONE_SCHEMA = {
+    "id": pl.Utf8,
+    "device_id": pl.Utf8,
+    "usage_date": pl.Utf8,
+    "total_usage_seconds": pl.Int64,
+    "updated_at": pl.Datetime(time_zone="UTC"),
+    "device_name": pl.Utf8,
+    "device_type": pl.Utf8,
+}
+
+# Silver schema of the Mac asset, also used for empty partitions
+SCREEN_TIME_MAC_SCHEMA = {
+    "id": pl.Utf8,
+    "device_id": pl.Utf8,
+    "usage_date": pl.Utf8,
+    "bundle_id": pl.Utf8,
+    "app_name": pl.Utf8,
+    "total_usage_seconds": pl.Int64,
+    "updated_at": pl.Datetime(time_zone="UTC"),
+    "device_name": pl.Utf8,
+    "device_type": pl.Utf8,
+}
+
 
 @dg.asset(
     name="screen_time_iphone",
@@ -67,27 +103,15 @@ def screen_time_iphone(context: dg.AssetExecutionContext) -> pl.DataFrame:
 
     raw_data = load_bronze_json_files(context, bronze_path)
 
-    empty_schema = {
-        "id": pl.Utf8,
-        "device_id": pl.Utf8,
-        "usage_date": pl.Utf8,
-        "total_usage_seconds": pl.Int64,
-        "updated_at": pl.Datetime(time_zone="UTC"),
-        "device_name": pl.Utf8,
-        "device_type": pl.Utf8,
-    }
-
     if not raw_data:
         context.log.warning("No raw data found for iPhone screen time.")
-        return pl.DataFrame(schema=empty_schema)
+        return pl.DataFrame(schema=SCREEN_TIME_IPHONE_SCHEMA)
 
-    processed_data = _process_iphone_records(context, raw_data)
+    iphone_df = _process_iphone_records(context, raw_data)
 
-    if not processed_data:
+    if iphone_df.is_empty():
         context.log.warning("No valid records found after processing.")
-        return pl.DataFrame(schema=empty_schema)
-
-    iphone_df = pl.DataFrame(processed_data)
+        return pl.DataFrame(schema=SCREEN_TIME_IPHONE_SCHEMA)
 
     # Deduplication: Sort by updated_at descending, then group by id and take first
     return iphone_df.sort("updated_at", descending=True).unique(subset=["id"], keep="first")
@@ -143,28 +167,14 @@ def screen_time_mac(context: dg.AssetExecutionContext) -> pl.DataFrame:
 
     raw_data = load_bronze_json_files(context, bronze_path)
 
-    empty_schema = {
-        "id": pl.Utf8,
-        "device_id": pl.Utf8,
-        "usage_date": pl.Utf8,
-        "bundle_id": pl.Utf8,
-        "app_name": pl.Utf8,
-        "total_usage_seconds": pl.Int64,
-        "updated_at": pl.Datetime(time_zone="UTC"),
-        "device_name": pl.Utf8,
-        "device_type": pl.Utf8,
-    }
-
     if not raw_data:
         context.log.warning("No raw data found for Mac screen time.")
-        return pl.DataFrame(schema=empty_schema)
+        return pl.DataFrame(schema=SCREEN_TIME_MAC_SCHEMA)
 
-    processed_data = _process_mac_records(context, raw_data)
+    mac_df = _process_mac_records(context, raw_data)
 
-    if not processed_data:
-        return pl.DataFrame(schema=empty_schema)
-
-    mac_df = pl.DataFrame(processed_data)
+    if mac_df.is_empty():
+        return pl.DataFrame(schema=SCREEN_TIME_MAC_SCHEMA)
 
     # Deduplication: Sort by updated_at descending, then group by id and take first
     return mac_df.sort("updated_at", descending=True).unique(subset=["id"], keep="first")
@@ -186,13 +196,7 @@ def load_bronze_json_files(context: dg.AssetExecutionContext, path: str) -> list
     list[dict]
         A list of loaded JSON objects.
     """
-    parsed = urlparse(path)
-    storage_options = get_aws_storage_options(return_credential_type=AWSCredentialFormat.UTILIZE_ENV_VARS)
-    fs = (
-        fsspec.filesystem("file")
-        if parsed.scheme in {"", "file"}
-        else fsspec.filesystem(parsed.scheme, **storage_options)
-    )
+    fs = get_filesystem(urlparse(path).scheme)
 
     if not fs.exists(path):
         context.log.warning(f"Path does not exist: {path}")
@@ -205,18 +209,21 @@ def load_bronze_json_files(context: dg.AssetExecutionContext, path: str) -> list
         context.log.exception(f"Failed to glob files in {path}")
         return []
 
-    data_list = []
     context.log.info(f"Found {len(json_files)} files in {path}")
 
-    for file_path in json_files:
+    def _read_file(file_path: str) -> dict | None:
         try:
-            with fs.open(file_path, "r") as f:
-                data = json.load(f)
-                data_list.append(data)
+            with fs.open(file_path, "rb") as f:
+                return json.loads(f.read())
         except Exception:  # noqa: BLE001
             context.log.warning(f"Failed to read file: {file_path}")
+            return None
 
-    return data_list
+    # Each report is a small S3 object, so the reads are bound by per-request latency and issued concurrently
+    with ThreadPoolExecutor(max_workers=BRONZE_READ_MAX_WORKERS) as executor:
+        contents = list(executor.map(_read_file, json_files))
+
+    return [content for content in contents if content is not None]
 
 
 def parse_updated_at(date_str: str) -> dt:
@@ -241,22 +248,65 @@ def parse_updated_at(date_str: str) -> dt:
     ValueError
         If the date string cannot be parsed.
     """
-    try:
-        # Try ISO format first
-        return dt.fromisoformat(date_str).replace(tzinfo=UTC)
-    except ValueError:
-        pass
+    # ISO timestamps start with the year, so the format is picked up front instead of by catching errors
+    if date_str[:1].isdigit():
+        try:
+            return dt.fromisoformat(date_str).replace(tzinfo=UTC)
+        except ValueError as err:
+            raise ValueError(f"Could not parse date: {date_str}") from err
 
+    match = _UPDATED_AT_RE.fullmatch(date_str)
+    if match is None or match["month"] not in _MONTHS or not 1 <= int(match["hour"]) <= 12:
+        raise ValueError(f"Could not parse date: {date_str}")
+
+    hour = int(match["hour"]) % 12 + (12 if match["meridiem"] == "PM" else 0)
     try:
-        # Clean up string: remove " at " and parse
-        clean_str = date_str.replace(" at ", " ")
-        return dt.strptime(clean_str, "%b %d, %Y %I:%M %p").replace(tzinfo=UTC)
+        return dt(
+            int(match["year"]), _MONTHS[match["month"]], int(match["day"]), hour, int(match["minute"]), tzinfo=UTC
+        )
     except ValueError as err:
-        # Better to fail loud or return None?
+        # Out of range fields, e.g. "Feb 30"
         raise ValueError(f"Could not parse date: {date_str}") from err
 
 
-def _process_iphone_records(context: dg.AssetExecutionContext, raw_data: list[dict]) -> list[dict]:
+def _parse_updated_at_series(values: pl.Series) -> pl.Series:
+    """
+    Parse a column of updated_at strings to UTC datetimes.
+
+    The Shortcut format covers nearly every report and is parsed natively by Polars. Only the
+    values it does not match, e.g. ISO timestamps, go through ``parse_updated_at`` one by one.
+
+    Parameters
+    ----------
+    values : pl.Series
+        String Series of raw updated_at values.
+
+    Returns
+    -------
+    pl.Series
+        UTC datetime Series; values that cannot be parsed are null.
+    """
+    parsed = (
+        values.str
+        .replace(" at ", " ", literal=True)
+        .str.strptime(pl.Datetime("us"), "%b %d, %Y %I:%M %p", strict=False)
+        .dt.replace_time_zone("UTC")
+    )
+
+    needs_fallback = values.is_not_null() & parsed.is_null()
+    if not needs_fallback.any():
+        return parsed
+
+    fallback = []
+    for value in values.filter(needs_fallback):
+        try:
+            fallback.append(parse_updated_at(value))
+        except ValueError:
+            fallback.append(None)
+    return parsed.scatter(needs_fallback.arg_true(), pl.Series(fallback, dtype=parsed.dtype))
+
+
+def _process_iphone_records(context: dg.AssetExecutionContext, raw_data: list[dict]) -> pl.DataFrame:
     """
     Process and deduplicate iPhone screen time records.
 
@@ -269,48 +319,67 @@ def _process_iphone_records(context: dg.AssetExecutionContext, raw_data: list[di
 
     Returns
     -------
-    list[dict]
-        Processed and deduplicated records.
+    pl.DataFrame
+        Processed records, one row per report.
     """
-    processed_data = []
+    record_schema = {
+        "device_id": pl.Utf8,
+        "usage_date": pl.Utf8,
+        "total_usage_seconds": pl.Int64,
+        "updated_at": pl.Utf8,
+        "device_name": pl.Utf8,
+    }
+    # Values are appended straight into per-column lists, so Polars gets columns to build from
+    # instead of transposing one dict per record
+    columns = {name: [] for name in record_schema}
 
     for item in raw_data:
         try:
-            device_id = item.get("device_id")
-            updated_at_str = item.get("updated_at")
             # usage_seconds in sample could be string
             usage_seconds = int(item.get("usage_seconds", 0))
-            device_name = item.get("device_name")
-
-            # Derive usage_date from updated_at if not present
-            updated_at = parse_updated_at(updated_at_str)
-            usage_date_str = item.get("usage_date")
-            if not usage_date_str:
-                usage_date_str = updated_at.strftime("%Y-%m-%d")
-
-            # Create ID
-            hash_input = f"{device_id}_{usage_date_str}"
-            record_id = hashlib.md5(hash_input.encode()).hexdigest()  # noqa: S324
-
-            processed_data.append({
-                "id": record_id,
-                "device_id": device_id,
-                "usage_date": usage_date_str,
-                "total_usage_seconds": usage_seconds,
-                "updated_at": updated_at,
-                "device_name": device_name,
-                "device_type": "iphone",
-            })
-        except Exception as e:  # noqa: BLE001
+        except (TypeError, ValueError) as e:
             context.log.warning(f"Skipping record due to error: {e}, Record: {item}")
+            continue
+
+        columns["device_id"].append(item.get("device_id"))
+        columns["usage_date"].append(item.get("usage_date"))
+        columns["total_usage_seconds"].append(usage_seconds)
+        columns["updated_at"].append(item.get("updated_at"))
+        columns["device_name"].append(item.get("device_name"))
+
+    records = pl.DataFrame(columns, schema=record_schema, strict=False)
+    records = records.with_columns(updated_at=_parse_updated_at_series(records["updated_at"]))
+
+    skipped = records["updated_at"].null_count()
+    if skipped:
+        context.log.warning(f"Skipping {skipped} iPhone records with an unparseable updated_at")
+
+    # device_id is part of the merge key, so records without one cannot be stored
+    missing_device = records["device_id"].null_count()
+    if missing_device:
+        context.log.warning(f"Skipping {missing_device} iPhone records without a device_id")
+
+    iphone_df = records.drop_nulls(["updated_at", "device_id"]).with_columns(
+        # Derive usage_date from updated_at if not present
+        usage_date=pl
+        .when(pl.col("usage_date").is_null() | (pl.col("usage_date") == ""))
+        .then(pl.col("updated_at").dt.strftime("%Y-%m-%d"))
+        .otherwise(pl.col("usage_date")),
+        device_type=pl.lit("iphone"),
+    )
 
-    return processed_data
+    # The ids are hashed for the whole column once the records are collected
+    record_ids = md5_hex_series(iphone_df["device_id"] + "_" + iphone_df["usage_date"], "id")
+    return iphone_df.with_columns(record_ids).select(SCREEN_TIME_IPHONE_SCHEMA.keys())
 
 
-def _process_mac_records(context: dg.AssetExecutionContext, raw_data: list[dict]) -> list[dict]:
+def _process_mac_records(context: dg.AssetExecutionContext, raw_data: list[dict]) -> pl.DataFrame:
     """
     Process and deduplicate Mac screen time records.
 
+    Only the latest report per device and usage date is kept, and its per-app usage list is
+    exploded into one row per app.
+
     Parameters
     ----------
     context : dg.AssetExecutionContext
@@ -320,60 +389,90 @@ def _process_mac_records(context: dg.AssetExecutionContext, raw_data: list[dict]
 
     Returns
     -------
-    list[dict]
-        Processed and deduplicated records.
+    pl.DataFrame
+        Processed and deduplicated records, one row per app.
     """
-    reports_map = {}
+    if not raw_data:
+        return pl.DataFrame(schema=SCREEN_TIME_MAC_SCHEMA)
 
+    # A single entry that is not an app object would stop Polars from inferring a list of structs
+    # for the whole column, so only the malformed entries are dropped before the frame is built
+    apps_per_report = []
+    skipped_apps = 0
     for item in raw_data:
-        try:
-            device_id = item.get("device_id")
-            usage_date = item.get("usage_date")
-            updated_at_str = item.get("updated_at")
-            updated_at = parse_updated_at(updated_at_str)
-            item["updated_at_dt"] = updated_at  # Store parsed dt for comparison
-
-            key = f"{device_id}_{usage_date}"
-
-            if key not in reports_map or updated_at > reports_map[key]["updated_at_dt"]:
-                reports_map[key] = item
-        except Exception as e:  # noqa: BLE001
-            context.log.warning(f"Error processing mac report header: {e}")
-
-    processed_data = []
-
-    for report in reports_map.values():
-        device_id = report.get("device_id")
-        usage_date = report.get("usage_date")
-        updated_at = report.get("updated_at_dt")
-        device_name = report.get("device_name")
-        apps_data = report.get("data", [])
-
-        for app in apps_data:
-            try:
-                bundle_id = app.get("bundle_id")
-                # usage_seconds in app data might be int or float? Sample says int/float.
-                usage_seconds = int(app.get("total_usage_seconds", 0))
-
-                # App Name logic
-                parts = bundle_id.split(".")
-                app_name = parts[-1] if parts else bundle_id
-
-                hash_input = f"{device_id}_{usage_date}_{bundle_id}"
-                record_id = hashlib.md5(hash_input.encode()).hexdigest()  # noqa: S324
-
-                processed_data.append({
-                    "id": record_id,
-                    "device_id": device_id,
-                    "usage_date": usage_date,
-                    "bundle_id": bundle_id,
-                    "app_name": app_name,
-                    "total_usage_seconds": usage_seconds,
-                    "updated_at": updated_at,
-                    "device_name": device_name,
-                    "device_type": "mac",
-                })
-            except Exception as e:  # noqa: BLE001
-                context.log.warning(f"Error processing app record: {e}")
-
-    return processed_data
+        apps = item.get("data") or []
+        if not isinstance(apps, list):
+            apps = [apps]
+        valid_apps = [app for app in apps if isinstance(app, dict)]
+        skipped_apps += len(apps) - len(valid_apps)
+        apps_per_report.append(valid_apps)
+
+    if skipped_apps:
+        context.log.warning(f"Skipping {skipped_apps} Mac app usage entries that are not objects")
+
+    reports = {
+        "device_id": [item.get("device_id") for item in raw_data],
+        "usage_date": [item.get("usage_date") for item in raw_data],
+        "updated_at": [item.get("updated_at") for item in raw_data],
+        "device_name": [item.get("device_name") for item in raw_data],
+        "data": apps_per_report,
+    }
+
+    # Every report is scanned for the app fields, so one report with int and another with float
+    # usage seconds still infers a single struct type
+    reports_df = pl.DataFrame(reports, strict=False)
+    reports_df = reports_df.with_columns(
+        updated_at=_parse_updated_at_series(reports_df["updated_at"].cast(pl.Utf8, strict=False))
+    )
+
+    skipped = reports_df["updated_at"].null_count()
+    if skipped:
+        context.log.warning(f"Skipping {skipped} Mac reports with an unparseable updated_at")
+        reports_df = reports_df.drop_nulls("updated_at")
+
+    apps_dtype = reports_df.schema.get("data")
+    if not isinstance(apps_dtype, pl.List) or not isinstance(apps_dtype.inner, pl.Struct):
+        context.log.warning("No app usage records found in the Mac reports")
+        return pl.DataFrame(schema=SCREEN_TIME_MAC_SCHEMA)
+
+    app_fields = {field.name for field in apps_dtype.inner.fields}
+    if "bundle_id" not in app_fields:
+        context.log.warning("No app usage records with a bundle_id found")
+        return pl.DataFrame(schema=SCREEN_TIME_MAC_SCHEMA)
+
+    app = pl.col("data").struct
+    usage_seconds = app.field("total_usage_seconds") if "total_usage_seconds" in app_fields else pl.lit(None)
+
+    apps_df = (
+        reports_df
+        .lazy()
+        # Keep the latest report per device and day; ties keep the first report read
+        .sort("updated_at", descending=True, maintain_order=True)
+        .unique(subset=["device_id", "usage_date"], keep="first", maintain_order=True)
+        .explode("data")
+        .with_columns(bundle_id=app.field("bundle_id"), raw_usage_seconds=usage_seconds)
+        .filter(pl.col("bundle_id").is_not_null())
+        .with_columns(
+            # Reports mixing "12" and 12.5 infer a string field, so values go through Float64 and
+            # anything that is not a number becomes null instead of failing the whole partition
+            total_usage_seconds=pl.col("raw_usage_seconds").cast(pl.Float64, strict=False).cast(pl.Int64, strict=False),
+            app_name=pl.col("bundle_id").str.split(".").list.last(),
+            device_type=pl.lit("mac"),
+        )
+        # Header fields every report left out are inferred as Null rather than strings
+        .cast({"device_id": pl.Utf8, "usage_date": pl.Utf8, "device_name": pl.Utf8})
+        .collect()
+    )
+
+    invalid_usage = apps_df["raw_usage_seconds"].is_not_null() & apps_df["total_usage_seconds"].is_null()
+    if invalid_usage.any():
+        context.log.warning(f"Skipping {invalid_usage.sum()} Mac app records with a non-numeric total_usage_seconds")
+        apps_df = apps_df.filter(~invalid_usage)
+    apps_df = apps_df.with_columns(pl.col("total_usage_seconds").fill_null(0))
+
+    return apps_df.with_columns(
+        md5_hex_series(
+            apps_df["device_id"] + "_" + apps_df["usage_date"] + "_" + apps_df["bundle_id"],
+            "id",
+        )
+    ).select(SCREEN_TIME_MAC_SCHEMA.keys())
@@ -1,18 +1,16 @@
 """Dagster assets for Workout data processing."""
 
-import hashlib
-import io
 import re
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime as dt
 from datetime import timedelta
 from urllib.parse import urlparse
 
 import dagster as dg
-import fsspec
 import polars as pl
 
-from src.utils.aws import AWSCredentialFormat, get_aws_storage_options
-from src.utils.data_loaders import get_storage_path
+from src.utils.data_loaders import BRONZE_READ_MAX_WORKERS, extract_csv_from_multipart, get_filesystem, get_storage_path
+from src.utils.global_helpers import md5_hex_series
 from src.validation.schemas.workout_schema import WorkoutSilverDagsterType
 
 WORKOUT_CSV_SCHEMA = {
@@ -35,6 +33,33 @@ WORKOUT_CSV_SCHEMA = {
     "Elevation Descended (m)": pl.Float64,
 }
 
+# Schema of an empty partition, so the validation and IO manager see the usual columns
+WORKOUT_SILVER_SCHEMA = {
+    "workout_activity_id": pl.Utf8,
+    "type": pl.Utf8,
+    "start_pst": pl.Datetime(),
+    "end_pst": pl.Datetime(),
+    "duration": pl.Utf8,
+    "activity_date": pl.Utf8,
+    "total_energy_kcal": pl.Float64,
+    "active_energy_kcal": pl.Float64,
+    "max_heart_rate_bpm": pl.Float64,
+    "avg_heart_rate_bpm": pl.Float64,
+    "distance_km": pl.Float64,
+    "avg_speed_km_hr": pl.Float64,
+    "step_count_count": pl.Float64,
+    "step_cadence_spm": pl.Float64,
+    "swimming_stroke_count_count": pl.Float64,
+    "swim_stoke_cadence_spm": pl.Float64,
+    "flights_climbed_count": pl.Float64,
+    "elevation_ascended_m": pl.Float64,
+    "elevation_descended_m": pl.Float64,
+}
+
+# Formats seen in Apple Workout exports, tried in order. "%m/%d/%y" comes before "%m/%d/%Y"
+# since a four-digit year does not match "%y", while a two-digit one would match "%Y" as year 00xx.
+WORKOUT_DATETIME_FORMATS = ("%Y-%m-%d %H:%M", "%Y-%m-%d %H:%M:%S", "%m/%d/%y %H:%M", "%m/%d/%Y %H:%M")
+
 
 @dg.asset(
     name="workout_silver",
@@ -80,41 +105,20 @@ def workout_silver(context: dg.AssetExecutionContext) -> pl.DataFrame:
 
     raw_data = load_bronze_csv_files(context, bronze_path)
 
-    empty_schema = {
-        "workout_activity_id": pl.Utf8,
-        "type": pl.Utf8,
-        "start_pst": pl.Datetime(),
-        "end_pst": pl.Datetime(),
-        "duration": pl.Utf8,
-        "activity_date": pl.Utf8,
-        "total_energy_kcal": pl.Float64,
-        "active_energy_kcal": pl.Float64,
-        "max_heart_rate_bpm": pl.Float64,
-        "avg_heart_rate_bpm": pl.Float64,
-        "distance_km": pl.Float64,
-        "avg_speed_km_hr": pl.Float64,
-        "step_count_count": pl.Float64,
-        "step_cadence_spm": pl.Float64,
-        "swimming_stroke_count_count": pl.Float64,
-        "swim_stoke_cadence_spm": pl.Float64,
-        "flights_climbed_count": pl.Float64,
-        "elevation_ascended_m": pl.Float64,
-        "elevation_descended_m": pl.Float64,
-    }
-
     if not raw_data:
         context.log.warning("No raw data found for Workout.")
         context.add_output_metadata({"row_count": 0})
-        return pl.DataFrame(schema=empty_schema)
+        return pl.DataFrame(schema=WORKOUT_SILVER_SCHEMA)
 
     dfs = []
-    for csv_str in raw_data:
-        clean_csv = extract_csv_from_multipart(csv_str)
+    for csv_bytes in raw_data:
+        clean_csv = extract_csv_from_multipart(csv_bytes)
         if not clean_csv:
             continue
         try:
+            # Raw bytes go straight to Polars' parser; no Python-side decode or StringIO copy
             chunk_df = pl.read_csv(
-                io.StringIO(clean_csv),
+                clean_csv,
                 null_values=[""],
                 schema_overrides=WORKOUT_CSV_SCHEMA,
                 truncate_ragged_lines=True,
@@ -128,37 +132,30 @@ def workout_silver(context: dg.AssetExecutionContext) -> pl.DataFrame:
     if not dfs:
         context.log.warning("No valid records found after processing.")
         context.add_output_metadata({"row_count": 0})
-        return pl.DataFrame(schema=empty_schema)
-
-    combined_df = pl.concat(dfs, how="diagonal_relaxed")
-    mapping = rename_columns(combined_df.columns)
-    combined_df = combined_df.rename(mapping)
-
-    # Cast datetimes: format is often "%m/%d/%y %H:%M" such as "9/6/25 16:45"
-    # We can try to specify a format string, or use the strptime with `%m/%d/%y %H:%M`
-    combined_df = combined_df.with_columns([
-        pl.col("start_pst").str.strptime(pl.Datetime, "%Y-%m-%d %H:%M", strict=False),
-        pl.col("end_pst").str.strptime(pl.Datetime, "%Y-%m-%d %H:%M", strict=False),
-    ])
-
-
-    # Add activity_date partition col
-    combined_df = combined_df.with_columns([pl.col("start_pst").dt.strftime("%Y-%m-%d").alias("activity_date")])
-
-    # Deduplicate / Hash PK
-    def hash_id(s: str) -> str:
-        return hashlib.md5(s.encode()).hexdigest()  # noqa: S324
-
-    combined_df = combined_df.with_columns(
-        pl.col("start_pst")
-        .dt.to_string("%Y-%m-%d %H:%M:%S")
-        .map_elements(hash_id, return_dtype=pl.Utf8)
-        .alias("workout_activity_id")
+        return pl.DataFrame(schema=WORKOUT_SILVER_SCHEMA)
+
+    # The column clean-up runs as one lazy query and is collected once, instead of
+    # materializing a new DataFrame after every step
+    combined_lf = pl.concat([df.lazy() for df in dfs], how="diagonal_relaxed")
+    workout_df = (
+        combined_lf.rename(rename_columns(combined_lf.collect_schema().names()))
+        # Cast datetimes: the export format varies, e.g. "2026-02-16 12:00" or "9/6/25 16:45"
+        .with_columns(_parse_workout_datetime("start_pst"), _parse_workout_datetime("end_pst"))
+        # Add activity_date partition col
+        .with_columns(pl.col("start_pst").dt.strftime("%Y-%m-%d").alias("activity_date"))
+        .drop_nulls("start_pst")
+        # Deduplicate / Hash PK
+        # The md5 id is the merge key across uploads, so it has to stay stable between runs
+        .with_columns(
+            pl.col("start_pst")
+            .dt.to_string("%Y-%m-%d %H:%M:%S")
+            .map_batches(lambda values: md5_hex_series(values, "workout_activity_id"), return_dtype=pl.Utf8)
+            .alias("workout_activity_id")
+        )
+        .unique(subset=["workout_activity_id"], maintain_order=True)
+        .collect(engine="streaming")
     )
 
-    combined_df = combined_df.drop_nulls("start_pst")
-    workout_df = combined_df.unique(subset=["workout_activity_id"], maintain_order=True)
-
     min_dt = workout_df["start_pst"].min()
     max_dt = workout_df["start_pst"].max()
 
@@ -172,9 +169,31 @@ def workout_silver(context: dg.AssetExecutionContext) -> pl.DataFrame:
     return workout_df
 
 
-def load_bronze_csv_files(context: dg.AssetExecutionContext, path: str) -> list[str]:
+def _parse_workout_datetime(col: str) -> pl.Expr:
+    """
+    Build an expression parsing a workout timestamp column in any of the export formats.
+
+    Each format is parsed natively by Polars and the first match is kept, instead of
+    calling Python's ``strptime`` per row.
+
+    Parameters
+    ----------
+    col : str
+        Name of the string column to parse.
+
+    Returns
+    -------
+    pl.Expr
+        Datetime expression named ``col``; values matching no format are null.
+    """
+    return pl.coalesce([
+        pl.col(col).str.strptime(pl.Datetime, fmt, strict=False) for fmt in WORKOUT_DATETIME_FORMATS
+    ]).alias(col)
+
+
+def load_bronze_csv_files(context: dg.AssetExecutionContext, path: str) -> list[bytes]:
     """
-    Load all CSV files from the specified bronze path.
+    Load all CSV files from the specified bronze path as raw bytes.
 
     Parameters
     ----------
@@ -185,69 +204,37 @@ def load_bronze_csv_files(context: dg.AssetExecutionContext, path: str) -> list[
 
     Returns
     -------
-    list[str]
-        A list of loaded CSV file contents as strings.
+    list[bytes]
+        A list of loaded CSV file contents, undecoded.
     """
     parsed = urlparse(path)
-    storage_options = get_aws_storage_options(return_credential_type=AWSCredentialFormat.UTILIZE_ENV_VARS)
-    fs = (
-        fsspec.filesystem("file")
-        if parsed.scheme in {"", "file"}
-        else fsspec.filesystem(parsed.scheme, **storage_options)
-    )
-
-    if not fs.exists(path):
-        context.log.warning(f"Path does not exist: {path}")
-        return []
+    fs = get_filesystem(parsed.scheme)
 
+    # One recursive listing covers both the existence check and the file lookup; a missing path lists nothing
     try:
-        csv_files = fs.glob(f"{path}/**/*.csv")
+        csv_files = [file_path for file_path in fs.find(path) if file_path.endswith(".csv")]
     except Exception:
-        context.log.exception(f"Failed to glob files in {path}")
+        context.log.exception(f"Failed to list files in {path}")
+        return []
+
+    if not csv_files:
+        context.log.warning(f"No CSV files found in {path}")
         return []
 
-    data_list = []
     context.log.info(f"Found {len(csv_files)} files in {path}")
 
-    for file_path in csv_files:
+    def _read_file(file_path: str) -> bytes | None:
         try:
-            with fs.open(file_path, "r") as f:
-                content = f.read()
-                data_list.append(content)
+            with fs.open(file_path, "rb") as f:
+                return f.read()
         except Exception:  # noqa: BLE001
             context.log.warning(f"Failed to read file: {file_path}")
+            return None
 
-    return data_list
+    with ThreadPoolExecutor(max_workers=BRONZE_READ_MAX_WORKERS) as executor:
+        contents = list(executor.map(_read_file, csv_files))
 
-
-def extract_csv_from_multipart(raw_string: str) -> str:
-    """
-    Extract the clean CSV payload from iOS multipart form-data structure.
-
-    Parameters
-    ----------
-    raw_string : str
-        The raw string payload containing multipart boundary headers and footers.
-
-    Returns
-    -------
-    str
-        The cleaned CSV content.
-    """
-    lines = raw_string.splitlines()
-    start_idx = 0
-    for i, line in enumerate(lines):
-        if line.startswith(("Date,", "Date/Time,", "Type,")):
-            start_idx = i
-            break
-
-    end_idx = len(lines)
-    for i in range(len(lines) - 1, -1, -1):
-        if lines[i].startswith("--Boundary"):
-            end_idx = i
-            break
-
-    return "\n".join(lines[start_idx:end_idx]).strip()
+    return [content for content in contents if content is not None]
 
 
 def rename_columns(cols: list[str]) -> dict[str, str]:
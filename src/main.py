@@ -51,7 +51,12 @@ defs = dg.Definitions(
             client_secret=dg.EnvVar("SPOTIFY_CLIENT_SECRET"),
             refresh_token=dg.EnvVar("SPOTIFY_REFRESH_TOKEN"),
         ),
-        "psn_resource": PSNResource(refresh_token=dg.EnvVar("PSN_REFRESH_TOKEN")),
+        "psn_resource": PSNResource(
+            refresh_token=dg.EnvVar("PSN_REFRESH_TOKEN"),
+            s3_bucket=dg.EnvVar("AWS_S3_BUCKET_NAME"),
+            s3_cache_location="psn_cache/game_details_cache.json",
+            cache_ttl_days=30,
+        ),
         "github_resource": GithubResource(
             github_token=dg.EnvVar("GITHUB_TOKEN"), github_username=dg.EnvVar("GITHUB_USERNAME")
         ),
@@ -534,44 +534,41 @@ class GeoEncoderResource(dg.ConfigurableResource):
             df.select([lat_col, lng_col])
             .unique()
             .filter((pl.col(lat_col).is_not_null()) & (pl.col(lng_col).is_not_null()))
-        ).to_dicts()
+        )
 
         logger.info(f"Found {len(unique_coords)} unique coordinate pairs")
 
-        # Separate cached vs uncached coordinates
-        cached_data = []
-        uncached_coords = []
+        # Each newly geocoded location is cached straight away, so later coordinates in the same or a
+        # neighboring geohash cell are served from the cache instead of triggering another API call
+        all_enrichment_data = []
+        cache_hits = 0
+        newly_geocoded = 0
 
-        for coord in unique_coords:
-            lat, lng = coord[lat_col], coord[lng_col]
+        for lat, lng in unique_coords.iter_rows():
             cached_location = self._check_cache(lat, lng)
 
             if cached_location:
-                enriched_row = self._extract_enrichment_data(
-                    lat=lat, lng=lng, geocoding_data=cached_location.geocoding_data, enrich_columns=enrich_columns
-                )
-                cached_data.append(enriched_row)
+                cache_hits += 1
+                geocoding_data = cached_location.geocoding_data
             else:
-                uncached_coords.append((lat, lng))
+                geocoding_data = self._geocode_coordinates(lat, lng)
+                if not geocoding_data:
+                    continue
+                self._cache_location(lat, lng, geocoding_data)
+                newly_geocoded += 1
 
-        logger.info(f"Cache hits: {len(cached_data)}, Cache misses: {len(uncached_coords)}")
+            all_enrichment_data.append(
+                self._extract_enrichment_data(
+                    lat=lat, lng=lng, geocoding_data=geocoding_data, enrich_columns=enrich_columns
+                )
+            )
 
-        # Process uncached coordinates
-        newly_geocoded = []
-        for lat, lng in uncached_coords:
-            geocoding_data = self._geocode_coordinates(lat, lng)
-            if geocoding_data:
-                self._cache_location(lat, lng, geocoding_data)
-                enriched_row = self._extract_enrichment_data(lat, lng, geocoding_data, enrich_columns)
-                newly_geocoded.append(enriched_row)
+        logger.info(f"Cache hits: {cache_hits}, Newly geocoded: {newly_geocoded}")
 
         # Save updated cache
         if newly_geocoded:
             self._save_cache()
 
-        # Combine all enrichment data
-        all_enrichment_data = cached_data + newly_geocoded
-
         if not all_enrichment_data:
             logger.warning("No geocoding data available for any coordinates")
             return df
@@ -1,14 +1,21 @@
 """PlayStation Network Resource for interacting with PSN API via PSNAWP."""
 
+import copy
+import json
+import threading
 from dataclasses import asdict
+from datetime import UTC, datetime, timedelta
 from typing import Any
 
 import dagster as dg
+import fsspec
 from loguru import logger
 from psnawp_api import PSNAWP
 from psnawp_api.models import Client
 from pydantic import PrivateAttr
 
+from src.utils.aws import AWSCredentialFormat, get_aws_storage_options
+
 
 class PSNResource(dg.ConfigurableResource):
     """
@@ -16,11 +23,19 @@ class PSNResource(dg.ConfigurableResource):
 
     This resource handles authentication and API calls to PSN using the PSNAWP library.
     It maintains a single client instance to reduce redundant API calls within a job.
+    Game details rarely change, so they are cached per title_id, in memory for the run
+    and, when an S3 bucket is configured, in a JSON file that persists across runs.
 
     Parameters
     ----------
     refresh_token : str
         The PSN refresh token used for authentication
+    s3_bucket : str | None, optional
+        S3 bucket for the persistent game details cache, by default None (in-memory only)
+    s3_cache_location : str, optional
+        S3 object key for the cache file, by default "psn_cache/game_details_cache.json"
+    cache_ttl_days : int, optional
+        Number of days a cached game details entry stays valid, by default 30
 
     Attributes
     ----------
@@ -28,14 +43,30 @@ class PSNResource(dg.ConfigurableResource):
         The PSNAWP client instance (private)
     _user : PSNAWPUser
         The current user instance from PSNAWP (private)
+    _filesystem : fsspec.AbstractFileSystem
+        Filesystem instance for cache storage (private)
+    _game_details_cache : dict[str, dict[str, Any]]
+        Cached game details keyed by title_id (private)
+    _cache_loaded : bool
+        Flag indicating if the cache has been loaded from storage (private)
+    _lock : threading.Lock
+        Guards client initialization and the game details cache, which are shared by the
+        threads fetching game details concurrently (private)
     """
 
     # Configuration params
     refresh_token: str
+    s3_bucket: str | None = None
+    s3_cache_location: str = "psn_cache/game_details_cache.json"
+    cache_ttl_days: int = 30
 
     # Private attributes to track client state
     _client: PSNAWP = PrivateAttr(default=None)
     _user: Client = PrivateAttr(default=None)
+    _filesystem: Any = PrivateAttr(default=None)
+    _game_details_cache: dict[str, dict[str, Any]] = PrivateAttr(default_factory=dict)
+    _cache_loaded: bool = PrivateAttr(default=False)
+    _lock: threading.Lock = PrivateAttr(default_factory=threading.Lock)
 
     def setup_for_execution(self, context: dg.InitResourceContext) -> None:
         """
@@ -55,7 +86,10 @@ class PSNResource(dg.ConfigurableResource):
             If client initialization fails
         """
         self._initialize_client()
-        context.log.info("PlayStation Network client initialized")
+        self._load_game_details_cache()
+        context.log.info(
+            f"PlayStation Network client initialized with {len(self._game_details_cache)} cached game details"
+        )
 
     def _initialize_client(self) -> None:
         """
@@ -103,7 +137,10 @@ class PSNResource(dg.ConfigurableResource):
         >>> game = client.game_title(title_id="CUSA00572_00")
         """
         if self._client is None:
-            self._initialize_client()
+            with self._lock:
+                # Another thread may have finished initializing while this one waited
+                if self._client is None:
+                    self._initialize_client()
         return self._client
 
     def get_user(self) -> Client:
@@ -207,6 +244,7 @@ class PSNResource(dg.ConfigurableResource):
         Get detailed information about a specific game.
 
         Retrieves game information including name, genres, and other metadata.
+        A fresh cached entry is returned without calling the API.
 
         Parameters
         ----------
@@ -223,5 +261,97 @@ class PSNResource(dg.ConfigurableResource):
         >>> game_info = psn_resource.get_game_details("CUSA00572_00")
         >>> print(f"Game: {game_info[0]['name']}, Genres: {game_info[0]['genres']}")
         """
+        with self._lock:
+            if not self._cache_loaded:
+                self._load_game_details_cache()
+            cached = self._game_details_cache.get(title_id)
+
+        if cached is not None:
+            # Copied so callers can annotate the result without touching the cache
+            return copy.deepcopy(cached["details"])
+
         client = self.get_client()
-        return client.game_title(title_id=title_id).get_details()
+        details = client.game_title(title_id=title_id).get_details()
+
+        # The API call runs outside the lock so lookups for different titles overlap
+        cached_at = datetime.now(UTC)
+        with self._lock:
+            self._game_details_cache[title_id] = {
+                "details": details,
+                "cached_at": cached_at.isoformat(),
+                "expires_at": (cached_at + timedelta(days=self.cache_ttl_days)).isoformat(),
+            }
+        return copy.deepcopy(details)
+
+    def _get_cache_path(self) -> str:
+        """
+        Build the full path of the persistent game details cache.
+
+        Returns
+        -------
+        str
+            S3 URI of the cache file
+        """
+        return f"s3://{self.s3_bucket}/{self.s3_cache_location}"
+
+    def _load_game_details_cache(self) -> None:
+        """
+        Load the persistent game details cache, dropping expired entries.
+
+        Does nothing beyond marking the cache as loaded when no S3 bucket is configured.
+        A missing or unreadable cache file starts an empty cache.
+        """
+        if self._cache_loaded:
+            return
+        self._cache_loaded = True
+
+        if not self.s3_bucket:
+            return
+
+        cache_path = self._get_cache_path()
+        try:
+            if self._filesystem is None:
+                storage_options = get_aws_storage_options(return_credential_type=AWSCredentialFormat.UTILIZE_ENV_VARS)
+                self._filesystem = fsspec.filesystem("s3", **storage_options)
+
+            if not self._filesystem.exists(cache_path):
+                logger.info(f"Cache file does not exist at {cache_path}, starting with empty cache")
+                return
+
+            with self._filesystem.open(cache_path, "r") as f:
+                cache_data = json.load(f)
+
+            current_time = datetime.now(UTC)
+            self._game_details_cache = {
+                title_id: entry
+                for title_id, entry in cache_data.items()
+                if datetime.fromisoformat(entry["expires_at"]) > current_time
+            }
+            logger.info(f"Loaded {len(self._game_details_cache)} valid cached game details from {cache_path}")
+
+        except Exception:  # noqa: BLE001
+            logger.exception(f"Error loading cache from {cache_path}")
+            self._game_details_cache = {}
+
+    def save_game_details_cache(self) -> None:
+        """
+        Persist the game details cache to S3.
+
+        Does nothing when no S3 bucket is configured. Failures are logged rather than raised,
+        since losing the cache only costs extra API calls on the next run.
+
+        Examples
+        --------
+        >>> details = [psn_resource.get_game_details(title_id) for title_id in title_ids]
+        >>> psn_resource.save_game_details_cache()
+        """
+        if not self.s3_bucket or self._filesystem is None:
+            return
+
+        cache_path = self._get_cache_path()
+        try:
+            with self._lock, self._filesystem.open(cache_path, "w") as f:
+                json.dump(self._game_details_cache, f)
+            logger.info(f"Saved {len(self._game_details_cache)} cached game details to {cache_path}")
+        except Exception:  # noqa: BLE001
+            logger.exception(f"Error saving cache to {cache_path}")
@@ -0,0 +1,189 @@
+"""Unit tests for PlayStation Network silver assets."""
+
+import datetime
+import hashlib
+import time
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import MagicMock, patch
+
+import dagster as dg
+import polars as pl
+
+from src.assets.entertainment.playstation import (
+    psn_game_details_bronze,
+    psn_game_play_history_silver,
+    psn_profile_silver,
+)
+from src.resources.psn_resource import PSNResource
+
+
+def _game_details(title_id: str) -> dict:
+    """
+    Build a minimal PSN game details payload.
+
+    Parameters
+    ----------
+    title_id : str
+        Title the details belong to.
+
+    Returns
+    -------
+    dict
+        Game details shaped like the PSN Title Search API response.
+    """
+    return {
+        "title_id": title_id,
+        "country": "US",
+        "defaultProduct": {
+            "minimumAge": 18,
+            "contentRating": {"name": "M"},
+            "isBestSelling": True,
+            "genres": ["Action", "Adventure"],
+            "releaseDate": "2025-01-15T00:00:00Z",
+            "leadPublisherName": "Publisher X",
+        },
+        "starRating": {"score": 4.5},
+    }
+
+
+def test_psn_game_play_history_silver() -> None:
+    """Test title stats are joined with game details and typed."""
+    title_stats = [
+        {
+            "title_id": "CUSA12345",
+            "name": "Game A",
+            "play_count": 10,
+            "first_played_date_time": "2025-05-01T12:00:00+00:00",
+            "last_played_date_time": "2025-05-10T15:30:00+00:00",
+            "play_duration": 3600.0,
+        },
+        {
+            "title_id": "CUSA67890",
+            "name": "Game B",
+            "play_count": 1,
+            "first_played_date_time": "2025-05-11T08:00:00+00:00",
+            "last_played_date_time": "2025-05-11T09:00:00+00:00",
+            "play_duration": 60.0,
+        },
+    ]
+    # Details come back in a different order than the stats
+    game_details = [_game_details("CUSA67890"), _game_details("CUSA12345")]
+
+    with dg.build_asset_context(partition_key="2025-05-15") as context:
+        result = psn_game_play_history_silver(
+            context=context, psn_title_stats_bronze=title_stats, psn_game_details_bronze=game_details
+        ).sort("title_id")
+
+    assert result.shape == (2, 16)
+    assert result["title_name"].to_list() == ["Game A", "Game B"]
+    assert result["content_rating"].to_list() == ["M", "M"]
+    assert result["genres"].to_list() == [["Action", "Adventure"], ["Action", "Adventure"]]
+    assert result["game_release_date"].to_list() == [datetime.date(2025, 1, 15)] * 2
+    assert result["first_played_date_time"].dtype == pl.Datetime(time_unit="us", time_zone="UTC")
+    assert result["last_played_date_time"][0] == datetime.datetime(2025, 5, 10, 15, 30, tzinfo=datetime.UTC)
+    assert result["play_duration_in_seconds"].to_list() == [3600.0, 60.0]
+    assert result["processed_date"].to_list() == [datetime.date(2025, 5, 15)] * 2
+    # The ids are merge keys, so they must stay the md5 digests earlier runs wrote
+    assert result["play_history_id"][0] == hashlib.md5(b"2025-05-15_CUSA12345").hexdigest()  # noqa: S324
+    assert result["play_history_id"].n_unique() == 2
+
+
+def test_psn_game_play_history_silver_empty() -> None:
+    """Test an empty title stats payload returns an empty DataFrame with the schema."""
+    with dg.build_asset_context(partition_key="2025-05-15") as context:
+        result = psn_game_play_history_silver(context=context, psn_title_stats_bronze=[], psn_game_details_bronze=[])
+
+    assert result.is_empty()
+    assert result.width == 16
+
+
+def test_psn_profile_silver() -> None:
+    """Test profile data is flattened into a single row."""
+    profile = {
+        "profile": {
+            "accountId": "1234",
+            "onlineId": "player_one",
+            "trophySummary": {
+                "level": 300,
+                "progress": 42,
+                "earnedTrophies": {"platinum": 1, "gold": 2, "silver": 3, "bronze": 4},
+            },
+        }
+    }
+
+    with dg.build_asset_context(partition_key="2025-05-15") as context:
+        result = psn_profile_silver(context=context, psn_profile_bronze=[profile])
+
+    assert result.shape == (1, 10)
+    row = result.row(0, named=True)
+    assert row["profile_id"] == hashlib.md5(b"2025-05-15_1234").hexdigest()  # noqa: S324
+    assert row["online_id"] == "player_one"
+    assert row["trophy_level"] == 300
+    assert row["bronze_trophies"] == 4
+    assert row["processed_date"] == datetime.date(2025, 5, 15)
+
+
+class MockPSNResource(PSNResource):
+    """Mock PSNResource returning canned game details."""
+
+    def setup_for_execution(self, context: dg.InitResourceContext) -> None:
+        """Override to avoid real client initialization."""
+
+    def get_client(self) -> MagicMock:
+        """Mock behavior for get_client."""
+        return MagicMock()
+
+    def get_game_details(self, title_id: str) -> list[dict]:
+        """Mock behavior for get_game_details."""
+        return [{"name": "stale"}, {"name": f"Game {title_id}"}]
+
+
+def test_psn_game_details_bronze() -> None:
+    """Test game details are fetched once per unique title and tagged with the title_id."""
+    psn_resource = MockPSNResource(refresh_token="test-token")  # noqa: S106
+    title_stats = [{"title_id": "CUSA1"}, {"title_id": "CUSA2"}, {"title_id": "CUSA1"}]
+
+    result = psn_game_details_bronze(psn_title_stats_bronze=title_stats, psn_resource=psn_resource)
+
+    assert result == [
+        {"name": "Game CUSA1", "title_id": "CUSA1"},
+        {"name": "Game CUSA2", "title_id": "CUSA2"},
+    ]
+
+
+def test_psn_resource_caches_game_details() -> None:
+    """Test repeated game details lookups are served from the cache."""
+    psn_resource = PSNResource(refresh_token="test-token")  # noqa: S106
+    client = MagicMock()
+    client.game_title.return_value.get_details.return_value = [{"name": "Game A"}]
+    psn_resource._client = client
+
+    first = psn_resource.get_game_details("CUSA1")
+    first[-1]["title_id"] = "CUSA1"
+    second = psn_resource.get_game_details("CUSA1")
+
+    client.game_title.assert_called_once_with(title_id="CUSA1")
+    assert second == [{"name": "Game A"}]
+
+
+def test_psn_resource_initializes_client_once_across_threads() -> None:
+    """Test concurrent game details lookups share one client and record every title in the cache."""
+    psn_resource = PSNResource(refresh_token="test-token")  # noqa: S106
+    client = MagicMock()
+    client.game_title.side_effect = lambda title_id: MagicMock(get_details=MagicMock(return_value=[{"id": title_id}]))
+
+    def _slow_client(_refresh_token: str) -> MagicMock:
+        # Widen the window in which an unguarded initialization would run twice
+        time.sleep(0.05)
+        return client
+
+    title_ids = [f"CUSA{i}" for i in range(16)]
+    with (
+        patch("src.resources.psn_resource.PSNAWP", side_effect=_slow_client) as mock_psnawp,
+        ThreadPoolExecutor(max_workers=8) as executor,
+    ):
+        results = list(executor.map(psn_resource.get_game_details, title_ids))
+
+    mock_psnawp.assert_called_once_with("test-token")
+    assert results == [[{"id": title_id}] for title_id in title_ids]
+    assert set(psn_resource._game_details_cache) == set(title_ids)
@@ -2,28 +2,32 @@
 
 import datetime
 
+import dagster as dg
+import polars as pl
+
 from src.assets.entertainment.spotify_play_history import (
-    _extract_and_hash_play_history_id,  # noqa: PLC2701
-    _parse_raw_spotify_item,  # noqa: PLC2701
+    _parse_raw_spotify_items,  # noqa: PLC2701
+    spotify_play_history_silver,
 )
 
 
-def test_extract_and_hash_play_history_id() -> None:
-    """Test generating a unique play history ID."""
-    played_at = "2024-05-20T12:00:00Z"
-    song_id = "test_song_id"
-    expected_hash = "66e54dad71cafbf495827f0e83106529"
-
-    result = _extract_and_hash_play_history_id(played_at, song_id)
-    assert result == expected_hash
-    assert isinstance(result, str)
+def _raw_item(played_at: str, song_id: str) -> dict:
+    """
+    Build a raw Spotify play history item.
 
+    Parameters
+    ----------
+    played_at : str
+        Timestamp when the song was played.
+    song_id : str
+        Spotify ID of the song.
 
-def test_parse_raw_spotify_item() -> None:
-    """Test parsing a raw Spotify play history item."""
-    played_at = "2024-05-20T12:00:00.000Z"
-    song_id = "test_song_id"
-    mock_item = {
+    Returns
+    -------
+    dict
+        Item shaped like the Spotify recently-played API response.
+    """
+    return {
         "played_at": played_at,
         "track": {
             "id": song_id,
@@ -42,20 +46,53 @@ def test_parse_raw_spotify_item() -> None:
         },
     }
 
-    result = _parse_raw_spotify_item(mock_item)
-
-    assert result["play_history_id"] == _extract_and_hash_play_history_id(played_at, song_id)
-    assert result["played_at"] == played_at
-    assert result["played_date"] == datetime.date(2024, 5, 20)
-    assert result["duration_seconds"] == 180.0
-    assert result["duration_ms"] == 180000
-    assert result["artist_names"] == ["Test Artist"]
-    assert result["song_id"] == song_id
-    assert result["song_name"] == "Test Song"
-    assert result["album_name"] == "Test Album"
-    assert result["popularity_points_by_spotify"] == 85
-    assert result["is_explicit"] is False
-    assert result["song_release_date"] == "2024-01-01"
-    assert result["no_of_available_markets"] == 2
-    assert result["album_type"] == "album"
-    assert result["total_tracks"] == 10
+
+def test_play_history_id_hash() -> None:
+    """Test play history IDs are md5 digests of played_at and song_id."""
+    bronze = [{"items": [_raw_item("2024-05-20T12:00:00Z", "test_song_id")]}]
+
+    with dg.build_asset_context(partition_key="2024-05-20") as context:
+        result = spotify_play_history_silver(context=context, spotify_play_history_bronze=bronze)
+
+    assert result["play_history_id"].to_list() == ["66e54dad71cafbf495827f0e83106529"]
+
+
+def test_parse_raw_spotify_items() -> None:
+    """Test parsing raw Spotify play history items into columns."""
+    played_at = "2024-05-20T12:00:00.000Z"
+    song_id = "test_song_id"
+    mock_item = _raw_item(played_at, song_id)
+
+    result = _parse_raw_spotify_items([mock_item])
+
+    assert "play_history_id" not in result
+    assert result["played_at"] == [played_at]
+    assert "played_date" not in result
+    assert result["duration_seconds"] == [180.0]
+    assert result["duration_ms"] == [180000]
+    assert result["artist_names"] == [["Test Artist"]]
+    assert result["song_id"] == [song_id]
+    assert result["song_name"] == ["Test Song"]
+    assert result["album_name"] == ["Test Album"]
+    assert result["popularity_points_by_spotify"] == [85]
+    assert result["is_explicit"] == [False]
+    assert result["song_release_date"] == ["2024-01-01"]
+    assert result["no_of_available_markets"] == [2]
+    assert result["album_type"] == ["album"]
+    assert result["total_tracks"] == [10]
+
+
+def test_spotify_play_history_silver() -> None:
+    """Test play history items are typed and duplicates across responses are dropped."""
+    first = _raw_item("2024-05-20T12:00:00.000Z", "song_a")
+    second = _raw_item("2024-05-20T12:05:00.000Z", "song_b")
+    bronze = [{"items": [first, second]}, {"items": [first]}]
+
+    with dg.build_asset_context(partition_key="2024-05-20") as context:
+        result = spotify_play_history_silver(context=context, spotify_play_history_bronze=bronze).sort("played_at")
+
+    assert result.shape == (2, 15)
+    assert result["song_id"].to_list() == ["song_a", "song_b"]
+    assert result["artist_names"].dtype == pl.List(pl.Utf8)
+    assert result["played_at"].dtype == pl.Datetime(time_unit="us")
+    assert result["played_date"].to_list() == [datetime.date(2024, 5, 20)] * 2
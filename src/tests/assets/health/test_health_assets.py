@@ -1,5 +1,6 @@
 """Unit tests for Health assets."""
 
+import hashlib
 from unittest.mock import MagicMock, patch
 
 import dagster as dg
@@ -8,7 +9,6 @@ import pytest
 
 from src.assets.health.health_assets import (
     HEALTH_CSV_SCHEMA,
-    extract_csv_from_multipart,
     health_silver,
     load_bronze_csv_files,
     rename_columns,
@@ -43,21 +43,6 @@ def mock_load_csv() -> MagicMock:
         yield mock
 
 
-def test_extract_csv_from_multipart() -> None:
-    """Test extracting CSV from iOS multipart payload."""
-    raw_payload = (
-        "--Boundary-123\n"
-        "Content-Disposition: form-data\n"
-        "Content-Type: text/csv\n"
-        "\n"
-        "Date/Time,Active Energy (kcal),Apple Exercise Time (min)\n"
-        "2026-02-16 12:00:00,10.5,\n"
-        "--Boundary-123--\n"
-    )
-    result = extract_csv_from_multipart(raw_payload)
-    assert result == "Date/Time,Active Energy (kcal),Apple Exercise Time (min)\n2026-02-16 12:00:00,10.5,"
-
-
 def test_rename_columns() -> None:
     """Test column renaming logic."""
     cols = ["Date/Time", "Active Energy (kcal)", "Running Speed (mi/hr)"]
@@ -82,8 +67,10 @@ def test_health_silver(mock_get_storage_path: MagicMock, mock_load_csv: MagicMoc
         "Running Speed (mi/hr),Step Count (steps),Walking Speed (mi/hr),Walking Step Length (in)"
     )
     mock_load_csv.return_value = [
-        f"{header}\n2026-02-16 12:00:00,15.5,,,,,,,,,,,,,,,,,,,,,,,\n2026-02-16 13:00:00,20.0,,,,,,,,,,,,,,,,,,,,,,,",
-        f"{header}\n2026-02-16 12:00:00,15.5,,,,,,,,,,,,,,,,,,,,,,,",  # duplicate
+        (
+            f"{header}\n2026-02-16 12:00:00,15.5,,,,,,,,,,,,,,,,,,,,,,,\n2026-02-16 13:00:00,20.0,,,,,,,,,,,,,,,,,,,,,,,"
+        ).encode(),
+        f"{header}\n2026-02-16 12:00:00,15.5,,,,,,,,,,,,,,,,,,,,,,,".encode(),  # duplicate
     ]
 
     with dg.build_asset_context(partition_key="2026-02-16") as context:
@@ -97,6 +84,39 @@ def test_health_silver(mock_get_storage_path: MagicMock, mock_load_csv: MagicMoc
     rows = health_df.to_dicts()
     assert rows[0]["active_energy_kcal"] == 15.5
     assert rows[0]["activity_date"] == "2026-02-16"
+    # The id is the merge key across uploads, so it must stay the md5 of the timestamp
+    assert rows[0]["health_activity_id"] == hashlib.md5(b"2026-02-16 12:00:00").hexdigest()  # noqa: S324
+
+
+def test_health_silver_malformed_datetime(mock_get_storage_path: MagicMock, mock_load_csv: MagicMock) -> None:
+    """Test rows with timestamps outside the export format are dropped rather than failing the asset."""
+    mock_get_storage_path.return_value = "dummy/path"
+    padding = "," * (len(HEALTH_CSV_SCHEMA) - 2)
+    mock_load_csv.return_value = [
+        f"{','.join(HEALTH_CSV_SCHEMA)}\n2026-02-16 12:00:00,15.5{padding}\n16/02/2026 13:00,20.0{padding}".encode()
+    ]
+
+    with dg.build_asset_context(partition_key="2026-02-16") as context:
+        health_df = health_silver(context=context)
+
+    assert health_df["active_energy_kcal"].to_list() == [15.5]
+
+
+def test_health_silver_mixed_headers(mock_get_storage_path: MagicMock, mock_load_csv: MagicMock) -> None:
+    """Test exports with different metric columns are combined, with missing metrics left null."""
+    mock_get_storage_path.return_value = "dummy/path"
+    full_header = ",".join(HEALTH_CSV_SCHEMA)
+    padding = "," * (len(HEALTH_CSV_SCHEMA) - 2)
+    mock_load_csv.return_value = [
+        f"{full_header}\n2026-02-16 12:00:00,15.5{padding}".encode(),
+        b"Date/Time,Active Energy (kcal)\n2026-02-16 13:00:00,20.0",
+    ]
+
+    with dg.build_asset_context(partition_key="2026-02-16") as context:
+        health_df = health_silver(context=context)
+
+    assert health_df.height == 2
+    assert health_df["step_count_steps"].null_count() == 2
 
 
 def test_health_silver_empty_data(mock_get_storage_path: MagicMock, mock_load_csv: MagicMock) -> None:
@@ -119,12 +139,12 @@ def test_health_silver_read_csv_errors(
     mock_get_storage_path.return_value = "dummy/path"
 
     # 1 valid, 1 compute error, 1 general error, 1 empty clean_csv
-    valid_csv = "Date/Time,Active Energy (kcal)\n2026-02-16 12:00:00,15.5"
+    valid_csv = b"Date/Time,Active Energy (kcal)\n2026-02-16 12:00:00,15.5"
     mock_load_csv.return_value = [
-        "Date/Time,Active Energy (kcal)\n2026-02-16 12:00:00,10.0",  # Trigger compute error
-        "Date/Time,Active Energy (kcal)\n2026-02-16 13:00:00,20.0",  # Trigger exception
+        b"Date/Time,Active Energy (kcal)\n2026-02-16 12:00:00,10.0",  # Trigger compute error
+        b"Date/Time,Active Energy (kcal)\n2026-02-16 13:00:00,20.0",  # Trigger exception
         valid_csv,  # Valid
-        "No,Valid,Headers",  # Empty clean CSV after extraction
+        b"No,Valid,Headers",  # Empty clean CSV after extraction
     ]
 
     valid_dicts = {k: [None] for k in HEALTH_CSV_SCHEMA}
@@ -144,8 +164,8 @@ def test_health_silver_read_csv_errors(
     assert health_df.height == 1
 
 
-@patch("src.assets.health.health_assets.get_aws_storage_options")
-@patch("src.assets.health.health_assets.fsspec.filesystem")
+@patch("src.utils.data_loaders.get_aws_storage_options")
+@patch("src.utils.data_loaders.fsspec.filesystem")
 def test_load_bronze_csv_files(mock_filesystem: MagicMock, mock_aws: MagicMock) -> None:
     """Test the load_bronze_csv_files utility under various conditions."""
     mock_fs = MagicMock()
@@ -153,25 +173,28 @@ def test_load_bronze_csv_files(mock_filesystem: MagicMock, mock_aws: MagicMock)
 
     with dg.build_asset_context(partition_key="2026-02-16") as context:
         mock_aws.return_value = {}
-        mock_fs.exists.return_value = False
+        # Test 1: Missing path lists nothing
+        mock_fs.find.return_value = []
         assert load_bronze_csv_files(context, "s3://dummy/path") == []
 
-        # Test 2: Glob raises exception
-        mock_fs.exists.return_value = True
-        mock_fs.glob.side_effect = Exception("Glob Error")
+        # Test 2: Listing raises exception
+        mock_fs.find.side_effect = Exception("List Error")
         assert load_bronze_csv_files(context, "s3://dummy/path") == []
 
-        # Test 3: fs.open raises exception for one file, succeeds for another
-        mock_fs.glob.side_effect = None
-        mock_fs.glob.return_value = ["file1.csv", "file2.csv"]
+        # Test 3: fs.open raises exception for one file, succeeds for another; non-CSV entries are ignored
+        mock_fs.find.side_effect = None
+        mock_fs.find.return_value = ["file1.csv", "file2.csv", "notes.txt"]
 
         mock_file_1 = MagicMock()
-        mock_file_1.__enter__.return_value.read.return_value = "csv_data_1"
+        mock_file_1.__enter__.return_value.read.return_value = b"csv_data_1"
 
         mock_file_2 = MagicMock()
         mock_file_2.__enter__.side_effect = Exception("Read Error")
 
-        mock_fs.open.side_effect = [mock_file_1, mock_file_2]
+        # Files are read concurrently, so resolve the mock by path rather than by call order
+        mock_fs.open.side_effect = lambda file_path, _mode: {"file1.csv": mock_file_1, "file2.csv": mock_file_2}[
+            file_path
+        ]
 
         result = load_bronze_csv_files(context, "s3://dummy/path")
-        assert result == ["csv_data_1"]
+        assert result == [b"csv_data_1"]
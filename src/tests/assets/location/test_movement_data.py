@@ -117,12 +117,40 @@ def test_transform_geojson_to_records(raw_geojson_data: list[dict], mock_log: Ma
     result = transform_geojson_to_records(raw_geojson_data, mock_log)
 
     assert len(result) == 1
-    record = result[0]
+    record = result.row(0, named=True)
     assert record["latitude"] == 37.7749
     assert record["longitude"] == -122.4194
     assert record["speed"] == 5.5
     assert record["motion"] == "walking"
     assert record["device_id"] == "test_device"
+    # Properties missing from the payload fall back to their defaults
+    assert record["course"] == -1
+    assert record["wifi"] == ""
+
+
+def test_transform_geojson_to_records_motion_formats(mock_log: MagicMock) -> None:
+    """Test motion is joined whether it arrives as a list or a plain string."""
+    raw_data = [
+        {"geometry": {"coordinates": [1.0, 2.0]}, "properties": {"timestamp": "t1", "motion": ["walking", "running"]}},
+        {"geometry": {"coordinates": [1.0, 2.0]}, "properties": {"timestamp": "t2", "motion": "driving"}},
+    ]
+    result = transform_geojson_to_records(raw_data, mock_log)
+
+    assert result["motion"].to_list() == ["walking,running", "driving"]
+
+
+def test_transform_geojson_to_records_property_key_collision(mock_log: MagicMock) -> None:
+    """Test properties named like top-level feature keys do not collide with them."""
+    raw_data = [
+        {
+            "type": "Feature",
+            "geometry": {"type": "Point", "coordinates": [1.0, 2.0]},
+            "properties": {"timestamp": "t1", "type": "visit", "geometry": "ignored", "speed": 3.0},
+        }
+    ]
+    result = transform_geojson_to_records(raw_data, mock_log)
+
+    assert result.select("timestamp", "latitude", "longitude", "speed").rows() == [("t1", 2.0, 1.0, 3.0)]
 
 
 def test_transform_geojson_to_records_invalid_coords(mock_log: MagicMock) -> None:
@@ -157,7 +185,7 @@ def test_clean_location_dataframe() -> None:
         }
     ]
 
-    location_df = clean_location_dataframe(records)
+    location_df = clean_location_dataframe(pl.DataFrame(records))
 
     assert len(location_df) == 1
     assert location_df["latitude"][0] == 37.7749
@@ -211,14 +239,14 @@ def test_clean_location_dataframe_invalid_coords() -> None:
         },  # Null lat
     ]
 
-    location_df = clean_location_dataframe(records)
+    location_df = clean_location_dataframe(pl.DataFrame(records))
 
     assert len(location_df) == 0
 
 
 def test_clean_location_dataframe_empty() -> None:
     """Test handling of empty records in DataFrame."""
-    location_df = clean_location_dataframe([])
+    location_df = clean_location_dataframe(pl.DataFrame())
     assert len(location_df) == 0
     assert "timestamp" in location_df.columns
     assert "device_id" in location_df.columns
@@ -262,18 +290,18 @@ def test_load_raw_location_data_read_error(mock_log: MagicMock) -> None:
 
 
 def test_transform_geojson_to_records_process_error(mock_log: MagicMock) -> None:
-    """Test handling of general processing errors in GeoJSON transformation."""
-    invalid_data = [None]
+    """Test empty records are skipped during GeoJSON transformation."""
+    invalid_data = [None, {"geometry": {"coordinates": [1.0, 2.0]}, "properties": {"timestamp": "t"}}]
     result = transform_geojson_to_records(invalid_data, mock_log)
 
-    assert len(result) == 0
-    mock_log.exception.assert_called_with("Failed to process location record")
+    assert len(result) == 1
+    mock_log.warning.assert_called_with("Skipped 1 empty location records")
 
 
 def test_fetch_bronze_location_data_not_exists(mock_context: MagicMock, mock_env: None) -> None:
     """Test fetch_bronze_location_data when path does not exist."""
     with MagicMock() as mock_fs:
-        mock_fs.exists.return_value = False
+        mock_fs.ls.side_effect = FileNotFoundError("/dummy/path")
         with pytest.MonkeyPatch.context() as mp:
             mp.setattr("fsspec.filesystem", lambda *args, **kwargs: mock_fs)
             result = fetch_bronze_location_data(mock_context, "/dummy/path")
@@ -282,11 +310,10 @@ def test_fetch_bronze_location_data_not_exists(mock_context: MagicMock, mock_env
     mock_context.log.warning.assert_called()
 
 
-def test_fetch_bronze_location_data_glob_error(mock_context: MagicMock, mock_env: None) -> None:
-    """Test fetch_bronze_location_data when glob fails."""
+def test_fetch_bronze_location_data_list_error(mock_context: MagicMock, mock_env: None) -> None:
+    """Test fetch_bronze_location_data when listing the partition fails."""
     with MagicMock() as mock_fs:
-        mock_fs.exists.return_value = True
-        mock_fs.glob.side_effect = Exception("Glob failed")
+        mock_fs.ls.side_effect = Exception("List failed")
         with pytest.MonkeyPatch.context() as mp:
             mp.setattr("fsspec.filesystem", lambda *args, **kwargs: mock_fs)
             result = fetch_bronze_location_data(mock_context, "/dummy/path")
@@ -298,8 +325,7 @@ def test_fetch_bronze_location_data_glob_error(mock_context: MagicMock, mock_env
 def test_fetch_bronze_location_data_no_files(mock_context: MagicMock, mock_env: None) -> None:
     """Test fetch_bronze_location_data when no JSON files found."""
     with MagicMock() as mock_fs:
-        mock_fs.exists.return_value = True
-        mock_fs.glob.return_value = []
+        mock_fs.ls.return_value = ["/dummy/path/notes.txt"]
         with pytest.MonkeyPatch.context() as mp:
             mp.setattr("fsspec.filesystem", lambda *args, **kwargs: mock_fs)
             result = fetch_bronze_location_data(mock_context, "/dummy/path")
@@ -335,7 +361,24 @@ def test_location_data_silver_no_records_after_transform(
     with pytest.MonkeyPatch.context() as mp:
         mp.setattr("src.assets.location.movement_data.get_storage_path", lambda **kwargs: "/dummy/path")
         mp.setattr("src.assets.location.movement_data.fetch_bronze_location_data", lambda *args: [{"raw": "data"}])
-        mp.setattr("src.assets.location.movement_data.transform_geojson_to_records", lambda *args: [])
+        mp.setattr("src.assets.location.movement_data.transform_geojson_to_records", lambda *args: pl.DataFrame())
         result = location_data_silver(context, mock_geo_encoder)
 
     assert len(result) == 0
+
+
+def test_geo_encoder_reuses_locations_geocoded_in_the_same_batch() -> None:
+    """Test coordinates in a cell geocoded earlier in the batch are served from the cache."""
+    geo_encoder = GeoEncoderResource(google_maps_api_key="test_key", s3_bucket="test_bucket")
+    client = MagicMock()
+    client.reverse_geocode.return_value = [{"formatted_address": "1 Market St", "place_id": "abc"}]
+    geo_encoder._google_api_client = client
+    geo_encoder._filesystem = MagicMock()
+
+    # Both points are a few meters apart and fall into the same geohash cell
+    location_df = pl.DataFrame({"latitude": [37.77490, 37.77491], "longitude": [-122.41940, -122.41941]})
+    result = geo_encoder.enrich_dataframe(location_df)
+
+    client.reverse_geocode.assert_called_once()
+    geo_encoder._filesystem.open.assert_called_once()
+    assert result["formatted_address"].to_list() == ["1 Market St", "1 Market St"]
@@ -1,5 +1,6 @@
 """Unit tests for Screen Time assets."""
 
+import hashlib
 from datetime import UTC
 from unittest.mock import MagicMock, patch
 
@@ -8,8 +9,10 @@ import polars as pl
 import pytest
 
 from src.assets.screen_time.screen_time_assets import (
+    _parse_updated_at_series,  # noqa: PLC2701
     _process_iphone_records,  # noqa: PLC2701
     _process_mac_records,  # noqa: PLC2701
+    load_bronze_json_files,
     parse_updated_at,
     screen_time_iphone,
     screen_time_mac,
@@ -63,6 +66,35 @@ def test_parse_updated_at() -> None:
     assert dt_iso.month == 2
 
 
+@pytest.mark.parametrize(
+    ("date_str", "expected_hour"),
+    [("Feb 16, 2026 at 12:05 AM", 0), ("Feb 16, 2026 at 12:05 PM", 12), ("Feb 16, 2026 9:05 AM", 9)],
+)
+def test_parse_updated_at_meridiem(date_str: str, expected_hour: int) -> None:
+    """Test 12-hour clock conversion, with and without the "at" separator."""
+    assert parse_updated_at(date_str).hour == expected_hour
+
+
+@pytest.mark.parametrize(
+    "date_str", ["Foo 16, 2026 at 6:57 PM", "Feb 16, 2026 at 13:57 PM", "Feb 30, 2026 at 6:57 PM", "2026-02-30", ""]
+)
+def test_parse_updated_at_invalid(date_str: str) -> None:
+    """Test unparseable timestamps raise a ValueError."""
+    with pytest.raises(ValueError, match="Could not parse date"):
+        parse_updated_at(date_str)
+
+
+def test_parse_updated_at_series() -> None:
+    """Test the column parser matches parse_updated_at for Shortcut and ISO values."""
+    values = pl.Series(["Feb 16, 2026 at 6:57 PM", "2026-02-16T18:57:00+00:00", "garbage", None])
+
+    result = _parse_updated_at_series(values)
+
+    assert result.dtype == pl.Datetime(time_unit="us", time_zone="UTC")
+    assert result.to_list()[:2] == [parse_updated_at(values[0]), parse_updated_at(values[1])]
+    assert result.to_list()[2:] == [None, None]
+
+
 def test_process_iphone_records() -> None:
     """Test _process_iphone_records helper function logic."""
     context = MagicMock()
@@ -74,15 +106,33 @@ def test_process_iphone_records() -> None:
             "device_name": "My iPhone",
         },
         # Missing usage_date, should be derived from updated_at
+        {"device_id": "iphone1", "updated_at": "yesterday", "usage_seconds": 10},
     ]
 
     results = _process_iphone_records(context, raw_data)
 
     assert len(results) == 1
-    assert results[0]["usage_date"] == "2026-02-16"
-    assert results[0]["total_usage_seconds"] == 3600
-    assert results[0]["device_type"] == "iphone"
-    assert results[0]["id"] is not None
+    context.log.warning.assert_called_once_with("Skipping 1 iPhone records with an unparseable updated_at")
+    row = results.row(0, named=True)
+    assert row["usage_date"] == "2026-02-16"
+    assert row["total_usage_seconds"] == 3600
+    assert row["device_type"] == "iphone"
+    assert row["id"] == hashlib.md5(b"iphone1_2026-02-16").hexdigest()  # noqa: S324
+
+
+def test_process_iphone_records_skips_missing_device_id() -> None:
+    """Test records without a device_id are skipped rather than given a null id."""
+    context = MagicMock()
+    raw_data = [
+        {"device_id": "iphone1", "updated_at": "Feb 16, 2026 at 6:00 PM", "usage_seconds": 5},
+        {"updated_at": "Feb 16, 2026 at 7:00 PM", "usage_seconds": 10},
+    ]
+
+    results = _process_iphone_records(context, raw_data)
+
+    assert results["device_id"].to_list() == ["iphone1"]
+    assert results["id"].null_count() == 0
+    context.log.warning.assert_called_once_with("Skipping 1 iPhone records without a device_id")
 
 
 def test_process_mac_records() -> None:
@@ -109,8 +159,66 @@ def test_process_mac_records() -> None:
     results = _process_mac_records(context, raw_data)
 
     assert len(results) == 1
-    assert results[0]["total_usage_seconds"] == 120  # Should keep the one from 8:00 PM
-    assert results[0]["device_type"] == "mac"
+    row = results.row(0, named=True)
+    assert row["total_usage_seconds"] == 120  # Should keep the one from 8:00 PM
+    assert row["device_type"] == "mac"
+    assert row["app_name"] == "Safari"
+    assert row["id"] == hashlib.md5(b"mac1_2026-02-16_com.apple.Safari").hexdigest()  # noqa: S324
+
+
+def test_process_mac_records_skips_bad_reports() -> None:
+    """Test reports with an unparseable updated_at and apps without a bundle_id are skipped."""
+    context = MagicMock()
+    raw_data = [
+        {
+            "device_id": "mac1",
+            "usage_date": "2026-02-16",
+            "updated_at": "not a date",
+            "data": [{"bundle_id": "com.apple.Safari", "total_usage_seconds": 120}],
+        },
+        {
+            "device_id": "mac1",
+            "usage_date": "2026-02-17",
+            "updated_at": "Feb 17, 2026 at 8:00 PM",
+            "data": [{"bundle_id": "com.apple.Mail", "total_usage_seconds": 30.7}, {"total_usage_seconds": 5}],
+        },
+    ]
+
+    results = _process_mac_records(context, raw_data)
+
+    assert results["bundle_id"].to_list() == ["com.apple.Mail"]
+    assert results["total_usage_seconds"].to_list() == [30]
+    context.log.warning.assert_called_once()
+
+
+def test_process_mac_records_skips_malformed_apps() -> None:
+    """Test malformed app entries and non-numeric usage only drop those apps, not the partition."""
+    context = MagicMock()
+    raw_data = [
+        {
+            "device_id": "mac1",
+            "usage_date": "2026-02-16",
+            "updated_at": "Feb 16, 2026 at 8:00 PM",
+            "data": [{"bundle_id": "com.apple.Safari", "total_usage_seconds": "12"}],
+        },
+        {
+            "device_id": "mac2",
+            "usage_date": "2026-02-16",
+            "updated_at": "Feb 16, 2026 at 9:00 PM",
+            "data": [
+                {"bundle_id": "com.apple.Mail", "total_usage_seconds": 12.5},
+                None,
+                "junk",
+                {"bundle_id": "com.apple.Notes", "total_usage_seconds": "n/a"},
+            ],
+        },
+    ]
+
+    results = _process_mac_records(context, raw_data).sort("bundle_id")
+
+    assert results["bundle_id"].to_list() == ["com.apple.Mail", "com.apple.Safari"]
+    assert results["total_usage_seconds"].to_list() == [12, 12]
+    assert context.log.warning.call_count == 2
 
 
 def test_screen_time_iphone(mock_get_storage_path: MagicMock, mock_load_json: MagicMock) -> None:
@@ -181,3 +289,28 @@ def test_screen_time_mac(mock_get_storage_path: MagicMock, mock_load_json: Magic
     chrome = mac_df.filter(pl.col("bundle_id") == "com.google.Chrome").to_dicts()[0]
     assert chrome["total_usage_seconds"] == 300
     assert chrome["app_name"] == "Chrome"
+
+
+@patch("src.utils.data_loaders.get_aws_storage_options")
+@patch("src.utils.data_loaders.fsspec.filesystem")
+def test_load_bronze_json_files(mock_filesystem: MagicMock, mock_aws: MagicMock) -> None:
+    """Test JSON reports are loaded concurrently and unreadable files are skipped."""
+    mock_aws.return_value = {}
+    mock_fs = MagicMock()
+    mock_filesystem.return_value = mock_fs
+    mock_fs.exists.return_value = True
+    mock_fs.glob.return_value = ["report1.json", "broken.json", "report2.json"]
+
+    def _open(file_path: str, _mode: str) -> MagicMock:
+        mock_file = MagicMock()
+        content = {"report1.json": b'{"device_id": "a"}', "report2.json": b'{"device_id": "b"}'}.get(file_path, b"{")
+        mock_file.__enter__.return_value.read.return_value = content
+        return mock_file
+
+    # Files are read concurrently, so resolve the content by path rather than by call order
+    mock_fs.open.side_effect = _open
+
+    with dg.build_asset_context(partition_key="2026-02-16") as context:
+        result = load_bronze_json_files(context, "s3://dummy/path")
+
+    assert result == [{"device_id": "a"}, {"device_id": "b"}]
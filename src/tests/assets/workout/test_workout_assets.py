@@ -1,5 +1,6 @@
 """Unit tests for Workout assets."""
 
+import hashlib
 from unittest.mock import MagicMock, patch
 
 import dagster as dg
@@ -8,7 +9,6 @@ import pytest
 
 from src.assets.workout.workout_assets import (
     WORKOUT_CSV_SCHEMA,
-    extract_csv_from_multipart,
     load_bronze_csv_files,
     rename_columns,
     workout_silver,
@@ -43,21 +43,6 @@ def mock_load_csv() -> MagicMock:
         yield mock
 
 
-def test_extract_csv_from_multipart() -> None:
-    """Test extracting CSV from iOS multipart payload."""
-    raw_payload = (
-        "--Boundary-123\n"
-        "Content-Disposition: form-data\n"
-        "Content-Type: text/csv\n"
-        "\n"
-        "Type,Start,End,Duration\n"
-        "Running,2026-02-16 12:00,2026-02-16 13:00,60:00\n"
-        "--Boundary-123--\n"
-    )
-    result = extract_csv_from_multipart(raw_payload)
-    assert result == "Type,Start,End,Duration\nRunning,2026-02-16 12:00,2026-02-16 13:00,60:00"
-
-
 def test_rename_columns() -> None:
     """Test column renaming logic."""
     cols = ["Type", "Start", "End", "Total Energy (kcal)"]
@@ -80,9 +65,11 @@ def test_workout_silver(mock_get_storage_path: MagicMock, mock_load_csv: MagicMo
         "Elevation Descended (m)"
     )
     mock_load_csv.return_value = [
-        f"{header}\nRunning,2026-02-16 12:00,2026-02-16 12:30,30:00"
-        ",,,,,,,,,,,,,\nWalking,2026-02-16 15:00,2026-02-16 15:15,15:00,,,,,,,,,,,,,",
-        f"{header}\nRunning,2026-02-16 12:00,2026-02-16 12:30,30:00,,,,,,,,,,,,,",  # duplicate
+        (
+            f"{header}\nRunning,2026-02-16 12:00,2026-02-16 12:30,30:00"
+            ",,,,,,,,,,,,,\nWalking,2026-02-16 15:00,2026-02-16 15:15,15:00,,,,,,,,,,,,,"
+        ).encode(),
+        f"{header}\nRunning,2026-02-16 12:00,2026-02-16 12:30,30:00,,,,,,,,,,,,,".encode(),  # duplicate
     ]
 
     with dg.build_asset_context(partition_key="2026-02-16") as context:
@@ -95,6 +82,28 @@ def test_workout_silver(mock_get_storage_path: MagicMock, mock_load_csv: MagicMo
     rows = workout_df.to_dicts()
     assert rows[0]["type"] == "Running"
     assert rows[0]["activity_date"] == "2026-02-16"
+    # The id is the merge key across uploads, so it must stay the md5 of the start time
+    assert rows[0]["workout_activity_id"] == hashlib.md5(b"2026-02-16 12:00:00").hexdigest()  # noqa: S324
+
+
+def test_workout_silver_datetime_formats(mock_get_storage_path: MagicMock, mock_load_csv: MagicMock) -> None:
+    """Test workout timestamps are parsed from every export format."""
+    mock_get_storage_path.return_value = "dummy/path"
+    header = ",".join(WORKOUT_CSV_SCHEMA)
+    padding = "," * (len(WORKOUT_CSV_SCHEMA) - 4)
+    mock_load_csv.return_value = [
+        (
+            f"{header}\nRunning,9/6/25 16:45,9/6/25 17:15,30:00{padding}\n"
+            f"Walking,9/7/2025 08:00,9/7/2025 08:20,20:00{padding}\n"
+            f"Cycling,2025-09-08 10:00:30,2025-09-08 11:00:30,60:00{padding}"
+        ).encode(),
+    ]
+
+    with dg.build_asset_context(partition_key="2025-09-06") as context:
+        workout_df = workout_silver(context=context)
+
+    assert workout_df["activity_date"].to_list() == ["2025-09-06", "2025-09-07", "2025-09-08"]
+    assert workout_df["end_pst"].dt.strftime("%H:%M:%S").to_list() == ["17:15:00", "08:20:00", "11:00:30"]
 
 
 def test_workout_silver_empty_data(mock_get_storage_path: MagicMock, mock_load_csv: MagicMock) -> None:
@@ -117,10 +126,10 @@ def test_workout_silver_read_csv_errors(
     mock_get_storage_path.return_value = "dummy/path"
 
     mock_load_csv.return_value = [
-        "Type,Start,End\nRunning,2026-02-16 12:00,2026-02-16 13:00",  # trigger compute error
-        "Type,Start,End\nWalking,2026-02-16 13:00,2026-02-16 14:00",  # trigger exception
-        "Type,Start,End\nSwimming,2026-02-16 14:00,2026-02-16 15:00",  # valid
-        "No,Valid,Headers",  # clean_csv empty
+        b"Type,Start,End\nRunning,2026-02-16 12:00,2026-02-16 13:00",  # trigger compute error
+        b"Type,Start,End\nWalking,2026-02-16 13:00,2026-02-16 14:00",  # trigger exception
+        b"Type,Start,End\nSwimming,2026-02-16 14:00,2026-02-16 15:00",  # valid
+        b"No,Valid,Headers",  # clean_csv empty
     ]
 
     valid_dicts = {k: [None] for k in WORKOUT_CSV_SCHEMA}
@@ -141,8 +150,8 @@ def test_workout_silver_read_csv_errors(
     assert workout_df.height == 1
 
 
-@patch("src.assets.workout.workout_assets.get_aws_storage_options")
-@patch("src.assets.workout.workout_assets.fsspec.filesystem")
+@patch("src.utils.data_loaders.get_aws_storage_options")
+@patch("src.utils.data_loaders.fsspec.filesystem")
 def test_load_bronze_csv_files(mock_filesystem: MagicMock, mock_aws: MagicMock) -> None:
     """Test the load_bronze_csv_files utility under various conditions."""
     mock_fs = MagicMock()
@@ -150,25 +159,28 @@ def test_load_bronze_csv_files(mock_filesystem: MagicMock, mock_aws: MagicMock)
 
     with dg.build_asset_context(partition_key="2026-02-16") as context:
         mock_aws.return_value = {}
-        mock_fs.exists.return_value = False
+        # Test 1: Missing path lists nothing
+        mock_fs.find.return_value = []
         assert load_bronze_csv_files(context, "s3://dummy/path") == []
 
-        # Test 2: Glob raises exception
-        mock_fs.exists.return_value = True
-        mock_fs.glob.side_effect = Exception("Glob Error")
+        # Test 2: Listing raises exception
+        mock_fs.find.side_effect = Exception("List Error")
         assert load_bronze_csv_files(context, "s3://dummy/path") == []
 
-        # Test 3: fs.open raises exception for one file, succeeds for another
-        mock_fs.glob.side_effect = None
-        mock_fs.glob.return_value = ["file1.csv", "file2.csv"]
+        # Test 3: fs.open raises exception for one file, succeeds for another; non-CSV entries are ignored
+        mock_fs.find.side_effect = None
+        mock_fs.find.return_value = ["file1.csv", "file2.csv", "notes.txt"]
 
         mock_file_1 = MagicMock()
-        mock_file_1.__enter__.return_value.read.return_value = "csv_data_1"
+        mock_file_1.__enter__.return_value.read.return_value = b"csv_data_1"
 
         mock_file_2 = MagicMock()
         mock_file_2.__enter__.side_effect = Exception("Read Error")
 
-        mock_fs.open.side_effect = [mock_file_1, mock_file_2]
+        # Files are read concurrently, so resolve the mock by path rather than by call order
+        mock_fs.open.side_effect = lambda file_path, _mode: {"file1.csv": mock_file_1, "file2.csv": mock_file_2}[
+            file_path
+        ]
 
         result = load_bronze_csv_files(context, "s3://dummy/path")
-        assert result == ["csv_data_1"]
+        assert result == [b"csv_data_1"]
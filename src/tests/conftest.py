@@ -1,8 +1,13 @@
 
+from collections.abc import Iterator
+
 import pytest
 from unittest.mock import MagicMock
 from dagster import AssetExecutionContext
 
+from src.utils.data_loaders import get_filesystem
+
+
 @pytest.fixture
 def mock_context():
     """
@@ -10,3 +15,18 @@ def mock_context():
     """
     context = MagicMock(spec=AssetExecutionContext)
     return context
+
+
+@pytest.fixture(autouse=True)
+def clear_filesystem_cache() -> Iterator[None]:
+    """
+    Drop filesystems cached by earlier tests so each test sees its own patched fsspec.
+
+    Yields
+    ------
+    None
+        Context manager yield.
+    """
+    get_filesystem.cache_clear()
+    yield
+    get_filesystem.cache_clear()
@@ -0,0 +1,89 @@
+"""Shared loader and fixtures for the Lambda handler tests."""
+
+import importlib.util
+import sys
+from pathlib import Path
+from types import ModuleType
+from unittest import mock
+from unittest.mock import MagicMock
+
+import pytest
+
+LAMBDA_CODE_DIR = Path(__file__).parent / "../../../lambda_code"
+
+# Importable module name -> hyphenated file name under lambda_code/
+LAMBDA_MODULES = {
+    "health_data_collection": "health-data-collection.py",
+    "loc_data_collection": "loc-data-collection.py",
+    "screen_time_collection": "screen-time-collection.py",
+    "local_screentime_collection_script": "local-screentime-collection-script.py",
+}
+
+
+def load_lambda_module(module_name: str) -> ModuleType:
+    """
+    Execute a Lambda source file as a fresh module.
+
+    Parameters
+    ----------
+    module_name : str
+        Key of LAMBDA_MODULES to load.
+
+    Returns
+    -------
+    ModuleType
+        The executed module, not registered in sys.modules.
+    """
+    spec = importlib.util.spec_from_file_location(module_name, LAMBDA_CODE_DIR / LAMBDA_MODULES[module_name])
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+# Hyphenated file names cannot be imported, so register each handler under its module name for the test modules
+for _module_name in LAMBDA_MODULES:
+    sys.modules[_module_name] = load_lambda_module(_module_name)
+
+
+@pytest.fixture
+def mock_env(request: pytest.FixtureRequest) -> None:
+    """
+    Mock the module-level configuration of the handler under test.
+
+    Parameters
+    ----------
+    request : pytest.FixtureRequest
+        Used to read MODULE_NAME from the requesting test module.
+
+    Yields
+    ------
+    None
+        Context manager yield.
+    """
+    # Environment variables are read at import, so patch the module-level values
+    module = sys.modules[request.module.MODULE_NAME]
+    with (
+        mock.patch.object(module, "bucket_name", "test-bucket"),
+        mock.patch.object(module, "storage_location", "test-location"),
+        mock.patch.object(module, "expected_token", b"test-token"),
+    ):
+        yield
+
+
+@pytest.fixture
+def mock_s3(request: pytest.FixtureRequest) -> MagicMock:
+    """
+    Mock the S3 client of the handler under test.
+
+    Parameters
+    ----------
+    request : pytest.FixtureRequest
+        Used to read MODULE_NAME from the requesting test module.
+
+    Yields
+    ------
+    MagicMock
+        The mocked S3 client.
+    """
+    with mock.patch.object(sys.modules[request.module.MODULE_NAME], "s3_client") as mock_s3:
+        yield mock_s3
@@ -0,0 +1,100 @@
+"""Unit tests for health data collection lambda."""
+
+import base64
+import json
+import sys
+from unittest.mock import MagicMock
+
+# Loaded from the hyphenated file by conftest.py
+MODULE_NAME = "health_data_collection"
+health_data_collection = sys.modules[MODULE_NAME]
+
+SAMPLE_CSV = "meta1\nmeta2\nmeta3\nmeta4\nDate,Steps,Distance\n2024-01-01,100,1.5\n2024-01-02,200,2.5\n"
+
+
+def test_log_csv_data_counts_rows() -> None:
+    """Test headers are read from the 5th row and remaining rows are counted."""
+    headers, row_count = health_data_collection._log_csv_data(SAMPLE_CSV.encode(), "health")
+    assert headers == ["Date", "Steps", "Distance"]
+    assert row_count == 2
+
+
+def test_log_csv_data_empty() -> None:
+    """Test empty CSV content."""
+    assert health_data_collection._log_csv_data(b"", "health") == ([], 0)
+
+
+def test_log_csv_data_missing_header_row() -> None:
+    """Test CSV content that ends before the header row."""
+    assert health_data_collection._log_csv_data(b"meta1\nmeta2\nmeta3\n", "health") == ([], 0)
+
+
+def test_log_csv_data_header_only() -> None:
+    """Test CSV content with a header row and no data rows."""
+    headers, row_count = health_data_collection._log_csv_data(b"m1\nm2\nm3\nm4\nDate,Steps\n", "workout")
+    assert headers == ["Date", "Steps"]
+    assert row_count == 0
+
+
+def test_lambda_handler_success(mock_env: None, mock_s3: MagicMock) -> None:
+    """Test successful CSV upload."""
+    _ = mock_env
+    event = {
+        "headers": {"Authorization": "Bearer test-token", "data_type": "health"},
+        "body": base64.b64encode(SAMPLE_CSV.encode()).decode(),
+    }
+    context = MagicMock()
+    context.aws_request_id = "test-request-id"
+
+    response = health_data_collection.lambda_handler(event, context)
+
+    assert response["statusCode"] == 200
+    body = json.loads(response["body"])
+    assert body["data_type"] == "health"
+    assert body["columns_processed"] == 3
+    assert body["rows_processed"] == 2
+
+    mock_s3.put_object.assert_called_once()
+    call_kwargs = mock_s3.put_object.call_args.kwargs
+    assert call_kwargs["Bucket"] == "test-bucket"
+    assert call_kwargs["Key"].startswith("test-location/health/")
+    assert call_kwargs["Key"].endswith("-test-request-id.csv")
+    assert call_kwargs["Body"] == SAMPLE_CSV.encode()
+
+
+def test_lambda_handler_invalid_base64(mock_env: None, mock_s3: MagicMock) -> None:
+    """Test body that is not valid base64."""
+    _ = mock_env
+    event = {"headers": {"Authorization": "Bearer test-token", "data_type": "health"}, "body": "not-base64!"}
+
+    response = health_data_collection.lambda_handler(event, MagicMock())
+
+    assert response["statusCode"] == 400
+    assert json.loads(response["body"]) == {"error": "Failed to decode base64 body"}
+    mock_s3.put_object.assert_not_called()
+
+
+def test_lambda_handler_invalid_utf8(mock_env: None, mock_s3: MagicMock) -> None:
+    """Test a body that is valid base64 but not UTF-8 is rejected before anything is stored."""
+    _ = mock_env
+    event = {
+        "headers": {"Authorization": "Bearer test-token", "data_type": "health"},
+        "body": base64.b64encode(SAMPLE_CSV.encode() + b"\xff\xfe").decode(),
+    }
+
+    response = health_data_collection.lambda_handler(event, MagicMock())
+
+    assert response["statusCode"] == 400
+    assert json.loads(response["body"]) == {"error": "Body is not valid UTF-8 CSV"}
+    mock_s3.put_object.assert_not_called()
+
+
+def test_lambda_handler_invalid_token(mock_env: None, mock_s3: MagicMock) -> None:
+    """Test invalid token is rejected before anything is stored."""
+    _ = mock_env
+    event = {"headers": {"Authorization": "Bearer wrong-token", "data_type": "health"}, "body": ""}
+
+    response = health_data_collection.lambda_handler(event, MagicMock())
+
+    assert response["statusCode"] == 403
+    mock_s3.put_object.assert_not_called()
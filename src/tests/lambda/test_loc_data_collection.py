@@ -0,0 +1,69 @@
+"""Unit tests for location data collection lambda."""
+
+import json
+import sys
+from unittest import mock
+from unittest.mock import MagicMock
+
+# Loaded from the hyphenated file by conftest.py
+MODULE_NAME = "loc_data_collection"
+loc_data_collection = sys.modules[MODULE_NAME]
+
+SAMPLE_BODY = (
+    '{"locations": [{"type": "Feature", "geometry": {"type": "Point", "coordinates": [-122.4, 37.8]},'
+    ' "properties": {"timestamp": "2024-01-01T00:00:00Z", "speed": 0}}]}'
+)
+
+
+def test_lambda_handler_stores_raw_body(mock_env: None, mock_s3: MagicMock) -> None:
+    """Test the request body is stored verbatim rather than re-serialized."""
+    _ = mock_env
+    event = {"headers": {"Authorization": "Bearer test-token"}, "body": SAMPLE_BODY}
+    context = MagicMock()
+    context.aws_request_id = "test-request-id"
+
+    response = loc_data_collection.lambda_handler(event, context)
+
+    assert response["statusCode"] == 200
+    body = json.loads(response["body"])
+    assert body == {"result": "ok", "locations_processed": 1, "timestamp": body["timestamp"]}
+    assert response["body"] == json.dumps(body, separators=(",", ":"))
+
+    mock_s3.put_object.assert_called_once()
+    call_kwargs = mock_s3.put_object.call_args.kwargs
+    assert call_kwargs["Bucket"] == "test-bucket"
+    assert call_kwargs["Key"].startswith("test-location/")
+    assert call_kwargs["Key"].endswith("-test-request-id.json")
+    assert call_kwargs["Body"] == SAMPLE_BODY.encode()
+    assert call_kwargs["Metadata"]["locations_count"] == "1"
+
+
+def test_lambda_handler_invalid_json(mock_env: None, mock_s3: MagicMock) -> None:
+    """Test invalid JSON returns 400 without storing anything."""
+    _ = mock_env
+    event = {"headers": {"Authorization": "Bearer test-token"}, "body": "{invalid"}
+
+    response = loc_data_collection.lambda_handler(event, MagicMock())
+
+    assert response["statusCode"] == 400
+    assert json.loads(response["body"])["error"] == "Invalid JSON in request body"
+    mock_s3.put_object.assert_not_called()
+
+
+def test_lambda_handler_invalid_token(mock_env: None, mock_s3: MagicMock) -> None:
+    """Test invalid token is rejected."""
+    _ = mock_env
+    event = {"headers": {"Authorization": "Bearer wrong-token"}, "body": SAMPLE_BODY}
+
+    response = loc_data_collection.lambda_handler(event, MagicMock())
+
+    assert response["statusCode"] == 401
+    mock_s3.put_object.assert_not_called()
+
+
+def test_authenticate_request_unset_token(mock_env: None) -> None:
+    """Test requests are rejected when no token is configured."""
+    _ = mock_env
+    with mock.patch.object(loc_data_collection, "expected_token", b""):
+        response = loc_data_collection._authenticate_request({"Authorization": "Bearer "})
+    assert response["statusCode"] == 401
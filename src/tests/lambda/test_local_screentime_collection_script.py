@@ -0,0 +1,182 @@
+"""Unit tests for the local Mac screen time collection script."""
+
+import json
+import sqlite3
+import sys
+from contextlib import closing
+from datetime import UTC, datetime, timedelta
+from pathlib import Path
+from unittest import mock
+
+import pytest
+
+# Loaded from the hyphenated file by conftest.py
+MODULE_NAME = "local_screentime_collection_script"
+local_screentime = sys.modules[MODULE_NAME]
+
+# knowledgeC.db stores timestamps as seconds since 2001-01-01
+APPLE_EPOCH_OFFSET = 978307200
+
+
+def _apple_timestamp(value: str) -> float:
+    """
+    Convert an ISO timestamp to the Core Data epoch used by knowledgeC.db.
+
+    Parameters
+    ----------
+    value : str
+        Naive ISO timestamp, interpreted in local time like the script's query.
+
+    Returns
+    -------
+    float
+        Seconds since 2001-01-01.
+    """
+    return datetime.fromisoformat(value).timestamp() - APPLE_EPOCH_OFFSET
+
+
+@pytest.fixture
+def knowledge_db(tmp_path: Path) -> Path:
+    """
+    Build a minimal knowledgeC.db with app usage on two days.
+
+    Parameters
+    ----------
+    tmp_path : Path
+        Pytest temporary directory.
+
+    Yields
+    ------
+    Path
+        Path to the database, patched in as the script's DB_PATH.
+    """
+    db_path = tmp_path / "knowledgeC.db"
+    rows = [
+        # stream, bundle_id, start, end
+        ("/app/usage", "com.apple.Safari", "2026-02-16T09:00:00", "2026-02-16T09:10:00"),
+        ("/app/usage", "com.apple.Safari", "2026-02-16T13:00:00", "2026-02-16T13:05:00"),
+        ("/app/usage", "com.apple.Mail", "2026-02-16T10:00:00", "2026-02-16T10:01:00"),
+        ("/app/usage", "com.apple.Notes", "2026-02-18T10:00:00", "2026-02-18T10:02:00"),
+        ("/display/isBacklit", "com.apple.Safari", "2026-02-16T11:00:00", "2026-02-16T12:00:00"),
+    ]
+    with closing(sqlite3.connect(db_path)) as con:
+        con.executescript(
+            """
+            CREATE TABLE ZOBJECT (
+                Z_PK INTEGER PRIMARY KEY, ZSOURCE INTEGER, ZSTREAMNAME TEXT,
+                ZVALUESTRING TEXT, ZSTARTDATE REAL, ZENDDATE REAL
+            );
+            CREATE TABLE ZSOURCE (Z_PK INTEGER PRIMARY KEY, ZDEVICEID TEXT);
+            CREATE TABLE ZSYNCPEER (Z_PK INTEGER PRIMARY KEY, ZDEVICEID TEXT, ZMODEL TEXT);
+            """
+        )
+        con.executemany(
+            "INSERT INTO ZOBJECT (ZSTREAMNAME, ZVALUESTRING, ZSTARTDATE, ZENDDATE) VALUES (?, ?, ?, ?)",
+            [
+                (stream, bundle_id, _apple_timestamp(start), _apple_timestamp(end))
+                for stream, bundle_id, start, end in rows
+            ],
+        )
+        con.commit()
+
+    with mock.patch.object(local_screentime, "DB_PATH", db_path):
+        yield db_path
+
+
+@pytest.fixture
+def state_file(tmp_path: Path) -> Path:
+    """
+    Point the script's state manifest at a temporary file.
+
+    Parameters
+    ----------
+    tmp_path : Path
+        Pytest temporary directory.
+
+    Yields
+    ------
+    Path
+        Path to the state file, which does not exist yet.
+    """
+    path = tmp_path / ".screen_time_state.json"
+    with mock.patch.object(local_screentime, "STATE_FILE", path):
+        yield path
+
+
+def test_query_database_for_dates_buckets_by_date(knowledge_db: Path) -> None:
+    """Test one scan returns usage per requested date, with empty lists for days without usage."""
+    _ = knowledge_db
+
+    usage_by_date = local_screentime.query_database_for_dates(["2026-02-16", "2026-02-17"])
+
+    # 2026-02-18 has usage but was not requested, and non app-usage streams are ignored
+    assert set(usage_by_date) == {"2026-02-16", "2026-02-17"}
+    assert usage_by_date["2026-02-17"] == []
+    totals = {record["bundle_id"]: record["total_usage_seconds"] for record in usage_by_date["2026-02-16"]}
+    assert totals == {"com.apple.Safari": 900, "com.apple.Mail": 60}
+    assert {record["device_model"] for record in usage_by_date["2026-02-16"]} == {"Mac"}
+
+
+def test_query_database_for_dates_missing_db(tmp_path: Path) -> None:
+    """Test a database that cannot be opened read-only returns None instead of raising."""
+    with mock.patch.object(local_screentime, "DB_PATH", tmp_path / "missing.db"):
+        assert local_screentime.query_database_for_dates(["2026-02-16"]) is None
+
+
+def test_save_processed_dates_is_atomic(state_file: Path) -> None:
+    """Test the manifest is swapped in whole, and a failed write leaves the previous one intact."""
+    local_screentime.save_processed_dates({"2026-02-17", "2026-02-16"})
+
+    assert json.loads(state_file.read_text(encoding="utf-8")) == {"processed_dates": ["2026-02-16", "2026-02-17"]}
+    assert not state_file.with_suffix(".tmp").exists()
+
+    with (
+        mock.patch.object(local_screentime.json, "dump", side_effect=OSError("disk full")),
+        pytest.raises(OSError, match="disk full"),
+    ):
+        local_screentime.save_processed_dates({"2026-02-18"})
+
+    assert local_screentime.get_processed_dates() == {"2026-02-16", "2026-02-17"}
+
+
+def test_main_leaves_failed_dates_unprocessed(state_file: Path) -> None:
+    """Test only dates whose upload succeeded, or that had no usage, are recorded as processed."""
+    usage_by_date = {
+        "2026-02-14": [{"bundle_id": "com.apple.Safari"}],
+        "2026-02-15": [{"bundle_id": "com.apple.Mail"}],
+        "2026-02-16": [],
+    }
+
+    def _send(_usage_data: list[dict], target_date_str: str) -> bool:
+        return target_date_str != "2026-02-15"
+
+    with (
+        mock.patch.object(local_screentime, "query_database_for_dates", return_value=usage_by_date),
+        mock.patch.object(local_screentime, "send_to_lambda", side_effect=_send) as mock_send,
+    ):
+        local_screentime.main()
+
+    assert mock_send.call_count == 2
+    assert local_screentime.get_processed_dates() == {"2026-02-14", "2026-02-16"}
+    assert state_file.exists()
+
+
+def test_main_skips_processed_dates(state_file: Path) -> None:
+    """Test dates already in the manifest are not queried again."""
+    today = datetime.now(UTC).date()
+    local_screentime.save_processed_dates({(today - timedelta(days=i)).isoformat() for i in range(1, 31)})
+
+    with mock.patch.object(local_screentime, "query_database_for_dates") as mock_query:
+        local_screentime.main()
+
+    mock_query.assert_not_called()
+    assert state_file.exists()
+
+
+def test_session_does_not_retry_answered_posts() -> None:
+    """Test only connection failures are retried, so an upload the Lambda already received is never sent twice."""
+    retry = local_screentime.SESSION.get_adapter("https://example.com").max_retries
+
+    assert retry.connect == 3
+    assert retry.read == 0
+    assert not retry.is_retry("POST", 503)
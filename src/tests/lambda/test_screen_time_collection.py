@@ -1,68 +1,22 @@
 """Unit tests for screen time lambda."""
 
-import importlib.util
+import base64
+import gzip
 import json
-import os
 import sys
-from pathlib import Path
-from unittest import mock
 from unittest.mock import MagicMock
 
 import pytest
 
-# dynamic import for hyphenated file
-MODULE_PATH = Path(__file__).parent / "../../../lambda_code/screen-time-collection.py"
+# Loaded from the hyphenated file by conftest.py
 MODULE_NAME = "screen_time_collection"
-
-spec = importlib.util.spec_from_file_location(MODULE_NAME, MODULE_PATH)
-screen_time_collection = importlib.util.module_from_spec(spec)
-sys.modules[MODULE_NAME] = screen_time_collection
-spec.loader.exec_module(screen_time_collection)
-
-
-@pytest.fixture
-def mock_env() -> None:
-    """
-    Mock environment variables.
-
-    Yields
-    ------
-    None
-        Context manager yield.
-    """
-    # Patch the module-level variable bucket_name
-    with (
-        mock.patch.object(screen_time_collection, "bucket_name", "test-bucket"),
-        mock.patch.dict(
-            os.environ,
-            {
-                "S3_BUCKET": "test-bucket",
-                "AUTH_TOKEN": "test-token",
-                "STORAGE_LOCATION": "test-location",
-            },
-        ),
-    ):
-        yield
-
-
-@pytest.fixture
-def mock_s3() -> MagicMock:
-    """
-    Mock S3 client.
-
-    Yields
-    ------
-    MagicMock
-        The mocked S3 client.
-    """
-    with mock.patch("screen_time_collection.s3_client") as mock_s3:
-        yield mock_s3
+screen_time_collection = sys.modules[MODULE_NAME]
 
 
 def test_authenticate_request_success(mock_env: None) -> None:
     """Test successful authentication."""
     _ = mock_env  # Unused arg
-    headers = {"Authorization": "Bearer test-token"}
+    headers = {"authorization": "Bearer test-token"}
     response = screen_time_collection._authenticate_request(headers)
     assert response is None
 
@@ -79,7 +33,7 @@ def test_authenticate_request_missing_header(mock_env: None) -> None:
 def test_authenticate_request_invalid_token(mock_env: None) -> None:
     """Test invalid token."""
     _ = mock_env
-    headers = {"Authorization": "Bearer wrong-token"}
+    headers = {"authorization": "Bearer wrong-token"}
     response = screen_time_collection._authenticate_request(headers)
     assert response["statusCode"] == 401
     assert json.loads(response["body"]) == {"error": "Invalid token"}
@@ -175,6 +129,14 @@ def test_lambda_handler_auth_fail(mock_env: None, mock_s3: MagicMock) -> None:
     mock_s3.put_object.assert_not_called()
 
 
+def test_lambda_handler_missing_headers(mock_env: None, mock_s3: MagicMock) -> None:
+    """Test a request API Gateway forwards with headers set to None is rejected as unauthenticated."""
+    _ = mock_env
+    response = screen_time_collection.lambda_handler({"headers": None, "body": "{}"}, None)
+    assert response["statusCode"] == 401
+    mock_s3.put_object.assert_not_called()
+
+
 def test_lambda_handler_exception(mock_env: None, mock_s3: MagicMock) -> None:
     """Test general exception handling."""
     _ = (mock_env, mock_s3)
@@ -185,3 +147,94 @@ def test_lambda_handler_exception(mock_env: None, mock_s3: MagicMock) -> None:
     response = screen_time_collection.lambda_handler(event, None)
     assert response["statusCode"] == 500
     assert "error" in json.loads(response["body"])
+
+
+def test_lambda_handler_gzip_body(mock_env: None, mock_s3: MagicMock) -> None:
+    """Test gzip-compressed, base64-encoded bodies from the Mac scraper are decoded."""
+    _ = mock_env
+    payload = {
+        "device_type": "mac",
+        "usage_date": "2023-01-03",
+        "device_id": "test-device",
+        "data": [{"total_usage_seconds": 30}, {"total_usage_seconds": 45}],
+    }
+    event = {
+        "headers": {"Authorization": "Bearer test-token", "Content-Encoding": "gzip"},
+        "body": base64.b64encode(gzip.compress(json.dumps(payload).encode())).decode(),
+        "isBase64Encoded": True,
+    }
+    context = MagicMock()
+    context.aws_request_id = "test-req-3"
+
+    response = screen_time_collection.lambda_handler(event, context)
+
+    assert response["statusCode"] == 200
+    assert json.loads(response["body"])["total_seconds"] == 75
+    call_args = mock_s3.put_object.call_args[1]
+    assert "test-location/mac/2023_01_03/mac-test-req-3.json" in call_args["Key"]
+
+
+MAC_PAYLOAD = json.dumps({"device_type": "mac", "usage_date": "2023-01-04", "data": [{"total_usage_seconds": 20}]})
+
+
+@pytest.mark.parametrize(
+    "body",
+    [
+        # Decompressed upstream, so the JSON arrives as plain text
+        MAC_PAYLOAD,
+        # Base64 encoded, but without the isBase64Encoded flag
+        base64.b64encode(gzip.compress(MAC_PAYLOAD.encode())).decode(),
+    ],
+)
+def test_lambda_handler_gzip_text_body(mock_env: None, mock_s3: MagicMock, body: str) -> None:
+    """Test gzip requests whose body arrives as text are still decoded."""
+    _ = mock_env
+    event = {"headers": {"Authorization": "Bearer test-token", "Content-Encoding": "gzip"}, "body": body}
+
+    response = screen_time_collection.lambda_handler(event, MagicMock())
+
+    assert response["statusCode"] == 200
+    assert json.loads(response["body"])["total_seconds"] == 20
+    mock_s3.put_object.assert_called_once()
+
+
+def test_lambda_handler_gzip_mangled_body(mock_env: None, mock_s3: MagicMock) -> None:
+    """Test compressed bytes decoded as text explain the missing binary media type."""
+    _ = mock_env
+    event = {
+        "headers": {"Authorization": "Bearer test-token", "Content-Encoding": "gzip"},
+        "body": gzip.compress(b'{"device_type": "mac"}').decode("latin-1"),
+    }
+
+    response = screen_time_collection.lambda_handler(event, MagicMock())
+
+    assert response["statusCode"] == 500
+    assert "binary media types" in json.loads(response["body"])["error"]
+    mock_s3.put_object.assert_not_called()
+
+
+def test_lambda_handler_invalid_usage_date(mock_env: None, mock_s3: MagicMock) -> None:
+    """Test a malformed usage_date is rejected before anything is stored."""
+    _ = mock_env
+    event = {
+        "headers": {"Authorization": "Bearer test-token"},
+        "body": json.dumps({"device_type": "iphone", "usage_date": "01/02/2023", "usage_seconds": 5}),
+    }
+    response = screen_time_collection.lambda_handler(event, MagicMock())
+    assert response["statusCode"] == 500
+    mock_s3.put_object.assert_not_called()
+
+
+@pytest.mark.parametrize(
+    "event",
+    [
+        {"source": "aws.events", "detail-type": "Scheduled Event"},
+        {"headers": {"X-Warmer": "true"}},
+    ],
+)
+def test_lambda_handler_warmer(mock_env: None, mock_s3: MagicMock, event: dict) -> None:
+    """Test warmer invocations return 204 without authenticating or storing anything."""
+    _ = mock_env
+    response = screen_time_collection.lambda_handler(event, None)
+    assert response == {"statusCode": 204}
+    mock_s3.put_object.assert_not_called()
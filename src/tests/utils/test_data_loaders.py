@@ -0,0 +1,65 @@
+"""Unit tests for the data loader utilities."""
+
+from unittest.mock import MagicMock, patch
+
+from src.utils.data_loaders import extract_csv_from_multipart, get_filesystem
+
+
+@patch("src.utils.data_loaders.get_aws_storage_options")
+@patch("src.utils.data_loaders.fsspec.filesystem")
+def test_get_filesystem_is_cached(mock_filesystem: MagicMock, mock_aws: MagicMock) -> None:
+    """Test the filesystem and its storage options are only built once per scheme."""
+    mock_aws.return_value = {}
+
+    assert get_filesystem("s3") is get_filesystem("s3")
+    mock_filesystem.assert_called_once_with("s3")
+    mock_aws.assert_called_once()
+
+
+def test_extract_csv_from_multipart() -> None:
+    """Test extracting CSV from iOS multipart payload."""
+    raw_payload = (
+        b"--Boundary-123\n"
+        b"Content-Disposition: form-data\n"
+        b"Content-Type: text/csv\n"
+        b"\n"
+        b"Date/Time,Active Energy (kcal),Apple Exercise Time (min)\n"
+        b"2026-02-16 12:00:00,10.5,\n"
+        b"--Boundary-123--\n"
+    )
+    result = extract_csv_from_multipart(raw_payload)
+    assert result == b"Date/Time,Active Energy (kcal),Apple Exercise Time (min)\n2026-02-16 12:00:00,10.5,"
+
+
+def test_extract_csv_from_multipart_workout_header() -> None:
+    """Test a workout export is cut at its ``Type,`` header row."""
+    raw_payload = (
+        b"--Boundary-123\n"
+        b"Content-Disposition: form-data\n"
+        b"Content-Type: text/csv\n"
+        b"\n"
+        b"Type,Start,End,Duration\n"
+        b"Running,2026-02-16 12:00,2026-02-16 13:00,60:00\n"
+        b"--Boundary-123--\n"
+    )
+    result = extract_csv_from_multipart(raw_payload)
+    assert result == b"Type,Start,End,Duration\nRunning,2026-02-16 12:00,2026-02-16 13:00,60:00"
+
+
+def test_extract_csv_from_multipart_crlf() -> None:
+    """Test a CRLF multipart payload is trimmed to the CSV without its trailing boundary."""
+    raw_payload = (
+        b"--Boundary-123\r\n"
+        b"Content-Type: text/csv\r\n"
+        b"\r\n"
+        b"Type,Start\r\n"
+        b"Running,2026-02-16 12:00\r\n"
+        b"--Boundary-123--\r\n"
+    )
+    assert extract_csv_from_multipart(raw_payload) == b"Type,Start\r\nRunning,2026-02-16 12:00"
+
+
+def test_extract_csv_from_multipart_plain_csv() -> None:
+    """Test a payload without multipart wrapping is returned as-is."""
+    raw_payload = b"Date/Time,Active Energy (kcal)\r\n2026-02-16 12:00:00,10.5\r\n"
+    assert extract_csv_from_multipart(raw_payload) == b"Date/Time,Active Energy (kcal)\r\n2026-02-16 12:00:00,10.5"
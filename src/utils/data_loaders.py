@@ -1,5 +1,6 @@
 """Data Loader supporting multiple file formats (csv, parquet, DeltaTable) and outputs DataFrames/ pyarrow datasets."""
 
+import functools
 import os
 from abc import ABC, abstractmethod
 from enum import Enum
@@ -17,6 +18,9 @@ from loguru import logger
 from src.utils.aws import AWSCredentialFormat, get_aws_storage_options
 from src.utils.global_helpers import filter_kwargs
 
+# Bronze reads are network-bound S3 GETs, so the assets issue them concurrently with this many workers
+BRONZE_READ_MAX_WORKERS = 16
+
 
 class FileFormat(Enum):
     """Enum representing supported file formats."""
@@ -311,3 +315,75 @@ def get_storage_path(dataset_name: str, table_name: str, config_path: str = os.g
         raise KeyError(f"Cannot find entry for environment {env} within table {dataset_name}.{table_name}")
 
     return config["paths"][dataset_name][table_name][env]
+
+
+@functools.lru_cache(maxsize=8)
+def get_filesystem(scheme: str) -> fsspec.AbstractFileSystem:
+    """
+    Return the fsspec filesystem for a URL scheme, built once per process.
+
+    Credentials come from environment variables that do not change while the code server runs,
+    so later partitions reuse the filesystem and its connection pool instead of resolving the
+    storage options again.
+
+    Parameters
+    ----------
+    scheme : str
+        The URL scheme of the path to read, e.g. ``s3``. Empty for local paths.
+
+    Returns
+    -------
+    fsspec.AbstractFileSystem
+        The filesystem to read the files with.
+    """
+    if scheme in {"", "file"}:
+        return fsspec.filesystem("file")
+    storage_options = get_aws_storage_options(return_credential_type=AWSCredentialFormat.UTILIZE_ENV_VARS)
+    return fsspec.filesystem(scheme, **storage_options)
+
+
+def extract_csv_from_multipart(raw_bytes: bytes) -> bytes:
+    """
+    Extract the clean CSV payload from iOS multipart form-data structure.
+
+    Parameters
+    ----------
+    raw_bytes : bytes
+        The raw payload containing multipart boundary headers and footers.
+
+    Returns
+    -------
+    bytes
+        The cleaned CSV content.
+    """
+    # Search the payload in place rather than splitting it into lines and joining them back
+    header_starts = [_find_line(raw_bytes, prefix) for prefix in (b"Date,", b"Date/Time,", b"Type,")]
+    start_idx = min((idx for idx in header_starts if idx != -1), default=0)
+
+    end_idx = raw_bytes.rfind(b"\n--Boundary")
+    if end_idx == -1:
+        end_idx = 0 if raw_bytes.startswith(b"--Boundary") else len(raw_bytes)
+
+    return raw_bytes[start_idx:end_idx].strip()
+
+
+def _find_line(data: bytes, prefix: bytes) -> int:
+    """
+    Find the first line of ``data`` starting with ``prefix``.
+
+    Parameters
+    ----------
+    data : bytes
+        The content to search.
+    prefix : bytes
+        The prefix the line has to start with.
+
+    Returns
+    -------
+    int
+        Offset of the start of the matching line, or -1 if no line matches.
+    """
+    if data.startswith(prefix):
+        return 0
+    idx = data.find(b"\n" + prefix)
+    return -1 if idx == -1 else idx + 1
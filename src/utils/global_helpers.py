@@ -1,8 +1,10 @@
 """Helper functions that are hard to be categorized into certain utils function."""
 
+import hashlib
 import inspect
 from typing import Any
 
+import polars as pl
 from loguru import logger
 
 
@@ -50,3 +52,35 @@ def filter_kwargs(func: callable, kwargs: dict[str, Any]) -> dict[str, Any]:
                 f"Keyword argument '{k} is not valid for function '{func.__name__}'. This argument will be ignored"
             )
     return filtered
+
+
+def md5_hex_series(values: pl.Series, name: str) -> pl.Series:
+    """
+    Hash every string in a Series to its md5 hex digest.
+
+    Polars' native ``hash`` is not guaranteed to be stable across versions, so ids that act as
+    merge keys against previously written data are md5 digests instead. The whole column is
+    hashed in one comprehension rather than a per-row ``map_elements`` UDF.
+
+    Parameters
+    ----------
+    values : pl.Series
+        String Series to hash. Nulls stay null.
+    name : str
+        Name of the returned Series.
+
+    Returns
+    -------
+    pl.Series
+        Utf8 Series of md5 hex digests.
+
+    Examples
+    --------
+    >>> md5_hex_series(pl.Series(["2026-02-16 12:00:00"]), "health_activity_id").to_list()
+    ['822c8e97299d33458045d402fb929bc3']
+    """
+    return pl.Series(
+        name,
+        [None if value is None else hashlib.md5(value.encode()).hexdigest() for value in values.to_list()],  # noqa: S324
+        dtype=pl.Utf8,
+    )